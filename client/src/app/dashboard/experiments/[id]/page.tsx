@@ -237,6 +237,7 @@ function RunningStatePanel({
     algorithm === 'ACO' ? 'Ant Colony Optimization' :
     algorithm === 'GA' ? 'Genetic Algorithm' :
     algorithm === 'WOA' ? 'Whale Optimization Algorithm' :
+    algorithm === 'NSGA2' ? 'NSGA-II (Multi-Objective)' :
     algorithm === 'ROUND_ROBIN' ? 'Round Robin' :
     algorithm === 'MIN_MIN' ? 'Min-Min Heuristic' :
     'Max-Min Heuristic';
@@ -13,6 +13,7 @@ export const ALGORITHMS = [
   { id: 'PSO', name: 'Particle Swarm Optimization', color: '#FF2A6D' },
   { id: 'ACO', name: 'Ant Colony Optimization', color: '#FFC857' },
   { id: 'WOA', name: 'Whale Optimization Algorithm', color: '#6C3CE1' },
+  { id: 'NSGA2', name: 'NSGA-II (Multi-Objective)', color: '#4ADE80' },
   { id: 'Baseline', name: 'Round-Robin / First-Fit', color: '#A0A0B0' },
 ] as const;
 
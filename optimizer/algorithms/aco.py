@@ -5,83 +5,82 @@ Pheromone-based discrete optimization for task scheduling.
 """
 
 import numpy as np
-from .base import BaseOptimizer
+from .base import IterativeOptimizer
+from .checkpoint import TASK_VM
+from .constructive import lpt
 
 
-class ACOOptimizer(BaseOptimizer):
+class ACOOptimizer(IterativeOptimizer):
 
-    def run(self) -> dict:
-        max_iter = self.max_iterations
-        n_ants = self.population_size
-        n_tasks = self.task_count
-        n_vms = self.vm_count
+    alpha = 1.0   # Pheromone importance
+    beta = 2.0    # Heuristic importance
+    rho = 0.1     # Evaporation rate
+
+    checkpoint_state = {"pheromone": TASK_VM}
+    snapshot_state = IterativeOptimizer.snapshot_state + ("pheromone",)
 
-        alpha = 1.0   # Pheromone importance
-        beta = 2.0    # Heuristic importance
-        rho = 0.1     # Evaporation rate
+    def _init_search(self):
+        n_tasks = self.task_count
 
         # Pheromone matrix: task × VM
-        pheromone = np.ones((n_tasks, n_vms))
+        self.pheromone = np.ones((n_tasks, self.vm_count))
 
         # Heuristic: inverse of execution time (higher mips → better)
-        heuristic = np.zeros((n_tasks, n_vms))
-        for t in range(n_tasks):
-            for v in range(n_vms):
-                exec_time = self.tasks[t]["length"] / self.vms[v]["mips"]
-                heuristic[t][v] = 1.0 / exec_time if exec_time > 0 else 1.0
-
-        g_best = None
-        g_best_fit = float("inf")
-        convergence = []
-
-        for iteration in range(max_iter):
-            all_schedules = []
-
-            for _ in range(n_ants):
-                schedule = []
-                for t in range(n_tasks):
-                    probs = (
-                        pheromone[t] ** alpha * heuristic[t] ** beta
-                    )
-                    probs = np.maximum(probs, 1e-10)  # Ensure non-negative
-                    probs /= probs.sum()
-                    vm_idx = int(self.rng.choice(n_vms, p=probs))
-                    schedule.append(vm_idx)
-
-                all_schedules.append(schedule)
-
-            # Evaluate & update best
-            for schedule in all_schedules:
-                fit = self.fitness(schedule)
-                if fit < g_best_fit:
-                    g_best = list(schedule)
-                    g_best_fit = fit
-
-            # Evaporate
-            pheromone *= (1 - rho)
-
-            # Deposit pheromone on best solution
-            if g_best is not None:
-                deposit = 1.0 / (g_best_fit + 1e-10)
-                for t in range(n_tasks):
-                    pheromone[t][g_best[t]] += deposit
-
-            convergence.append({
-                "iteration": iteration,
-                "bestFitness": round(g_best_fit, 6),
-                "makespan": round(self.compute_makespan(g_best), 4),
-                "energy": round(self.compute_energy(g_best), 4),
-            })
-
-            # Stream progress to Node.js via stderr
-            self.report_progress(
-                iteration=iteration,
-                max_iterations=max_iter,
-                best_fitness=g_best_fit,
-                makespan=self.compute_makespan(g_best),
-                energy=self.compute_energy(g_best),
-                reliability=self.compute_reliability(g_best),
-                utilization=self.compute_resource_utilization(g_best),
-            )
-
-        return self.build_result(g_best, convergence)
+        etc = self.etc[:n_tasks, :self.vm_count]
+        with np.errstate(divide="ignore"):
+            heuristic = np.where(etc > 0, 1.0 / etc, 1.0)
+        self.heuristic_beta = heuristic ** self.beta
+
+        # Evaluated LPT incumbent, reported if no colony completes
+        self.best_schedule = lpt(etc)
+        self.best_fitness = self.fitness(self.best_schedule)
+        self._task_rows = np.arange(n_tasks)
+
+    def _resync_search(self):
+        # Ants are sampled fresh each iteration; only the pheromone carries over
+        pass
+
+    def _iterate(self, iteration):
+        all_schedules = self._construct(
+            self.pheromone ** self.alpha * self.heuristic_beta,
+            self.population_size,
+        )
+
+        # Evaluate & update best
+        fits, _ = self.fitness_batch(all_schedules)
+        best_ant = int(np.argmin(fits))
+        if fits[best_ant] < self.best_fitness:
+            self.best_schedule[:] = all_schedules[best_ant]
+            self.best_fitness = float(fits[best_ant])
+
+        # Evaporate
+        self.pheromone *= (1 - self.rho)
+
+        # Deposit pheromone on best solution
+        deposit = 1.0 / (self.best_fitness + 1e-10)
+        self.pheromone[self._task_rows, self.best_schedule] += deposit
+
+    def _construct(self, weights, n_ants):
+        """
+        Sample every ant's schedule at once from per-task VM weights.
+
+        ``weights`` has shape (n_tasks, n_vms).  Rows are normalized into
+        one CDF per task; the rows are laid end to end with task ``t``
+        offset by ``t`` so a single ``searchsorted`` over a
+        (n_ants, n_tasks) matrix of uniforms performs inverse-CDF
+        sampling for every ant and task.
+        """
+        n_tasks, n_vms = weights.shape
+
+        probs = np.maximum(weights, 1e-10)  # Ensure non-negative
+        cdf = np.cumsum(probs, axis=1)
+        cdf /= cdf[:, -1:]
+        cdf[:, -1] = 1.0
+        cdf += np.arange(n_tasks)[:, None]
+
+        offsets = np.arange(n_tasks)
+        draws = self.rng.random((n_ants, n_tasks)) + offsets
+        flat = np.searchsorted(cdf.ravel(), draws, side="right")
+        choice = flat - offsets * n_vms
+        np.clip(choice, 0, n_vms - 1, out=choice)
+        return choice.astype(np.int32)
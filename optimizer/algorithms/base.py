@@ -5,9 +5,34 @@ All scheduling algorithms must extend this and implement `run()`.
 
 import sys
 import json
+import time
+import hashlib
+from collections import OrderedDict
 import numpy as np
 from abc import ABC, abstractmethod
 
+from .checkpoint import (
+    CHECKPOINT_MODES, SCHEDULES, TASK_VM, Remap, make_checkpoint,
+)
+from .checkpoint_store import CheckpointStore
+from .constructive import (
+    lpt, max_min, place_remaining, proportional_round_robin,
+)
+from .incremental import IncrementalEvaluator
+from .island import run_islands
+from . import kernels
+from .local_search import DEFAULT_MAX_MOVES, LOCAL_SEARCH_MODES, LocalSearch
+from .packed import OUTPUT_FORMATS, pack_convergence, pack_schedule
+from . import snapshot
+from .pareto import DEFAULT_ARCHIVE_SIZE, ParetoArchive
+from .workload import Workload
+from .result_cache import ResultCache
+from .workload_store import WorkloadStore
+
+
+# Constructive warm starts available to ``seedHeuristics``
+SEED_HEURISTICS = ("min_min", "max_min", "lpt", "mips_round_robin")
+
 
 class BaseOptimizer(ABC):
     """
@@ -19,13 +44,28 @@ class BaseOptimizer(ABC):
         Experiment configuration received from the Node.js backend.
         Expected keys:
             - algorithm        : str
-            - workloadConfig   : { taskCount, tasks[] }
-            - vmConfig         : { vmCount, vms[] }
+            - workloadConfig   : { taskCount, tasks[] | tasksFile | workloadId }
+            - vmConfig         : { vmCount, vms[] | vmsFile }
             - hyperparameters  : { populationSize, maxIterations, weights, ... }
             - seed             : int
+            - checkpoint       : bool or "store", add a ``checkpoint`` to
+                                 the result, inline or as a reference to
+                                 the ``CheckpointStore``
+            - resumeFrom       : checkpoint to resume from (see
+                                 ``algorithms.checkpoint``)
+    workload : Workload, optional
+        Prebuilt columnar task / VM arrays (e.g. attached from shared
+        memory or streamed by ``algorithms.ingest``).  When given,
+        ``workloadConfig.tasks`` / ``tasksFile`` / ``workloadId`` and
+        ``vmConfig.vms`` / ``vmsFile`` are not read.  A ``workloadId``
+        (tasks and VMs together) is memory-mapped from the
+        ``WorkloadStore``.
     """
 
-    def __init__(self, config: dict):
+    # Attributes saved in checkpoints, by ``algorithms.checkpoint`` kind
+    checkpoint_state = {}
+
+    def __init__(self, config: dict, workload: Workload = None):
         self.config = config
         self.seed = config.get("seed", 42)
         self.rng = np.random.default_rng(self.seed)
@@ -39,19 +79,121 @@ class BaseOptimizer(ABC):
         self.vm_count = vm.get("vmCount", 3)
         self.vms = vm.get("vms", [])
 
+        self.output_format = config.get("outputFormat", "json")
+        if self.output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unknown outputFormat: {self.output_format} "
+                f"(expected one of {OUTPUT_FORMATS})"
+            )
+
+        self.checkpoint_mode = config.get("checkpoint", False)
+        if self.checkpoint_mode not in CHECKPOINT_MODES:
+            raise ValueError(
+                f"Unknown checkpoint: {self.checkpoint_mode} "
+                f"(expected one of {CHECKPOINT_MODES})"
+            )
+        self.resume_from = config.get("resumeFrom")
+
+        # Periodic run snapshots (see algorithms.snapshot)
+        self.snapshot_every = int(hp.get("snapshotEvery") or 0)
+        self.snapshot_interval_ms = float(hp.get("snapshotIntervalMs") or 0)
+        self.snapshot_path = config.get("snapshotPath")
+
         self.population_size = hp.get("populationSize", 30)
         self.max_iterations = hp.get("maxIterations", 100)
 
+        # Heuristic warm starts for the initial population (off by default)
+        self.seed_fraction = float(hp.get("seedFraction", 0.0))
+        self.seed_heuristics = list(hp.get("seedHeuristics", SEED_HEURISTICS))
+        self.seed_perturbation = float(hp.get("seedPerturbation", 0.1))
+        unknown = set(self.seed_heuristics) - set(SEED_HEURISTICS)
+        if unknown or not self.seed_heuristics:
+            raise ValueError(
+                f"Unknown seedHeuristics: {sorted(unknown)} "
+                f"(expected a non-empty subset of {SEED_HEURISTICS})"
+            )
+
+        # Memetic hill climbing on the reported / incumbent schedule
+        self.local_search_mode = hp.get("localSearch", "none")
+        if self.local_search_mode not in LOCAL_SEARCH_MODES:
+            raise ValueError(
+                f"Unknown localSearch: {self.local_search_mode} "
+                f"(expected one of {LOCAL_SEARCH_MODES})"
+            )
+        self.local_search = None
+        if self.local_search_mode != "none":
+            self.local_search = LocalSearch(
+                self, hp.get("localSearchMoves", DEFAULT_MAX_MOVES)
+            )
+
+        # Opt-in per-individual scalar loops (EDO / PSO / WOA) that replay
+        # runs of the original implementation bit-for-bit, and GA's
+        # per-pair breeding loop.
+        self.legacy_kernels = bool(hp.get("legacyKernels", False))
+        # NumPy or compiled inner loops, resolved on first use (see
+        # algorithms.kernels)
+        self.kernel_backend = kernels.check(hp.get("kernelBackend", "auto"))
+        self._kernels = None
+
+        # Termination criteria beyond maxIterations (all optional)
+        self.stagnation_window = int(hp.get("stagnationWindow") or 0)
+        self.stagnation_tolerance = float(hp.get("stagnationTolerance", 1e-6))
+        self.time_budget_ms = hp.get("timeBudgetMs")
+        self.max_evaluations = hp.get("maxEvaluations")
+        self.target_fitness = hp.get("targetFitness")
+
+        # Progress throttling: at most one event per progressIntervalMs,
+        # and only on every progressStride-th iteration
+        self.progress_interval_ms = float(hp.get("progressIntervalMs", 100))
+        self.progress_stride = max(1, int(hp.get("progressStride", 1)))
+        self._last_progress = float("-inf")
+        self._pending_progress = None
+
+        # Optional LRU memo of objectives for recently scored schedules
+        self.fitness_cache_size = int(hp.get("fitnessCacheSize") or 0)
+        self._fitness_cache = OrderedDict() if self.fitness_cache_size else None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # External archive of every non-dominated schedule scored
+        self.pareto = ParetoArchive(
+            hp.get("paretoArchiveSize", DEFAULT_ARCHIVE_SIZE)
+        )
+
+        self.evaluations = 0
+        self.stop_reason = None
+        self.iterations_completed = None
+        self._stop_requested = False
+        self.start_clock()
+
         weights = hp.get("weights", {})
         self.w_makespan = weights.get("makespan", 0.4)
         self.w_energy = weights.get("energy", 0.3)
         self.w_reliability = weights.get("reliability", 0.3)
 
-        # Generate default tasks / VMs if not provided
-        if not self.tasks:
-            self.tasks = self._generate_default_tasks()
-        if not self.vms:
-            self.vms = self._generate_default_vms()
+        if workload is None and wl.get("workloadId"):
+            workload = WorkloadStore().open(wl["workloadId"])
+
+        if workload is None:
+            tasks_file = wl.get("tasksFile")
+            vms_file = vm.get("vmsFile")
+            # Generate default tasks / VMs if not provided
+            if not self.tasks and not tasks_file:
+                self.tasks = self._generate_default_tasks()
+            if not self.vms and not vms_file:
+                self.vms = self._generate_default_vms()
+            workload = Workload.from_sources(
+                self.tasks, self.vms, tasks_file, vms_file
+            )
+
+        # Counts default to the workload size (e.g. tables read from files)
+        if "taskCount" not in wl:
+            self.task_count = workload.n_tasks
+        if "vmCount" not in vm:
+            self.vm_count = workload.n_vms
+
+        self.workload = workload
+        self._build_cost_model()
 
     # ── Progress reporting ─────────────────────────────────
 
@@ -60,7 +202,31 @@ class BaseOptimizer(ABC):
         """
         Write a JSON progress line to stderr so the Node.js process
         can stream it to the frontend via SSE.
+
+        Calls are rate limited by ``progressIntervalMs`` and
+        ``progressStride``; the latest suppressed one is kept and
+        written by ``flush_progress`` so the final state always arrives.
         """
+        args = (iteration, max_iterations, best_fitness, makespan, energy,
+                reliability, utilization)
+        now = time.monotonic()
+        if (iteration % self.progress_stride != 0
+                or (now - self._last_progress) * 1000 < self.progress_interval_ms):
+            self._pending_progress = args
+            return
+
+        self._last_progress = now
+        self._pending_progress = None
+        self._write_progress(*args)
+
+    def flush_progress(self):
+        """Write the last progress update suppressed by throttling."""
+        if self._pending_progress is not None:
+            self._write_progress(*self._pending_progress)
+            self._pending_progress = None
+
+    def _write_progress(self, iteration, max_iterations, best_fitness,
+                        makespan, energy, reliability, utilization):
         progress = {
             "type": "progress",
             "iteration": iteration,
@@ -69,6 +235,8 @@ class BaseOptimizer(ABC):
             "makespan": round(makespan, 4),
             "energy": round(energy, 4),
         }
+        if "experimentId" in self.config:
+            progress["experimentId"] = self.config["experimentId"]
         if reliability is not None:
             progress["reliability"] = round(reliability, 4)
         if utilization is not None:
@@ -76,6 +244,69 @@ class BaseOptimizer(ABC):
         sys.stderr.write("PROGRESS:" + json.dumps(progress) + "\n")
         sys.stderr.flush()
 
+    # ── Termination ────────────────────────────────────────
+
+    def start_clock(self):
+        """Reset the wall-clock reference used by ``timeBudgetMs``."""
+        self._started = time.monotonic()
+
+    def elapsed_ms(self):
+        return (time.monotonic() - self._started) * 1000
+
+    def request_stop(self):
+        """
+        Ask a running ``run()`` to finish early with its incumbent.
+
+        Safe to call from a signal handler; the flag is polled at the
+        same points as the time budget.
+        """
+        self._stop_requested = True
+
+    def deadline_reason(self):
+        """
+        ``"interrupted"`` after ``request_stop``, ``"timeBudget"`` once
+        ``timeBudgetMs`` has elapsed, else ``None``.  Cheap enough to
+        poll inside iteration loops.
+        """
+        if self._stop_requested:
+            return "interrupted"
+        if (self.time_budget_ms is not None
+                and self.elapsed_ms() >= self.time_budget_ms):
+            return "timeBudget"
+        return None
+
+    def _past_deadline(self):
+        return self.deadline_reason() is not None
+
+    def termination_reason(self, best_history):
+        """
+        Check the configured stopping criteria.
+
+        best_history : list[float] — incumbent fitness after each
+        completed iteration.  Returns ``"interrupted"``,
+        ``"timeBudget"``, ``"targetFitness"``, ``"maxEvaluations"`` or
+        ``"stagnation"`` when the run should stop, else ``None``.
+        Stagnation means the incumbent improved by at most
+        ``stagnationTolerance`` (relative) over the last
+        ``stagnationWindow`` iterations.
+        """
+        reason = self.deadline_reason()
+        if reason is not None:
+            return reason
+        if (self.target_fitness is not None and best_history
+                and best_history[-1] <= self.target_fitness):
+            return "targetFitness"
+        if (self.max_evaluations is not None
+                and self.evaluations >= self.max_evaluations):
+            return "maxEvaluations"
+
+        window = self.stagnation_window
+        if window > 0 and len(best_history) > window:
+            past, now = best_history[-1 - window], best_history[-1]
+            if past - now <= self.stagnation_tolerance * max(abs(past), 1e-12):
+                return "stagnation"
+        return None
+
     # ── Helpers ────────────────────────────────────────────
 
     def _generate_default_tasks(self):
@@ -101,68 +332,275 @@ class BaseOptimizer(ABC):
             })
         return vms
 
+    def _build_cost_model(self):
+        """
+        Precompute the task / VM arrays used by every fitness evaluation.
+
+        ``etc[t, v]`` is the expected time to compute task ``t`` on VM ``v``
+        and ``energy_matrix[t, v]`` the energy it draws there, so a schedule
+        is scored with fancy indexing + ``np.bincount`` instead of dict
+        lookups per task.
+        """
+        self.task_lengths = self.workload.task_length
+        self.vm_mips = self.workload.vm_mips
+        self.vm_power = self.vm_mips * 0.001  # Simplified power model
+        self.etc = self.task_lengths[:, None] / self.vm_mips[None, :]
+        self.energy_matrix = self.etc * self.vm_power[None, :]
+        self._task_index = np.arange(self.workload.n_tasks)
+
+    def _random_population(self, pop_size):
+        """
+        Uniformly random schedules as a contiguous ``int32`` array of
+        shape (pop_size, n_tasks).  ``legacyKernels`` draws them as the
+        original implementation did (64-bit integers).
+        """
+        if self.legacy_kernels:
+            return self.rng.integers(
+                0, self.vm_count, size=(pop_size, self.task_count)
+            ).astype(np.int32)
+        return self.rng.integers(
+            0, self.vm_count, size=(pop_size, self.task_count), dtype=np.int32
+        )
+
+    def _initial_population(self, pop_size):
+        """
+        Starting population for a metaheuristic.
+
+        With ``seedFraction`` > 0 that share of the rows (at least one)
+        are warm starts: first the ``seedHeuristics`` schedules as-is,
+        then copies of them with each gene reassigned at random with
+        probability ``seedPerturbation``.  The remaining rows are random;
+        ``seedFraction`` 0 is exactly ``_random_population``.
+        """
+        population = self._random_population(pop_size)
+        if self.seed_fraction <= 0:
+            return population
+
+        n_seeded = min(pop_size, max(1, round(self.seed_fraction * pop_size)))
+        seeds = self._heuristic_schedules()
+        for i in range(n_seeded):
+            population[i] = seeds[i % len(seeds)]
+
+        perturbed = population[len(seeds):n_seeded]
+        mask = self.rng.random(perturbed.shape) < self.seed_perturbation
+        perturbed[mask] = self.rng.integers(
+            0, self.vm_count, size=int(mask.sum()), dtype=np.int32
+        )
+        return population
+
+    def _heuristic_schedules(self):
+        """Schedules of the ``seedHeuristics`` on this workload, in order."""
+        etc = self.etc[:self.task_count, :self.vm_count]
+        builders = {
+            "min_min": lambda: self.kernels.min_min(etc, self._past_deadline),
+            "max_min": lambda: max_min(etc, self._past_deadline),
+            "lpt": lambda: lpt(etc),
+            "mips_round_robin": lambda: proportional_round_robin(
+                self.vm_mips[:self.vm_count], self.task_count
+            ),
+        }
+        return [builders[name]() for name in self.seed_heuristics]
+
     # ── Fitness evaluation ─────────────────────────────────
 
+    def vm_loads(self, schedule):
+        """
+        Total execution time accumulated on each VM.
+        schedule : array-like[int]  — schedule[i] = VM index for task i
+        """
+        idx = np.asarray(schedule, dtype=np.intp)
+        exec_times = self.etc[self._task_index[:len(idx)], idx]
+        return np.bincount(idx, weights=exec_times, minlength=self.vm_count)
+
+    def evaluate(self, schedule):
+        """
+        Fused evaluator: makespan, energy, reliability and resource
+        utilization of a schedule from a single pass over the tasks.
+
+        Returns a ``(makespan, energy, reliability, utilization)`` tuple
+        of floats.
+        """
+        idx = np.asarray(schedule, dtype=np.intp)
+        rows = self._task_index[:len(idx)]
+        loads = np.bincount(
+            idx, weights=self.etc[rows, idx], minlength=self.vm_count
+        )
+        energy = float(self.energy_matrix[rows, idx].sum())
+        return self._metrics_from_loads(loads, energy)
+
+    def _metrics_from_loads(self, loads, energy):
+        """Derive the four objective values from per-VM loads."""
+        makespan = float(loads.max())
+
+        # Reliability: 1 - max load imbalance (balanced → higher)
+        total = float(loads.sum()) or 1.0
+        avg = total / self.vm_count
+        imbalance = float(np.abs(loads - avg).max()) / avg if avg > 0 else 0
+        reliability = max(0.0, 1.0 - imbalance)
+
+        # Utilization: average busy fraction relative to the makespan
+        utilization = float((loads / (makespan or 1.0)).sum()) / self.vm_count
+
+        return makespan, energy, reliability, utilization
+
+    @property
+    def kernels(self):
+        """Kernel namespace of ``kernelBackend`` for this problem size."""
+        if self._kernels is None:
+            work = self.task_count * max(self.population_size, self.vm_count)
+            self._kernels = kernels.get(self.kernel_backend, work)
+        return self._kernels
+
+    def evaluate_batch(self, population):
+        """
+        Vectorized ``evaluate`` over a whole population.
+
+        population : array-like[int] of shape (pop_size, n_tasks)
+
+        Per-individual VM loads and energies come from the
+        ``loads_energy`` kernel.  Returns an array of shape
+        (pop_size, 4) whose columns are makespan, energy, reliability and
+        utilization.
+        """
+        pop = np.atleast_2d(np.asarray(population))
+        if pop.dtype.kind not in "iu":
+            pop = pop.astype(np.intp)
+        n_vms = self.vm_count
+        loads, energy = self.kernels.loads_energy(
+            pop, self.etc, self.energy_matrix, n_vms
+        )
+
+        makespan = loads.max(axis=1)
+
+        total = loads.sum(axis=1)
+        total[total == 0] = 1.0
+        avg = total / n_vms
+        imbalance = np.abs(loads - avg[:, None]).max(axis=1) / avg
+        reliability = np.maximum(0.0, 1.0 - imbalance)
+
+        safe_ms = np.where(makespan > 0, makespan, 1.0)
+        utilization = (loads / safe_ms[:, None]).sum(axis=1) / n_vms
+
+        return np.column_stack((makespan, energy, reliability, utilization))
+
+    def fitness_batch(self, population):
+        """
+        Weighted fitness of every row of ``population`` in one call.
+
+        Returns ``(fitness, objectives)`` where ``fitness`` has shape
+        (pop_size,) and ``objectives`` is the (pop_size, 4) array from
+        ``evaluate_batch``.  Every scored row is offered to the Pareto
+        archive.
+        """
+        if self._fitness_cache is None:
+            objectives = self.evaluate_batch(population)
+            self.evaluations += len(objectives)
+        else:
+            objectives = self._cached_objectives(population)
+        self.pareto.add(objectives)
+        fitness = self._weighted_fitness(
+            objectives[:, 0], objectives[:, 1], objectives[:, 2]
+        )
+        return fitness, objectives
+
+    def _cached_objectives(self, population):
+        """
+        ``evaluate_batch`` through the ``fitnessCacheSize`` LRU memo.
+
+        Rows are keyed by a 128-bit BLAKE2b digest of their bytes; only
+        distinct, uncached rows are evaluated (and counted towards
+        ``evaluations``), everything else is a hit.
+        """
+        population = np.ascontiguousarray(population, dtype=np.int32)
+        cache = self._fitness_cache
+        objectives = np.empty((len(population), 4))
+
+        pending = {}  # digest → rows needing it
+        for i, row in enumerate(population):
+            key = hashlib.blake2b(row, digest_size=16).digest()
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                objectives[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+
+        self.cache_hits += len(population) - len(pending)
+        self.cache_misses += len(pending)
+        if pending:
+            first = [rows[0] for rows in pending.values()]
+            fresh = self.evaluate_batch(population[first])
+            self.evaluations += len(first)
+            for (key, rows), values in zip(pending.items(), fresh):
+                objectives[rows] = values
+                cache[key] = values
+            while len(cache) > self.fitness_cache_size:
+                cache.popitem(last=False)
+        return objectives
+
     def compute_makespan(self, schedule):
         """
         Compute makespan given a schedule (task→VM mapping).
         schedule : list[int]  — schedule[i] = VM index for task i
         """
-        vm_times = [0.0] * self.vm_count
-        for task_idx, vm_idx in enumerate(schedule):
-            task = self.tasks[task_idx]
-            vm = self.vms[vm_idx]
-            exec_time = task["length"] / vm["mips"]
-            vm_times[vm_idx] += exec_time
-        return max(vm_times)
+        return float(self.vm_loads(schedule).max())
 
     def compute_energy(self, schedule):
         """Estimate energy consumption (simplified model)."""
-        energy = 0.0
-        for task_idx, vm_idx in enumerate(schedule):
-            task = self.tasks[task_idx]
-            vm = self.vms[vm_idx]
-            exec_time = task["length"] / vm["mips"]
-            power = vm["mips"] * 0.001  # Simplified power model
-            energy += power * exec_time
-        return energy
+        idx = np.asarray(schedule, dtype=np.intp)
+        return float(self.energy_matrix[self._task_index[:len(idx)], idx].sum())
 
     def compute_reliability(self, schedule):
         """
         Estimate reliability as 1 - max_load_imbalance.
         Balanced loads → higher reliability.
         """
-        vm_loads = [0.0] * self.vm_count
-        for task_idx, vm_idx in enumerate(schedule):
-            task = self.tasks[task_idx]
-            vm = self.vms[vm_idx]
-            vm_loads[vm_idx] += task["length"] / vm["mips"]
-
-        total = sum(vm_loads) if sum(vm_loads) > 0 else 1
-        avg = total / self.vm_count
-        imbalance = max(abs(l - avg) for l in vm_loads) / avg if avg > 0 else 0
-        return max(0.0, 1.0 - imbalance)
+        return self.evaluate(schedule)[2]
 
     def compute_resource_utilization(self, schedule):
         """Average VM utilization as a fraction."""
-        vm_times = [0.0] * self.vm_count
-        for task_idx, vm_idx in enumerate(schedule):
-            task = self.tasks[task_idx]
-            vm = self.vms[vm_idx]
-            vm_times[vm_idx] += task["length"] / vm["mips"]
-
-        makespan = max(vm_times) if max(vm_times) > 0 else 1
-        utilizations = [t / makespan for t in vm_times]
-        return sum(utilizations) / self.vm_count
+        return self.evaluate(schedule)[3]
 
     def fitness(self, schedule):
         """
         Multi-objective weighted fitness (lower is better).
         """
-        ms = self.compute_makespan(schedule)
-        en = self.compute_energy(schedule)
-        rel = self.compute_reliability(schedule)
+        if self._fitness_cache is not None:
+            return float(self.fitness_batch(np.asarray(schedule)[None])[0][0])
+        self.evaluations += 1
+        ms, en, rel, _ = self.evaluate(schedule)
+        self.pareto.add((ms, en, rel))
+        return self._weighted_fitness(ms, en, rel)
 
+    def legacy_fitness(self, schedule):
+        """
+        ``fitness`` with the original implementation's summation order
+        (energy and total load added up one term at a time), so
+        ``legacyKernels`` replays compare bit-identical fitness values.
+        """
+        self.evaluations += 1
+        idx = np.asarray(schedule, dtype=np.intp)
+        loads = self.vm_loads(idx).tolist()
+        ms = max(loads)
+        en = float(np.cumsum(
+            self.energy_matrix[self._task_index[:len(idx)], idx]
+        )[-1])
+        total = sum(loads) or 1
+        avg = total / self.vm_count
+        imbalance = max(abs(l - avg) for l in loads) / avg if avg > 0 else 0
+        rel = max(0.0, 1.0 - imbalance)
+        self.pareto.add((ms, en, rel))
+        return self._weighted_fitness(ms, en, rel)
+
+    def incremental_evaluator(self, schedule):
+        """
+        Stateful evaluator for ``schedule`` supporting O(1) task moves
+        with undo (see ``IncrementalEvaluator``).
+        """
+        return IncrementalEvaluator(self, schedule)
+
+    def _weighted_fitness(self, ms, en, rel):
+        """Collapse the objectives into the weighted scalar fitness."""
         # Normalize: we minimize makespan & energy, maximize reliability
         return (
             self.w_makespan * ms
@@ -170,89 +608,102 @@ class BaseOptimizer(ABC):
             - self.w_reliability * rel * 100  # Scale reliability contribution
         )
 
+    def _record_iteration(self, iteration, best_fitness, objectives,
+                          convergence, max_iterations=None):
+        """
+        Append a convergence point and stream it to Node.js.
+
+        ``objectives`` is the ``evaluate`` tuple of the incumbent,
+        computed once by the caller and shared by both.
+        """
+        ms, en, rel, util = objectives
+        convergence.append({
+            "iteration": iteration,
+            "bestFitness": round(best_fitness, 6),
+            "makespan": round(ms, 4),
+            "energy": round(en, 4),
+        })
+
+        # Stream progress to Node.js via stderr
+        self.report_progress(
+            iteration=iteration,
+            max_iterations=max_iterations or self.max_iterations,
+            best_fitness=best_fitness,
+            makespan=ms,
+            energy=en,
+            reliability=rel,
+            utilization=util,
+        )
+
+    def _single_pass_result(self, schedule):
+        """Result of a one-shot heuristic: a single convergence point."""
+        objectives = self.evaluate(schedule)
+        fitness = self._weighted_fitness(*objectives[:3])
+        convergence = []
+        self._record_iteration(0, fitness, objectives, convergence,
+                               max_iterations=1)
+        return self.build_result(schedule, convergence)
+
     def build_result(self, best_schedule, convergence_data):
         """
         Build the standard result dict returned to the Node backend.
+
+        With ``outputFormat: "packed"`` the schedule and convergence
+        series are packed column blocks (see ``algorithms.packed``).
         """
-        schedule_entries = []
-        for task_idx, vm_idx in enumerate(best_schedule):
-            schedule_entries.append({
-                "taskId": task_idx,
-                "vmId": vm_idx,
-                "startTime": 0,  # Simplified; real times computed in simulation
-                "endTime": 0,
-            })
+        self.flush_progress()
+        if self.local_search is not None:
+            best_schedule, _ = self.local_search.improve(best_schedule)
+        ms, en, rel, util = self.evaluate(best_schedule)
+        self.pareto.add((ms, en, rel))
 
-        pareto_points = self._compute_pareto_front(convergence_data)
+        if self.output_format == "packed":
+            schedule_out = pack_schedule(best_schedule)
+            convergence_out = pack_convergence(convergence_data)
+        else:
+            schedule_out = []
+            for task_idx, vm_idx in enumerate(best_schedule):
+                schedule_out.append({
+                    "taskId": task_idx,
+                    "vmId": int(vm_idx),
+                    "startTime": 0,  # Simplified; real times computed in simulation
+                    "endTime": 0,
+                })
+            convergence_out = convergence_data
 
-        return {
-            "makespan": round(self.compute_makespan(best_schedule), 4),
-            "energy": round(self.compute_energy(best_schedule), 4),
-            "reliability": round(self.compute_reliability(best_schedule), 4),
-            "resourceUtilization": round(
-                self.compute_resource_utilization(best_schedule), 4
-            ),
-            "convergenceData": convergence_data,
-            "paretoPoints": pareto_points,
-            "schedule": schedule_entries,
-            "logs": "",
+        result = {
+            "makespan": round(ms, 4),
+            "energy": round(en, 4),
+            "reliability": round(rel, 4),
+            "resourceUtilization": round(util, 4),
+            "convergenceData": convergence_out,
+            "paretoPoints": self.pareto.to_list(),
+            "schedule": schedule_out,
+            "logs": "\n".join(self._log_lines()),
         }
+        if self.stop_reason is not None:
+            result["stopReason"] = self.stop_reason
+            result["iterations"] = self.iterations_completed
+        if self.checkpoint_mode:
+            checkpoint = make_checkpoint(self, best_schedule)
+            if self.checkpoint_mode == "store":
+                checkpoint = CheckpointStore().put(checkpoint)
+            result["checkpoint"] = checkpoint
+        return result
 
-    def _compute_pareto_front(self, convergence_data):
-        """
-        Derive Pareto-optimal (makespan, energy) points from the
-        convergence history.  A point dominates another when it is
-        better (lower) on *both* objectives.
-
-        Returns a list of dicts sorted by makespan ascending.
-        """
-        if not convergence_data:
-            return []
-
-        # Collect unique (makespan, energy) pairs that have both fields
-        candidates = [
-            {"makespan": d["makespan"], "energy": d["energy"],
-             "reliability": d.get("bestFitness", 0)}
-            for d in convergence_data
-            if d.get("makespan") is not None and d.get("energy") is not None
-        ]
-
-        if not candidates:
-            return []
-
-        # Remove dominated points: point A is dominated if there exists B
-        # such that B.makespan <= A.makespan AND B.energy <= A.energy
-        # (with at least one strict inequality).
-        pareto = []
-        for a in candidates:
-            dominated = False
-            for b in candidates:
-                if b is a:
-                    continue
-                if (b["makespan"] <= a["makespan"] and
-                        b["energy"] <= a["energy"] and
-                        (b["makespan"] < a["makespan"] or
-                         b["energy"] < a["energy"])):
-                    dominated = True
-                    break
-            if not dominated:
-                pareto.append(a)
-
-        # Deduplicate and sort by makespan
-        seen = set()
-        unique = []
-        for p in pareto:
-            key = (round(p["makespan"], 2), round(p["energy"], 2))
-            if key not in seen:
-                seen.add(key)
-                unique.append({
-                    "makespan": round(p["makespan"], 4),
-                    "energy": round(p["energy"], 4),
-                    "reliability": round(p.get("reliability", 0), 4),
-                })
-
-        unique.sort(key=lambda p: p["makespan"])
-        return unique
+    def _log_lines(self):
+        """Run statistics reported in the result ``logs``."""
+        lines = []
+        if self._fitness_cache is not None:
+            lookups = self.cache_hits + self.cache_misses
+            rate = self.cache_hits / lookups if lookups else 0.0
+            lines.append(
+                f"fitnessCache: hits={self.cache_hits} "
+                f"misses={self.cache_misses} hitRate={rate:.3f}"
+            )
+        if self.local_search is not None:
+            lines.append(self.local_search.log_line())
+        return lines
 
     # ── Abstract method ────────────────────────────────────
 
@@ -264,3 +715,315 @@ class BaseOptimizer(ABC):
             convergenceData, paretoPoints, schedule, logs
         """
         ...
+
+
+class IterativeOptimizer(BaseOptimizer):
+    """
+    Base for population-based metaheuristics driven one iteration at a
+    time.
+
+    Subclasses build their search state in ``_init_search`` and advance
+    it in ``_iterate``, keeping ``best_schedule`` / ``best_fitness``
+    current.  The shared ``run`` loop records convergence, streams
+    progress and applies the termination criteria after every
+    iteration; the result carries ``stopReason`` and ``iterations``.
+
+    Anytime mode
+    ------------
+    ``timeBudgetMs`` and ``request_stop()`` are also polled before every
+    iteration, so a run returns the incumbent found so far — possibly
+    after zero iterations — as soon as the budget is spent or a stop is
+    requested.
+
+    Resuming
+    --------
+    With ``resumeFrom`` the state named in ``checkpoint_state`` is
+    loaded over the fresh ``_init_search`` state, the checkpoint's best
+    schedule replaces the first row of every population, and
+    ``_resync_search`` rescores it all (see ``algorithms.checkpoint``).
+    A resumed run still performs up to ``maxIterations`` iterations.
+
+    Snapshots
+    ---------
+    With ``snapshotEvery`` / ``snapshotIntervalMs`` the attributes in
+    ``snapshot_state``, the RNG state and the history so far are written
+    to disk in the background; a rerun of the same config continues from
+    the latest snapshot and ends exactly as an uninterrupted run (see
+    ``algorithms.snapshot``).  Island runs are not snapshotted.
+
+    Local search
+    ------------
+    With ``localSearch: "iteration"`` the incumbent is hill-climbed after
+    every iteration (see ``algorithms.local_search``).  Algorithms that
+    steer by ``best_schedule`` pick the improvement up directly; others
+    feed it back in ``_adopt_incumbent``.
+
+    Island model
+    ------------
+    Algorithms that keep ``population`` / ``fitness_vals`` arrays set
+    ``supports_islands``.  With ``hyperparameters.islands > 1`` that many
+    independently seeded sub-populations (each of ``populationSize``)
+    evolve in separate processes and exchange their ``migrationSize``
+    best individuals every ``migrationInterval`` iterations along
+    ``migrationTopology`` (``"ring"`` or ``"fully_connected"``).
+    """
+
+    supports_islands = False
+
+    # Attributes saved in run snapshots; subclasses add their search state
+    snapshot_state = ("best_schedule", "best_fitness", "_polished_fitness")
+
+    def __init__(self, config: dict, workload: Workload = None):
+        super().__init__(config, workload)
+        hp = config.get("hyperparameters", {})
+
+        self.islands = int(hp.get("islands", 1))
+        self.migration_interval = max(1, int(hp.get("migrationInterval", 10)))
+        self.migration_size = int(hp.get("migrationSize", 2))
+        self.migration_topology = hp.get("migrationTopology", "ring")
+
+        self.best_schedule = None
+        self.best_fitness = float("inf")
+        self._objectives = None
+        self._objectives_for = None
+        self._polished_fitness = float("nan")  # incumbent last hill-climbed
+
+    @abstractmethod
+    def _init_search(self):
+        """Create the initial search state and incumbent."""
+        ...
+
+    @abstractmethod
+    def _iterate(self, iteration):
+        """Advance the search by one iteration."""
+        ...
+
+    def run(self) -> dict:
+        if self.islands > 1 and self.supports_islands:
+            return run_islands(self)
+
+        self.start_clock()
+        writer = self._snapshot_writer()
+        restored = writer and self._restore_snapshot(writer.path)
+        if restored:
+            start, convergence, best_history = restored
+        else:
+            self._start_search()
+            start, convergence, best_history = 0, [], []
+        self.stop_reason = "maxIterations"
+        last_snapshot = time.perf_counter()
+
+        for iteration in range(start, self.max_iterations):
+            # The budget may already be spent by _init_search
+            reason = self.deadline_reason()
+            if reason is not None:
+                self.stop_reason = reason
+                break
+
+            self._iterate(iteration)
+            self._polish_incumbent()
+            self._record_iteration(
+                iteration, self.best_fitness, self._best_objectives(),
+                convergence,
+            )
+
+            best_history.append(self.best_fitness)
+            reason = self.termination_reason(best_history)
+            if reason is not None:
+                self.stop_reason = reason
+                break
+
+            if writer is not None and (
+                (self.snapshot_every and (iteration + 1) % self.snapshot_every == 0)
+                or (self.snapshot_interval_ms and (time.perf_counter() - last_snapshot)
+                    * 1000 >= self.snapshot_interval_ms)
+            ):
+                self._write_snapshot(writer, convergence, best_history)
+                last_snapshot = time.perf_counter()
+
+        self.iterations_completed = len(convergence)
+        if writer is not None:
+            # Keep an interrupted run resumable; a finished one is done
+            if self.stop_reason == "interrupted":
+                self._write_snapshot(writer, convergence, best_history, wait=True)
+            else:
+                writer.discard()
+        return self.build_result(self.best_schedule, convergence)
+
+    # ── Snapshots ──────────────────────────────────────────
+
+    def _snapshot_writer(self):
+        """``SnapshotWriter`` for this run, or ``None`` if disabled."""
+        if not (self.snapshot_every or self.snapshot_interval_ms):
+            return None
+        self._snapshot_key = ResultCache.key(self.config, self.workload)
+        return snapshot.SnapshotWriter(
+            self.snapshot_path or snapshot.default_path(self._snapshot_key)
+        )
+
+    def _write_snapshot(self, writer, convergence, best_history, wait=False):
+        arrays = {name: getattr(self, name) for name in self.snapshot_state}
+        arrays.update(snapshot.pack_convergence(convergence))
+        arrays["bestHistory"] = np.asarray(best_history, dtype=np.float64)
+        arrays["pareto"] = self.pareto.points
+        writer.write(arrays, {
+            "version": snapshot.SNAPSHOT_VERSION,
+            "key": self._snapshot_key,
+            "nextIteration": len(convergence),
+            "rng": self.rng.bit_generator.state,
+            "evaluations": self.evaluations,
+            "cacheHits": self.cache_hits,
+            "cacheMisses": self.cache_misses,
+        }, wait=wait)
+
+    def _restore_snapshot(self, path):
+        """
+        Load the snapshot at ``path`` if it belongs to this config.
+        Returns ``(next_iteration, convergence, best_history)`` or
+        ``None``.
+        """
+        loaded = snapshot.load(path, self._snapshot_key)
+        if loaded is None:
+            return None
+        arrays, meta = loaded
+
+        # Allocate the search state, then overwrite all of it
+        self._init_search()
+        for name in self.snapshot_state:
+            value = arrays[name]
+            current = getattr(self, name, None)
+            if isinstance(current, np.ndarray) and current.shape == value.shape:
+                current[...] = value  # keeps views such as GA's buffers
+            elif value.ndim == 0:
+                setattr(self, name, value.item())
+            else:
+                setattr(self, name, value.copy())
+
+        self.rng.bit_generator.state = meta["rng"]
+        self.evaluations = meta["evaluations"]
+        self.cache_hits = meta["cacheHits"]
+        self.cache_misses = meta["cacheMisses"]
+        self.pareto.points = arrays["pareto"]
+        self._objectives_for = None
+        return (meta["nextIteration"], snapshot.unpack_convergence(arrays),
+                arrays["bestHistory"].tolist())
+
+    def _start_search(self):
+        """``_init_search``, then load the ``resumeFrom`` checkpoint."""
+        self._init_search()
+        if self.resume_from is None:
+            return
+
+        workload = self.workload
+        remap = Remap(CheckpointStore().resolve(self.resume_from),
+                      workload.task_id[:self.task_count],
+                      workload.vm_id[:self.vm_count])
+        best = place_remaining(self.etc[:self.task_count, :self.vm_count],
+                               remap.best_schedule())
+
+        for name, kind in self.checkpoint_state.items():
+            target = getattr(self, name)
+            old = remap.state(name)
+            if kind == TASK_VM:
+                if old is not None:
+                    target[...] = remap.task_vm(old, fill=target)
+                continue
+
+            if old is not None:
+                rows = min(len(old), len(target))
+                if kind == SCHEDULES:
+                    new = remap.schedules(old[:rows])
+                    unknown = new < 0
+                    new[unknown] = self.rng.integers(
+                        0, self.vm_count, size=int(unknown.sum()), dtype=np.int32
+                    )
+                else:
+                    new = remap.task_values(old[:rows], fill=0)
+                target[:rows] = new
+            if kind == SCHEDULES:
+                target[0] = best
+
+        self._resync_search()
+        fitness = float(self.fitness_batch(best[None])[0][0])
+        if fitness < self.best_fitness:
+            self.best_schedule = best
+            self.best_fitness = fitness
+
+    def _polish_incumbent(self):
+        """Per-iteration local search on a changed incumbent."""
+        if (self.local_search_mode != "iteration"
+                or self.best_fitness == self._polished_fitness):
+            return
+        schedule, fitness = self.local_search.improve(self.best_schedule)
+        if fitness < self.best_fitness:
+            self.best_schedule[:] = schedule
+            self.best_fitness = fitness
+            self._adopt_incumbent()
+        self._polished_fitness = self.best_fitness
+
+    def _adopt_incumbent(self):
+        """
+        Feed a locally improved ``best_schedule`` back into the search
+        state.  No-op: most algorithms steer by the incumbent already.
+        """
+
+    def _resync_search(self):
+        """Rescore ``population`` after it was overwritten by a resume."""
+        self._score_population()
+
+    def _score_population(self):
+        """
+        Score ``population`` in one batch into ``fitness_vals`` and update
+        the incumbent.  Returns the ``evaluate_batch`` objectives.
+        """
+        self.fitness_vals, objectives = self.fitness_batch(self.population)
+        self._update_best()
+        return objectives
+
+    def _initial_fitness(self, population):
+        """
+        Fitness of the starting population: one batch, or one schedule
+        at a time with ``legacyKernels``.
+        """
+        if self.legacy_kernels:
+            return np.array([self.legacy_fitness(row) for row in population])
+        return self.fitness_batch(population)[0]
+
+    def _best_objectives(self):
+        """
+        ``evaluate(best_schedule)``, recomputed only when the incumbent
+        has changed (it is only ever replaced by a strictly fitter one).
+        """
+        if self._objectives_for != self.best_fitness:
+            self._objectives = self.evaluate(self.best_schedule)
+            self._objectives_for = self.best_fitness
+        return self._objectives
+
+    # ── Population helpers ─────────────────────────────────
+
+    def _update_best(self):
+        """Promote the fittest member of ``population`` if it improves."""
+        best_idx = int(np.argmin(self.fitness_vals))
+        if self.best_schedule is None:
+            self.best_schedule = self.population[best_idx].copy()
+            self.best_fitness = float(self.fitness_vals[best_idx])
+        elif self.fitness_vals[best_idx] < self.best_fitness:
+            self.best_schedule[:] = self.population[best_idx]
+            self.best_fitness = float(self.fitness_vals[best_idx])
+
+    def _emigrants(self, k):
+        """Copies of the ``k`` fittest individuals."""
+        order = np.argsort(self.fitness_vals, kind="stable")[:k]
+        return self.population[order].copy()
+
+    def _immigrate(self, migrants):
+        """Replace the worst individuals with ``migrants``."""
+        k = min(len(migrants), len(self.population) - 1)
+        if k <= 0:
+            return
+        migrants = migrants[:k]
+        worst = np.argsort(self.fitness_vals, kind="stable")[::-1][:k]
+        fits, _ = self.fitness_batch(migrants)
+        self.population[worst] = migrants
+        self.fitness_vals[worst] = fits
+        self._update_best()
@@ -0,0 +1,129 @@
+"""
+Checkpoints
+============
+With ``"checkpoint": true`` in the config, a result carries a
+``checkpoint``: the best schedule, the search state listed in the
+optimizer's ``checkpoint_state`` (populations, PSO velocities, the ACO
+pheromone matrix) and the task / VM ids that state refers to, every
+array packed as in ``algorithms.packed``:
+
+    {"version": 1, "algorithm": "GA",
+     "taskIds": {...}, "vmIds": {...}, "bestSchedule": {...},
+     "state": {"population": {...}}}
+
+Passing it back as ``"resumeFrom"`` makes an iterative optimizer start
+from that state instead of from scratch, so re-planning after a small
+workload change is a short refinement rather than a full rerun.  Tasks
+and VMs are matched by id: state belonging to removed tasks / VMs is
+dropped, new tasks (and tasks whose VM was removed) are placed at random
+in populations and on their earliest-finishing VM in the best schedule,
+and population-shaped state is truncated or topped up to
+``populationSize``.  State the resuming algorithm does not keep is
+ignored, so any checkpoint — even a heuristic's — can warm-start any
+metaheuristic through its best schedule.
+
+``"checkpoint": "store"`` leaves the ``state`` out of the result and
+keeps it in the ``CheckpointStore`` instead; the result's checkpoint
+then refers to it by ``checkpointId``.
+"""
+
+import numpy as np
+
+from .packed import pack_array, unpack_array
+
+CHECKPOINT_VERSION = 1
+# ``"checkpoint"`` config values; "store" keeps the state out of the
+# result (see ``algorithms.checkpoint_store``)
+CHECKPOINT_MODES = (False, True, "store")
+
+# ``checkpoint_state`` kinds
+SCHEDULES = "schedules"      # (rows, n_tasks) VM indices
+TASK_VALUES = "taskValues"   # (rows, n_tasks) per-gene values
+TASK_VM = "taskVm"           # (n_tasks, n_vms) values
+
+
+def make_checkpoint(optimizer, best_schedule):
+    """Checkpoint dict for the current state of ``optimizer``."""
+    workload = optimizer.workload
+    state = {}
+    for name in optimizer.checkpoint_state:
+        value = getattr(optimizer, name, None)
+        if value is not None:
+            state[name] = pack_array(value)
+    return {
+        "version": CHECKPOINT_VERSION,
+        "algorithm": optimizer.config.get("algorithm"),
+        "taskIds": pack_array(workload.task_id[:optimizer.task_count]),
+        "vmIds": pack_array(workload.vm_id[:optimizer.vm_count]),
+        "bestSchedule": pack_array(
+            np.asarray(best_schedule, dtype=np.int32)
+        ),
+        "state": state,
+    }
+
+
+def _positions(keys, ids):
+    """Index of each of ``ids`` in ``keys``, or -1 where absent."""
+    keys, ids = np.asarray(keys), np.asarray(ids)
+    if not len(keys):
+        return np.full(len(ids), -1, dtype=np.intp)
+    order = np.argsort(keys, kind="stable")
+    ordered = keys[order]
+    pos = np.minimum(np.searchsorted(ordered, ids), len(keys) - 1)
+    return np.where(ordered[pos] == ids, order[pos], -1)
+
+
+class Remap:
+    """
+    Translate checkpoint arrays from the checkpoint's tasks / VMs to the
+    current ones (``task_ids`` / ``vm_ids``), matching by id.
+
+    Raises ``ValueError`` for a checkpoint of another format version.
+    """
+
+    def __init__(self, checkpoint, task_ids, vm_ids):
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint version: {checkpoint.get('version')} "
+                f"(expected {CHECKPOINT_VERSION})"
+            )
+        self.checkpoint = checkpoint
+        old_vms = unpack_array(checkpoint["vmIds"])
+        # Current task t came from checkpoint task task_src[t]
+        self.task_src = _positions(unpack_array(checkpoint["taskIds"]), task_ids)
+        # Checkpoint VM v is current VM vm_dst[v]; one spare slot maps -1
+        self.vm_dst = np.append(_positions(vm_ids, old_vms), -1)
+        self.vm_src = _positions(old_vms, vm_ids)
+        self.known = self.task_src >= 0
+
+    def state(self, name):
+        """Unpacked checkpoint state array ``name``, or ``None``."""
+        block = self.checkpoint.get("state", {}).get(name)
+        return None if block is None else unpack_array(block)
+
+    def best_schedule(self):
+        return self.schedules(unpack_array(self.checkpoint["bestSchedule"]))
+
+    def schedules(self, old):
+        """VM-index rows over checkpoint tasks → current tasks (-1 = unknown)."""
+        out = np.full(old.shape[:-1] + (len(self.task_src),), -1, dtype=np.int32)
+        vms = old[..., self.task_src[self.known]]
+        vms = np.where((vms >= 0) & (vms < len(self.vm_dst) - 1), vms, -1)
+        out[..., self.known] = self.vm_dst[vms]
+        return out
+
+    def task_values(self, old, fill):
+        """Per-gene rows over checkpoint tasks → current tasks."""
+        out = np.full(old.shape[:-1] + (len(self.task_src),), fill,
+                      dtype=old.dtype)
+        out[..., self.known] = old[..., self.task_src[self.known]]
+        return out
+
+    def task_vm(self, old, fill):
+        """(task, VM) matrix → current tasks and VMs, ``fill`` elsewhere."""
+        out = np.array(fill, dtype=old.dtype, copy=True)
+        rows = np.flatnonzero(self.known)
+        cols = np.flatnonzero(self.vm_src >= 0)
+        out[np.ix_(rows, cols)] = old[np.ix_(self.task_src[rows],
+                                             self.vm_src[cols])]
+        return out
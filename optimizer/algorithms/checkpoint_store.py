@@ -0,0 +1,88 @@
+"""
+On-disk checkpoint store
+=========================
+Keeps the search state of checkpoints out of results.  With
+``"checkpoint": "store"`` the full checkpoint (see
+``algorithms.checkpoint``) is written here and the result carries only
+its small part — format version, algorithm, task / VM ids and best
+schedule — plus a ``checkpointId``:
+
+    {"version": 1, "algorithm": "GA", "taskIds": {...}, "vmIds": {...},
+     "bestSchedule": {...}, "checkpointId": "<32 hex digits>"}
+
+Passed back as ``"resumeFrom"``, that reference is resolved to the
+stored state again.  If the entry has been evicted in the meantime the
+run still warm-starts from the best schedule it carries.
+
+Checkpoints live in ``<root>/<checkpointId>.json``, where the id hashes
+the checkpoint's canonical JSON, so identical checkpoints share one
+entry.  Location and budget come from ``CHECKPOINT_STORE_DIR`` (default
+``<tmp>/edo-checkpoints``) and ``CHECKPOINT_STORE_MAX_BYTES`` (default
+1 GiB; 0 disables the store, leaving results with the best schedule
+only), and entries are written and evicted as in
+``algorithms.disk_store``.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from .disk_store import DiskStore
+
+DEFAULT_MAX_BYTES = 1 << 30
+
+_CHECKPOINT_ID = re.compile(r"[0-9a-f]{32}")
+
+
+class CheckpointStore(DiskStore):
+    """On-disk store of checkpoints (see ``algorithms.disk_store``)."""
+
+    ENV = "CHECKPOINT_STORE"
+    DEFAULT_DIR = "edo-checkpoints"
+    DEFAULT_MAX_BYTES = DEFAULT_MAX_BYTES
+
+    def _path(self, checkpoint_id):
+        if not _CHECKPOINT_ID.fullmatch(str(checkpoint_id)):
+            raise ValueError(f"Invalid checkpointId: {checkpoint_id}")
+        return os.path.join(self.root, checkpoint_id + ".json")
+
+    def put(self, checkpoint):
+        """
+        Store ``checkpoint`` and return its reference: the checkpoint
+        without ``state``, plus ``checkpointId`` unless the store is
+        disabled.
+        """
+        reference = {k: v for k, v in checkpoint.items() if k != "state"}
+        if not self.enabled:
+            return reference
+
+        text = json.dumps(checkpoint, sort_keys=True, separators=(",", ":"))
+        checkpoint_id = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+        path = self._path(checkpoint_id)
+        if os.path.exists(path):
+            os.utime(path)
+        else:
+            self._write_file(path, lambda f: f.write(text))
+            self.evict()
+
+        reference["checkpointId"] = checkpoint_id
+        return reference
+
+    def get(self, checkpoint_id):
+        """Stored checkpoint ``checkpoint_id``, or ``None``."""
+        return self._read_json(self._path(checkpoint_id))
+
+    def __contains__(self, checkpoint_id):
+        return os.path.exists(self._path(checkpoint_id))
+
+    def resolve(self, checkpoint):
+        """
+        The full checkpoint behind a ``put`` reference, or the reference
+        itself (best schedule only) when it is not a reference or its
+        entry is gone.
+        """
+        checkpoint_id = checkpoint.get("checkpointId")
+        if checkpoint_id is None or "state" in checkpoint:
+            return checkpoint
+        return self.get(checkpoint_id) or checkpoint
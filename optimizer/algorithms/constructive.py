@@ -0,0 +1,239 @@
+"""
+Constructive scheduling heuristics
+===================================
+Fast list-scheduling kernels over an ETC (expected time to compute)
+matrix of shape (n_tasks, n_vms).  Each returns an ``int32`` schedule
+array (schedule[t] = VM index) and reproduces the tie-breaking of the
+textbook triple-loop formulation: among equal completion times the
+lowest task index wins, then the lowest VM index.
+
+``lpt`` and ``proportional_round_robin`` are cheaper still and mainly
+serve as warm starts for the metaheuristics (see
+``BaseOptimizer._initial_population``).
+
+Anytime use
+-----------
+``min_min`` and ``max_min`` accept a ``should_stop`` callable that is
+polled every ``POLL_INTERVAL`` assignments.  Once it returns true the
+remaining tasks are placed in index order on their minimum-completion-
+time VM, so a complete schedule is always returned.
+"""
+
+import numpy as np
+
+POLL_INTERVAL = 64
+
+
+def _polled(should_stop, step):
+    return (should_stop is not None and step % POLL_INTERVAL == 0
+            and should_stop())
+
+
+def _complete_mct(etc, schedule, pending, ready):
+    """Place ``pending`` tasks (in order) on their earliest-finishing VM."""
+    for task in pending:
+        ct = ready + etc[task]
+        vm = int(np.argmin(ct))
+        schedule[task] = vm
+        ready[vm] = ct[vm]
+    return schedule
+
+
+def min_min(etc, should_stop=None):
+    """
+    Min-Min: repeatedly assign the (task, VM) pair with the smallest
+    completion time.
+
+    Each VM keeps its tasks sorted by execution time and a pointer to
+    the fastest unassigned one, so a step only compares ``n_vms``
+    candidates: O(n_tasks * n_vms) overall after the initial sort.
+    """
+    n_tasks, n_vms = etc.shape
+    schedule = np.zeros(n_tasks, dtype=np.int32)
+    assigned = np.zeros(n_tasks, dtype=bool)
+    ready = np.zeros(n_vms)
+
+    order = np.argsort(etc, axis=0, kind="stable")
+    ptr = np.zeros(n_vms, dtype=np.intp)
+    vms = np.arange(n_vms)
+
+    for step in range(n_tasks):
+        if _polled(should_stop, step):
+            return _complete_mct(etc, schedule, np.flatnonzero(~assigned), ready)
+
+        cand = order[ptr, vms]
+        ct = ready + etc[cand, vms]
+
+        ties = np.flatnonzero(ct == ct.min())
+        task = int(cand[ties].min())
+        vm = int(ties[cand[ties] == task][0])
+
+        schedule[task] = vm
+        assigned[task] = True
+        ready[vm] = ct[vm]
+
+        # Only pointers resting on the task just assigned go stale
+        stuck = np.flatnonzero(cand == task)
+        while stuck.size:
+            ptr[stuck] += 1
+            stuck = stuck[ptr[stuck] < n_tasks]
+            stuck = stuck[assigned[order[ptr[stuck], stuck]]]
+
+    return schedule
+
+
+def max_min(etc, should_stop=None):
+    """
+    Max-Min: repeatedly assign the task whose best completion time is
+    largest to the VM giving that best completion time.
+    """
+    order, starts = _dominance_order(etc)
+    if order is not None:
+        return _max_min_consistent(etc, order, starts, should_stop)
+    return _max_min_general(etc, should_stop)
+
+
+def _dominance_order(etc):
+    """
+    Order tasks largest-first if the ETC matrix is consistent (every
+    task is at least as slow as the next one on *every* VM), else
+    ``(None, None)``.
+
+    Also returns the start offsets of runs of identical rows; inside a
+    run tasks are kept in ascending index order.
+    """
+    n_tasks = etc.shape[0]
+    order = np.lexsort((np.arange(n_tasks), -etc.sum(axis=1)))
+    steps = np.diff(etc[order], axis=0)
+    if np.any(steps > 0):
+        return None, None
+    new_run = np.any(steps < 0, axis=1)
+    starts = np.flatnonzero(np.concatenate(([True], new_run)))
+    return order, starts
+
+
+def _max_min_consistent(etc, order, starts, should_stop=None):
+    """
+    Max-Min over a consistent ETC matrix.
+
+    A task dominated on every VM can never have a larger best completion
+    time, so the winner is always at the head of the largest remaining
+    run; later runs are only inspected while they tie, to keep the
+    lowest-index tie-breaking.  O(n_tasks * n_vms) overall.
+    """
+    n_tasks, n_vms = etc.shape
+    schedule = np.zeros(n_tasks, dtype=np.int32)
+    ready = np.zeros(n_vms)
+
+    n_runs = len(starts)
+    ends = np.append(starts[1:], n_tasks)
+    head = starts.copy()
+    first = 0
+    assigned = np.zeros(n_tasks, dtype=bool)
+
+    for step in range(n_tasks):
+        if _polled(should_stop, step):
+            return _complete_mct(etc, schedule, np.flatnonzero(~assigned), ready)
+
+        while head[first] == ends[first]:
+            first += 1
+
+        best = None
+        for run in range(first, n_runs):
+            if head[run] == ends[run]:
+                continue
+            task = int(order[head[run]])
+            ct = ready + etc[task]
+            vm = int(np.argmin(ct))
+            if best is not None and ct[vm] < best[2]:
+                break
+            if best is None or task < best[0]:
+                best = (task, vm, ct[vm], run)
+
+        task, vm, ct, run = best
+        head[run] += 1
+        schedule[task] = vm
+        assigned[task] = True
+        ready[vm] = ct
+
+    return schedule
+
+
+def _max_min_general(etc, should_stop=None):
+    """
+    Max-Min over an arbitrary ETC matrix.
+
+    Every unassigned task caches its best VM and completion time; after
+    an assignment only tasks whose cached best VM is the one that just
+    got busier are re-evaluated.
+    """
+    n_tasks, n_vms = etc.shape
+    schedule = np.zeros(n_tasks, dtype=np.int32)
+    ready = np.zeros(n_vms)
+
+    best_vm = np.argmin(etc, axis=1)
+    best_ct = etc[np.arange(n_tasks), best_vm]
+
+    for step in range(n_tasks):
+        if _polled(should_stop, step):
+            return _complete_mct(etc, schedule, np.flatnonzero(best_vm >= 0), ready)
+
+        task = int(np.argmax(best_ct))
+        vm = int(best_vm[task])
+
+        schedule[task] = vm
+        ready[vm] = best_ct[task]
+        best_ct[task] = -np.inf
+        best_vm[task] = -1
+
+        stale = np.flatnonzero(best_vm == vm)
+        if stale.size:
+            ct = ready + etc[stale]
+            new_vm = np.argmin(ct, axis=1)
+            best_vm[stale] = new_vm
+            best_ct[stale] = ct[np.arange(stale.size), new_vm]
+
+    return schedule
+
+
+def lpt(etc):
+    """
+    Longest Processing Time first: tasks in decreasing order of mean
+    execution time, each placed on its earliest-finishing VM.
+    """
+    n_tasks, n_vms = etc.shape
+    order = np.argsort(-etc.mean(axis=1), kind="stable")
+    schedule = np.zeros(n_tasks, dtype=np.int32)
+    return _complete_mct(etc, schedule, order, np.zeros(n_vms))
+
+
+def proportional_round_robin(mips, n_tasks):
+    """
+    Weighted round robin: task ``i`` goes to the VM owning the ``i``-th
+    earliest slot, where VM ``v`` offers slots at times ``k / mips[v]``
+    (k = 1, 2, ...), so each VM receives tasks in proportion to its MIPS.
+    """
+    mips = np.asarray(mips, dtype=float)
+    n_vms = len(mips)
+    # Enough slots per VM to cover the first n_tasks overall
+    share = np.ceil((n_tasks + n_vms) * mips / mips.sum()).astype(np.intp)
+    vms = np.repeat(np.arange(n_vms, dtype=np.int32), share)
+    ticks = np.arange(len(vms)) - np.repeat(np.cumsum(share) - share, share) + 1
+    order = np.argsort(ticks / mips[vms], kind="stable")[:n_tasks]
+    return vms[order]
+
+
+def place_remaining(etc, schedule):
+    """
+    Assign the tasks marked ``-1`` in ``schedule`` (in place), longest
+    first, to their earliest-finishing VM given the load of the tasks
+    already placed.
+    """
+    pending = np.flatnonzero(schedule < 0)
+    if not pending.size:
+        return schedule
+    placed = np.flatnonzero(schedule >= 0)
+    ready = np.bincount(schedule[placed], weights=etc[placed, schedule[placed]],
+                        minlength=etc.shape[1])
+    pending = pending[np.argsort(-etc[pending].mean(axis=1), kind="stable")]
+    return _complete_mct(etc, schedule, pending, ready)
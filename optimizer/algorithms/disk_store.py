@@ -0,0 +1,119 @@
+"""
+On-disk stores
+===============
+Plumbing shared by the ``ResultCache``, ``WorkloadStore`` and
+``CheckpointStore``.  Each keeps one entry — a file or a directory — per
+key under its root directory:
+
+* entries are built under a temporary ``.tmp-*`` name and renamed into
+  place, so readers and concurrent writers never see a partial entry;
+* reading an entry refreshes its modification time, and once the store
+  exceeds its byte budget the least recently used entries are evicted.
+
+A store named ``NAME`` takes its root from ``NAME_DIR`` (default
+``<tmp>/<DEFAULT_DIR>``) and its budget from ``NAME_MAX_BYTES``; a
+budget of 0 disables the store.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+
+class DiskStore:
+    """
+    Parameters
+    ----------
+    root : str, optional
+        Store directory (created on first write).
+    max_bytes : int, optional
+        Total size above which least recently used entries are evicted;
+        0 disables the store.
+    """
+
+    # Environment variable prefix, default directory name and budget
+    ENV = None
+    DEFAULT_DIR = None
+    DEFAULT_MAX_BYTES = None
+
+    def __init__(self, root=None, max_bytes=None):
+        self.root = root or os.environ.get(self.ENV + "_DIR") or os.path.join(
+            tempfile.gettempdir(), self.DEFAULT_DIR
+        )
+        if max_bytes is None:
+            max_bytes = (os.environ.get(self.ENV + "_MAX_BYTES")
+                         or self.DEFAULT_MAX_BYTES)
+        self.max_bytes = int(max_bytes)
+
+    @property
+    def enabled(self):
+        return self.max_bytes > 0
+
+    def _read_json(self, path):
+        """JSON entry at ``path`` (refreshing its recency), or ``None``."""
+        try:
+            with open(path) as f:
+                value = json.load(f)
+            os.utime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return value
+
+    def _write_file(self, path, write):
+        """Create the file ``path`` atomically with ``write(f)``."""
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _write_dir(self, path, write):
+        """
+        Create the directory ``path`` atomically with ``write(tmp_dir)``;
+        losing a race to another writer of the same entry is not an error.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=self.root, prefix=".tmp-")
+        try:
+            write(tmp)
+            os.rename(tmp, path)
+        except BaseException as exc:
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not (isinstance(exc, OSError) and os.path.isdir(path)):
+                raise
+
+    def evict(self, keep=None):
+        """
+        Drop least recently used entries until within ``max_bytes``,
+        never the entry named ``keep``.
+        """
+        entries = []
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                stat = entry.stat()
+                size = stat.st_size
+                if entry.is_dir():
+                    size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                entries.append((stat.st_mtime, size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            if entry.is_dir():
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+            total -= size
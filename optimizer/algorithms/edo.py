@@ -5,92 +5,118 @@ Novel metaheuristic inspired by organizational hierarchy dynamics:
   - Exploration via diverse "department" search directions
   - Exploitation via "management" feedback convergence
   - Adaptive balance through iteration-based decay
+
+Random stream
+-------------
+The default kernel updates the whole population at once.  Each
+iteration draws, in this order, (pop_size, n_tasks) arrays of: branch
+uniforms, random VMs, peer indices, refinement uniforms and ±1 steps.
+Setting ``hyperparameters.legacyKernels`` restores the original
+implementation — per-gene draws, each employee scored alone and accepted
+before the next one moves — and replays its runs bit for bit.
 """
 
 import numpy as np
-from .base import BaseOptimizer
+from .base import IterativeOptimizer
+from .checkpoint import SCHEDULES
 
 
-class EDOOptimizer(BaseOptimizer):
+class EDOOptimizer(IterativeOptimizer):
     """EDO algorithm for multi-objective cloud task scheduling."""
 
-    def run(self) -> dict:
-        pop_size = self.population_size
-        max_iter = self.max_iterations
-        n_tasks = self.task_count
+    supports_islands = True
+    checkpoint_state = {"population": SCHEDULES}
+    snapshot_state = IterativeOptimizer.snapshot_state + ("population", "fitness_vals")
+
+    def _init_search(self):
+        # Initialize population: each row is a schedule (task→VM)
+        self.population = self._initial_population(self.population_size)
+        self.fitness_vals = self._initial_fitness(self.population)
+        self._update_best()
+
+        self.candidates = np.empty_like(self.population)
+
+    def _iterate(self, iteration):
+        # Adaptive parameters
+        exploration_rate = 1.0 - (iteration / self.max_iterations)
+        exploitation_rate = iteration / self.max_iterations
+
+        if self.legacy_kernels:
+            return self._sweep_scalar(exploration_rate, exploitation_rate)
+
+        # Every employee proposes a new schedule from the same snapshot
+        # of the organisation; the proposals are scored in one batch.
+        self._propose(self.population, self.candidates, self.best_schedule,
+                      exploration_rate, exploitation_rate)
+
+        new_fits, _ = self.fitness_batch(self.candidates)
+
+        improved = new_fits < self.fitness_vals
+        self.population[improved] = self.candidates[improved]
+        self.fitness_vals[improved] = new_fits[improved]
+        self._update_best()
+
+    def _propose(self, population, candidates, global_best,
+                 exploration_rate, exploitation_rate):
+        """Department / management update of every gene at once."""
+        pop_size = population.shape[0]
         n_vms = self.vm_count
+        shape = population.shape
+
+        r = self.rng.random(shape)
+        rand_vm = self.rng.integers(0, n_vms, size=shape, dtype=np.int32)
+        peers = self.rng.integers(0, pop_size, size=shape)
+        refine = self.rng.random(shape) < 0.3
+        step = self.rng.integers(-1, 2, size=shape, dtype=np.int32)
+
+        self.kernels.edo_propose(
+            population, candidates, global_best, r, rand_vm, peers, refine,
+            step, exploration_rate, exploitation_rate, n_vms,
+        )
+
+    def _sweep_scalar(self, exploration_rate, exploitation_rate):
+        """
+        Legacy loop of the original implementation: each employee in
+        turn proposes gene by gene, is scored alone and, if better,
+        replaces its schedule (and the global best) before the next one.
+        """
+        population, global_best = self.population, self.best_schedule
+        pop_size, n_tasks = population.shape
+        n_vms = self.vm_count
+
+        for i in range(pop_size):
+            new_ind = population[i].copy()
+
+            for t in range(n_tasks):
+                r = self.rng.random()
+
+                if r < exploration_rate * 0.5:
+                    # Department exploration: random VM assignment
+                    new_ind[t] = int(self.rng.integers(0, n_vms))
+
+                elif r < exploration_rate:
+                    # Cross-department learning: adopt from a random peer
+                    peer = int(self.rng.integers(0, pop_size))
+                    new_ind[t] = population[peer, t]
+
+                elif r < exploration_rate + exploitation_rate * 0.5:
+                    # Management feedback: move toward global best
+                    new_ind[t] = global_best[t]
+
+                else:
+                    # Local refinement: small perturbation
+                    if self.rng.random() < 0.3:
+                        new_ind[t] = int(
+                            (new_ind[t] + int(self.rng.integers(-1, 2)))
+                            % n_vms
+                        )
+
+            new_fit = self.legacy_fitness(new_ind)
+
+            if new_fit < self.fitness_vals[i]:
+                population[i] = new_ind
+                self.fitness_vals[i] = new_fit
 
-        # Initialize population: each individual is a schedule (task→VM)
-        population = [
-            self.rng.integers(0, n_vms, size=n_tasks).tolist()
-            for _ in range(pop_size)
-        ]
-
-        fitness_vals = [self.fitness(ind) for ind in population]
-        best_idx = int(np.argmin(fitness_vals))
-        global_best = list(population[best_idx])
-        global_best_fit = fitness_vals[best_idx]
-
-        convergence = []
-
-        for iteration in range(max_iter):
-            # Adaptive parameters
-            exploration_rate = 1.0 - (iteration / max_iter)
-            exploitation_rate = iteration / max_iter
-
-            for i in range(pop_size):
-                new_ind = list(population[i])
-
-                for t in range(n_tasks):
-                    r = self.rng.random()
-
-                    if r < exploration_rate * 0.5:
-                        # Department exploration: random VM assignment
-                        new_ind[t] = int(self.rng.integers(0, n_vms))
-
-                    elif r < exploration_rate:
-                        # Cross-department learning: adopt from a random peer
-                        peer = int(self.rng.integers(0, pop_size))
-                        new_ind[t] = population[peer][t]
-
-                    elif r < exploration_rate + exploitation_rate * 0.5:
-                        # Management feedback: move toward global best
-                        new_ind[t] = global_best[t]
-
-                    else:
-                        # Local refinement: small perturbation
-                        if self.rng.random() < 0.3:
-                            new_ind[t] = int(
-                                (new_ind[t] + int(self.rng.integers(-1, 2)))
-                                % n_vms
-                            )
-
-                new_fit = self.fitness(new_ind)
-
-                if new_fit < fitness_vals[i]:
-                    population[i] = new_ind
-                    fitness_vals[i] = new_fit
-
-                    if new_fit < global_best_fit:
-                        global_best = list(new_ind)
-                        global_best_fit = new_fit
-
-            convergence.append({
-                "iteration": iteration,
-                "bestFitness": round(global_best_fit, 6),
-                "makespan": round(self.compute_makespan(global_best), 4),
-                "energy": round(self.compute_energy(global_best), 4),
-            })
-
-            # Stream progress to Node.js via stderr
-            self.report_progress(
-                iteration=iteration,
-                max_iterations=max_iter,
-                best_fitness=global_best_fit,
-                makespan=self.compute_makespan(global_best),
-                energy=self.compute_energy(global_best),
-                reliability=self.compute_reliability(global_best),
-                utilization=self.compute_resource_utilization(global_best),
-            )
-
-        return self.build_result(global_best, convergence)
+                if new_fit < self.best_fitness:
+                    global_best[:] = new_ind
+                    self.best_fitness = new_fit
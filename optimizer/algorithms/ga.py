@@ -2,103 +2,117 @@
 Genetic Algorithm (GA)
 =======================
 Standard GA with tournament selection, crossover, and mutation.
+
+Random stream
+-------------
+The default kernel breeds a whole generation at once, drawing in this
+order: tournament uniforms (2 * n_pairs, pop_size) whose ``k`` smallest
+entries pick each tournament's contenders, crossover uniforms and cut
+points (n_pairs,), then mutation uniforms and VMs (2 * n_pairs,
+n_tasks).  ``hyperparameters.legacyKernels`` restores the per-pair loop
+(tournaments, crossover and mutation drawn pair by pair); unlike EDO /
+PSO / WOA this does not replay runs of the original implementation,
+whose mutation drew gene by gene.
 """
 
 import numpy as np
-from .base import BaseOptimizer
+from .base import IterativeOptimizer
+from .checkpoint import SCHEDULES
+
 
+class GAOptimizer(IterativeOptimizer):
 
-class GAOptimizer(BaseOptimizer):
+    crossover_rate = 0.8
+    mutation_rate = 0.1
+    tournament_k = 3
 
-    def run(self) -> dict:
+    supports_islands = True
+    checkpoint_state = {"population": SCHEDULES}
+    snapshot_state = IterativeOptimizer.snapshot_state + ("population", "fitness_vals")
+
+    def _init_search(self):
         pop_size = self.population_size
-        max_iter = self.max_iterations
-        n_tasks = self.task_count
-        n_vms = self.vm_count
-
-        crossover_rate = 0.8
-        mutation_rate = 0.1
-        tournament_k = 3
-
-        # Initialize population
-        population = [
-            self.rng.integers(0, n_vms, size=n_tasks).tolist()
-            for _ in range(pop_size)
-        ]
-        fitness_vals = [self.fitness(ind) for ind in population]
-
-        best_idx = int(np.argmin(fitness_vals))
-        g_best = list(population[best_idx])
-        g_best_fit = fitness_vals[best_idx]
-
-        convergence = []
-
-        for iteration in range(max_iter):
-            new_population = []
-
-            while len(new_population) < pop_size:
-                # Tournament selection
-                p1 = self._tournament(population, fitness_vals, tournament_k)
-                p2 = self._tournament(population, fitness_vals, tournament_k)
-
-                # Crossover
-                if self.rng.random() < crossover_rate:
-                    c1, c2 = self._crossover(p1, p2)
-                else:
-                    c1, c2 = list(p1), list(p2)
-
-                # Mutation
-                c1 = self._mutate(c1, mutation_rate, n_vms)
-                c2 = self._mutate(c2, mutation_rate, n_vms)
-
-                new_population.append(c1)
-                if len(new_population) < pop_size:
-                    new_population.append(c2)
-
-            population = new_population[:pop_size]
-            fitness_vals = [self.fitness(ind) for ind in population]
-
-            best_idx = int(np.argmin(fitness_vals))
-            if fitness_vals[best_idx] < g_best_fit:
-                g_best = list(population[best_idx])
-                g_best_fit = fitness_vals[best_idx]
-
-            convergence.append({
-                "iteration": iteration,
-                "bestFitness": round(g_best_fit, 6),
-                "makespan": round(self.compute_makespan(g_best), 4),
-                "energy": round(self.compute_energy(g_best), 4),
-            })
-
-            # Stream progress to Node.js via stderr
-            self.report_progress(
-                iteration=iteration,
-                max_iterations=max_iter,
-                best_fitness=g_best_fit,
-                makespan=self.compute_makespan(g_best),
-                energy=self.compute_energy(g_best),
-                reliability=self.compute_reliability(g_best),
-                utilization=self.compute_resource_utilization(g_best),
-            )
-
-        return self.build_result(g_best, convergence)
-
-    def _tournament(self, population, fitness_vals, k):
-        indices = self.rng.choice(len(population), size=k, replace=False)
-        best = indices[0]
-        for idx in indices[1:]:
-            if fitness_vals[idx] < fitness_vals[best]:
-                best = idx
-        return list(population[best])
-
-    def _crossover(self, p1, p2):
+
+        # Initialize population; children are bred into a second buffer
+        # of the same shape and the two are swapped every generation.
+        self.n_pairs = (pop_size + 1) // 2
+        self.pop_buf = np.empty(
+            (2 * self.n_pairs, self.task_count), dtype=np.int32
+        )
+        self.child_buf = np.empty_like(self.pop_buf)
+        self.pop_buf[:pop_size] = self._initial_population(pop_size)
+
+        self.population = self.pop_buf[:pop_size]
+        self._score_population()
+
+    def _iterate(self, iteration):
+        self._breed(self.fitness_vals)
+        self.pop_buf, self.child_buf = self.child_buf, self.pop_buf
+        self.population = self.pop_buf[:self.population_size]
+        self.fitness_vals, _ = self.fitness_batch(self.population)
+        self._update_best()
+
+    def _adopt_incumbent(self):
+        """Replace the worst individual with the locally improved best."""
+        self._immigrate(self.best_schedule[None].copy())
+
+    def _breed(self, keys):
+        """
+        Fill ``child_buf`` with offspring of ``population``, selecting
+        parents by tournament on ``keys`` (lower wins).
+        """
+        if self.legacy_kernels:
+            return self._breed_pairs(keys)
+        n_pairs, n_tasks = self.n_pairs, self.task_count
+        contenders = np.argsort(
+            self.rng.random((2 * n_pairs, len(keys))), axis=1
+        )[:, :self.tournament_k]
+        crossover = self.rng.random(n_pairs) < self.crossover_rate
+        points = self.rng.integers(1, max(n_tasks, 2), size=n_pairs)
+        mutate = self.rng.random(self.child_buf.shape) < self.mutation_rate
+        mutation_vms = self.rng.integers(
+            0, self.vm_count, size=self.child_buf.shape, dtype=np.int32
+        )
+        self.kernels.ga_breed(self.population, keys, contenders, crossover,
+                              points, mutate, mutation_vms, self.child_buf)
+
+    def _breed_pairs(self, keys):
+        """Legacy per-pair breeding loop (original random stream)."""
+        population, child_buf = self.population, self.child_buf
+        k_size = self.tournament_k
+
+        for k in range(self.n_pairs):
+            # Tournament selection
+            p1 = population[self._tournament(keys, k_size)]
+            p2 = population[self._tournament(keys, k_size)]
+            c1, c2 = child_buf[2 * k], child_buf[2 * k + 1]
+
+            # Crossover
+            if self.rng.random() < self.crossover_rate:
+                self._crossover(p1, p2, c1, c2)
+            else:
+                c1[:] = p1
+                c2[:] = p2
+
+            # Mutation
+            self._mutate(c1, self.mutation_rate, self.vm_count)
+            self._mutate(c2, self.mutation_rate, self.vm_count)
+
+    def _tournament(self, keys, k):
+        """Index of the lowest-keyed of ``k`` distinct random individuals."""
+        indices = self.rng.choice(len(keys), size=k, replace=False)
+        return int(indices[np.argmin(keys[indices])])
+
+    def _crossover(self, p1, p2, c1, c2):
+        """One-point crossover of ``p1``/``p2`` written into ``c1``/``c2``."""
         point = int(self.rng.integers(1, len(p1)))
-        c1 = p1[:point] + p2[point:]
-        c2 = p2[:point] + p1[point:]
-        return c1, c2
+        c1[:point] = p1[:point]
+        c1[point:] = p2[point:]
+        c2[:point] = p2[:point]
+        c2[point:] = p1[point:]
 
     def _mutate(self, individual, rate, n_vms):
-        for i in range(len(individual)):
-            if self.rng.random() < rate:
-                individual[i] = int(self.rng.integers(0, n_vms))
+        """Reassign each gene to a random VM with probability ``rate``."""
+        mask = self.rng.random(len(individual)) < rate
+        individual[mask] = self.rng.integers(0, n_vms, size=int(mask.sum()))
         return individual
@@ -0,0 +1,91 @@
+"""
+Incremental fitness evaluation
+===============================
+Stateful evaluator for a single schedule that keeps per-VM loads and
+total energy up to date under single-task moves, so local-search style
+algorithms can score a move without re-walking every task.
+
+Moving task ``t`` from VM ``a`` to VM ``b`` is O(1) for loads and
+energy; deriving makespan / reliability / utilization from the loads is
+O(n_vms).
+"""
+
+import numpy as np
+
+
+class IncrementalEvaluator:
+    """
+    Delta evaluator bound to one optimizer's cost model.
+
+    Parameters
+    ----------
+    optimizer : BaseOptimizer
+        Provides the ETC / energy matrices and the objective weights.
+    schedule : array-like[int]
+        Starting task→VM assignment; copied, never mutated.
+    """
+
+    def __init__(self, optimizer, schedule):
+        self.optimizer = optimizer
+        self.etc = optimizer.etc
+        self.energy_matrix = optimizer.energy_matrix
+        self.schedule = np.array(schedule, dtype=np.int32)
+        self._undo = []
+        self.resync()
+
+    def resync(self):
+        """Recompute loads and energy from scratch (clears float drift)."""
+        self.loads = self.optimizer.vm_loads(self.schedule)
+        self.energy = self.optimizer.compute_energy(self.schedule)
+
+    # ── Moves ──────────────────────────────────────────────
+
+    def move(self, task, vm):
+        """Reassign ``task`` to ``vm`` and push the move on the undo stack."""
+        old_vm = int(self.schedule[task])
+        self._undo.append((task, old_vm))
+        self._reassign(task, old_vm, vm)
+
+    def swap(self, task_a, task_b):
+        """Exchange the VMs of two tasks (two undoable moves)."""
+        vm_a, vm_b = int(self.schedule[task_a]), int(self.schedule[task_b])
+        self.move(task_a, vm_b)
+        self.move(task_b, vm_a)
+
+    def undo(self, n=1):
+        """Revert the last ``n`` moves."""
+        for _ in range(n):
+            task, old_vm = self._undo.pop()
+            self._reassign(task, int(self.schedule[task]), old_vm)
+
+    def commit(self):
+        """Forget the undo history, keeping the current schedule."""
+        self._undo.clear()
+
+    def _reassign(self, task, old_vm, new_vm):
+        if old_vm == new_vm:
+            return
+        self.loads[old_vm] -= self.etc[task, old_vm]
+        self.loads[new_vm] += self.etc[task, new_vm]
+        self.energy += (
+            self.energy_matrix[task, new_vm] - self.energy_matrix[task, old_vm]
+        )
+        self.schedule[task] = new_vm
+
+    # ── Objectives ─────────────────────────────────────────
+
+    def objectives(self):
+        """(makespan, energy, reliability, utilization) of the schedule."""
+        return self.optimizer._metrics_from_loads(self.loads, self.energy)
+
+    def fitness(self):
+        """Weighted fitness of the current schedule (lower is better)."""
+        ms, en, rel, _ = self.objectives()
+        return self.optimizer._weighted_fitness(ms, en, rel)
+
+    def move_fitness(self, task, vm):
+        """Fitness the schedule would have after ``move(task, vm)``."""
+        self.move(task, vm)
+        fit = self.fitness()
+        self.undo()
+        return fit
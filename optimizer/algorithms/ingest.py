@@ -0,0 +1,275 @@
+"""
+Streaming config ingestion
+===========================
+Reads an experiment config from a text stream without materialising the
+whole document.  ``workloadConfig.tasks`` and ``vmConfig.vms`` are
+decoded one element at a time straight into compact columns, so each
+task / VM dict is dropped as soon as its fields are copied out.
+Everything else is decoded normally.
+
+The stream is consumed in chunks and every value is decoded by the C
+JSON scanner (``json.JSONDecoder.raw_decode``), so only the current
+chunk and one array element are held as text at any time.
+"""
+
+import json
+import re
+from array import array
+
+from .workload import (
+    TASK_COLUMNS, VM_COLUMNS, Workload, id_key, load_table,
+)
+
+CHUNK_SIZE = 1 << 16
+
+TASKS_PATH = ("workloadConfig", "tasks")
+VMS_PATH = ("vmConfig", "vms")
+STREAMED = {TASKS_PATH: TASK_COLUMNS, VMS_PATH: VM_COLUMNS}
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SEPARATOR = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """
+    Chunked cursor over a text stream.  With ``by_line`` it reads with
+    ``readline`` and treats the end of the current line as the end of
+    input until ``next_line``, so it never blocks on, or buffers, text
+    past the line being parsed.
+    """
+
+    def __init__(self, fp, chunk_size, by_line=False):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.by_line = by_line
+        self.line_end = by_line
+
+    def _fill(self, grow=False):
+        """
+        Append the next chunk, dropping consumed text.  With ``grow`` the
+        read size doubles with the pending text, so re-decoding a large
+        value after each refill stays linear overall.
+        """
+        if self.eof or (self.by_line and self.line_end):
+            return False
+        pending = len(self.buf) - self.pos
+        size = max(self.chunk_size, pending) if grow else self.chunk_size
+        data = (self.fp.readline if self.by_line else self.fp.read)(size)
+        if not data:
+            self.eof = True
+            return False
+        self.line_end = data.endswith("\n")
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def next_line(self):
+        """Line mode: drop the rest of the current line, move to the next."""
+        while self._fill():
+            self.pos = len(self.buf)
+        self.buf, self.pos, self.line_end = "", 0, False
+
+    def peek(self):
+        """Next non-whitespace character, or ``""`` at end of input."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Invalid config JSON: expected '{char}', found "
+                f"'{found or 'end of input'}'"
+            )
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill(grow=True):
+                    continue
+                raise
+            # A number ending exactly at the buffer edge may continue
+            if end == len(self.buf) and self._fill(grow=True):
+                continue
+            self.pos = end
+            return value
+
+
+def _appender(key):
+    """Column for config ``key`` and its append; ids go through ``id_key``."""
+    if key != "id":
+        column = array("d")
+        return column, column.append
+    column = array("q")
+    append = column.append
+
+    def append_id(value):
+        try:
+            append(value)
+        except (TypeError, OverflowError):
+            append(id_key(value))
+    return column, append_id
+
+
+def _stream_rows(reader, spec):
+    """
+    Decode a JSON array of task / VM dicts into ``{config key: array}``
+    columns: the required key plus the optional keys of the first row.
+    """
+    required = spec[0][0]
+    columns = {required: array("d")}
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return columns
+
+    scan = _decoder.scan_once
+    optional = None
+    while True:
+        # Fast path: the row is already buffered and starts at the cursor
+        try:
+            row, reader.pos = scan(reader.buf, reader.pos)
+        except (StopIteration, json.JSONDecodeError):
+            row = reader.value()
+
+        if optional is None:
+            optional = []
+            for key, _ in spec[1:]:
+                if key in row:
+                    columns[key], append = _appender(key)
+                    optional.append((key, append))
+            append_required = columns[required].append
+        try:
+            append_required(row[required])
+        except KeyError:
+            raise ValueError(f"Row without required '{required}': {row}")
+        for key, append in optional:
+            append(row.get(key, 0))
+
+        match = _SEPARATOR.match(reader.buf, reader.pos)
+        if match is not None:
+            sep = match.group(1)
+            reader.pos = match.end()
+        else:
+            sep = reader.peek()
+            reader.pos += 1
+        if sep == "]":
+            return columns
+        if sep != ",":
+            raise ValueError(f"Invalid config JSON: unexpected '{sep}' in array")
+
+
+def _object(reader, path, streamed):
+    """Decode an object, streaming the arrays listed in ``STREAMED``."""
+    reader.expect("{")
+    obj = {}
+    if reader.peek() == "}":
+        reader.pos += 1
+        return obj
+
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise ValueError("Invalid config JSON: object key is not a string")
+        reader.expect(":")
+
+        child = path + (key,)
+        nxt = reader.peek()
+        if child in STREAMED and nxt == "[":
+            streamed[child] = _stream_rows(reader, STREAMED[child])
+            obj[key] = []
+        elif nxt == "{" and any(p[:len(child)] == child for p in STREAMED):
+            obj[key] = _object(reader, child, streamed)
+        else:
+            obj[key] = reader.value()
+
+        sep = reader.peek()
+        reader.pos += 1
+        if sep == "}":
+            return obj
+        if sep != ",":
+            raise ValueError(f"Invalid config JSON: unexpected '{sep}' in object")
+
+
+def _rows(columns):
+    keys = list(columns)
+    return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+
+def read_config(fp, chunk_size=CHUNK_SIZE):
+    """
+    Parse one experiment config from the text stream ``fp``.
+
+    Returns ``(config, workload)``.  When both the task and VM tables
+    are available (streamed inline or via ``tasksFile`` / ``vmsFile``)
+    ``workload`` is a ``Workload`` built from them and the inline lists
+    in ``config`` are left empty; otherwise ``workload`` is ``None`` and
+    ``config`` keeps its inline lists (numbers as floats), so
+    ``BaseOptimizer`` can generate the missing defaults.
+    """
+    return _parse(_Reader(fp, chunk_size))
+
+
+class ConfigStream:
+    """
+    Newline-delimited experiment configs (worker mode), each parsed off
+    ``fp`` as ``read_config`` does.  Only the current line is read, so
+    a request is answered without waiting for the next one, and a
+    malformed line is skipped without affecting the following ones.
+    """
+
+    def __init__(self, fp, chunk_size=CHUNK_SIZE):
+        self.reader = _Reader(fp, chunk_size, by_line=True)
+
+    def next(self):
+        """
+        ``(config, workload)`` of the next non-blank line, or ``None`` at
+        end of input.  Raises ``ValueError`` for a malformed line.
+        """
+        reader = self.reader
+        while True:
+            reader.next_line()
+            if reader.peek() != "":
+                return _parse(reader)
+            if reader.eof:
+                return None
+
+
+def _parse(reader):
+    """One config object, which must be all that is left of the input."""
+    streamed = {}
+    config = _object(reader, (), streamed)
+    if reader.peek() != "":
+        raise ValueError("Invalid config JSON: trailing data after object")
+
+    sources = []
+    for path, spec, file_key in ((TASKS_PATH, TASK_COLUMNS, "tasksFile"),
+                                 (VMS_PATH, VM_COLUMNS, "vmsFile")):
+        columns = streamed.get(path)
+        section = config.get(path[0], {})
+        if section.get(file_key):
+            columns = load_table(section[file_key], spec)
+        elif columns is not None and not len(columns[spec[0][0]]):
+            columns = None
+        sources.append(columns)
+
+    if all(columns is not None for columns in sources):
+        return config, Workload.from_columns(*sources)
+
+    # Defaults needed on one side: hand the inline lists back unchanged
+    for path, columns in streamed.items():
+        config[path[0]][path[1]] = _rows(columns)
+    return config, None
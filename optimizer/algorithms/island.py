@@ -0,0 +1,211 @@
+"""
+Island model
+=============
+Runs several independently seeded copies of a population-based
+optimizer in separate processes.  The parent process coordinates them
+epoch by epoch: every island advances ``migrationInterval`` iterations,
+reports its per-iteration incumbent, and ships its best individuals to
+its neighbours in the migration topology before the next epoch.
+
+Migration is synchronous and routed by the parent, so island runs are
+reproducible for a given seed.
+"""
+
+import multiprocessing
+import traceback
+
+import numpy as np
+
+TOPOLOGIES = ("ring", "fully_connected")
+
+
+def migration_sources(topology, n_islands):
+    """For each island, the islands it receives emigrants from."""
+    if topology == "ring":
+        return [[(i - 1) % n_islands] for i in range(n_islands)]
+    if topology == "fully_connected":
+        return [
+            [j for j in range(n_islands) if j != i] for i in range(n_islands)
+        ]
+    raise ValueError(
+        f"Unknown migrationTopology: {topology} (expected one of {TOPOLOGIES})"
+    )
+
+
+def island_seeds(seed, n_islands):
+    """Independent, reproducible seeds for each island."""
+    children = np.random.SeedSequence(seed).spawn(n_islands)
+    return [int(c.generate_state(1)[0]) for c in children]
+
+
+def _island_main(conn, optimizer_cls, config, workload):
+    """
+    Island process: evolve one sub-population on request.
+
+    Reports its initial incumbent, then receives ``(start, stop,
+    migrants)`` epochs until ``None`` and answers each with the
+    per-iteration incumbent history and emigrants.  History entries are
+    ``(fitness, objectives, schedule)`` where ``schedule`` is ``None``
+    while the incumbent is unchanged.  The history is cut short once the
+    island's own ``timeBudgetMs`` is spent.
+    """
+    try:
+        optimizer = optimizer_cls(config, workload)
+        optimizer._start_search()
+        conn.send(_status(optimizer, []))
+        sent_fitness = optimizer.best_fitness
+
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+
+            start, stop, migrants = message
+            if migrants is not None:
+                optimizer._immigrate(migrants)
+
+            history = []
+            for iteration in range(start, stop):
+                if optimizer.deadline_reason() is not None:
+                    break
+                optimizer._iterate(iteration)
+                optimizer._polish_incumbent()
+                changed = optimizer.best_fitness != sent_fitness
+                history.append((
+                    optimizer.best_fitness, optimizer._best_objectives(),
+                    optimizer.best_schedule.copy() if changed else None,
+                ))
+                sent_fitness = optimizer.best_fitness
+
+            reply = _status(optimizer, history)
+            reply["emigrants"] = optimizer._emigrants(optimizer.migration_size)
+            conn.send(reply)
+    except Exception:
+        conn.send({"error": traceback.format_exc()})
+    finally:
+        conn.close()
+
+
+def _status(optimizer, history):
+    return {
+        "history": history,
+        "best": optimizer.best_schedule,
+        "bestFitness": optimizer.best_fitness,
+        "evaluations": optimizer.evaluations,
+        "cacheHits": optimizer.cache_hits,
+        "cacheMisses": optimizer.cache_misses,
+        "pareto": optimizer.pareto.points,
+    }
+
+
+def _receive(conns, optimizer):
+    """Replies of every island, with their counters and archives merged."""
+    replies = [conn.recv() for conn in conns]
+    for reply in replies:
+        if "error" in reply:
+            raise RuntimeError(f"Island failed:\n{reply['error']}")
+
+    optimizer.evaluations = sum(r["evaluations"] for r in replies)
+    optimizer.cache_hits = sum(r["cacheHits"] for r in replies)
+    optimizer.cache_misses = sum(r["cacheMisses"] for r in replies)
+    for reply in replies:
+        optimizer.pareto.add(reply["pareto"])
+    return replies
+
+
+def run_islands(optimizer):
+    """
+    Island-model ``run()`` for ``optimizer`` (an ``IterativeOptimizer``).
+
+    The combined convergence history takes, at every iteration, the best
+    incumbent over all islands and is streamed through
+    ``optimizer.report_progress`` as epochs complete.  Termination
+    criteria are applied to that combined history, with evaluations
+    summed over islands and their Pareto archives merged; the reported
+    schedule is the combined incumbent at the last recorded iteration.
+    """
+    n_islands = optimizer.islands
+    sources = migration_sources(optimizer.migration_topology, n_islands)
+    hp = dict(optimizer.config.get("hyperparameters", {}), islands=1)
+
+    ctx = multiprocessing.get_context()
+    conns, procs = [], []
+    for seed in island_seeds(optimizer.seed, n_islands):
+        config = dict(optimizer.config, seed=seed, hyperparameters=hp)
+        parent_conn, child_conn = ctx.Pipe()
+        proc = ctx.Process(
+            target=_island_main,
+            args=(child_conn, type(optimizer), config, optimizer.workload),
+            daemon=True,
+        )
+        proc.start()
+        child_conn.close()
+        conns.append(parent_conn)
+        procs.append(proc)
+
+    convergence = []
+    best_history = []
+    migrants = [None] * n_islands
+    optimizer.stop_reason = "maxIterations"
+    try:
+        # Initial incumbents, reported if no iteration gets recorded
+        replies = _receive(conns, optimizer)
+        current = [reply["best"] for reply in replies]
+        winner = min(range(n_islands), key=lambda i: replies[i]["bestFitness"])
+        optimizer.best_schedule = current[winner]
+        optimizer.best_fitness = replies[winner]["bestFitness"]
+
+        start = 0
+        while start < optimizer.max_iterations:
+            stop = min(start + optimizer.migration_interval,
+                       optimizer.max_iterations)
+            for conn, incoming in zip(conns, migrants):
+                conn.send((start, stop, incoming))
+            replies = _receive(conns, optimizer)
+
+            # Islands stop early on their own time budget
+            completed = min(len(reply["history"]) for reply in replies)
+            reason = None
+            for offset, iteration in enumerate(range(start, start + completed)):
+                entries = [reply["history"][offset] for reply in replies]
+                for i, (_, _, schedule) in enumerate(entries):
+                    if schedule is not None:
+                        current[i] = schedule
+                winner = min(range(n_islands), key=lambda i: entries[i][0])
+                best_fit, objectives, _ = entries[winner]
+                # The incumbent as of this iteration, not the epoch's end
+                optimizer.best_schedule = current[winner]
+                optimizer.best_fitness = best_fit
+
+                optimizer._record_iteration(
+                    iteration, best_fit, objectives, convergence
+                )
+                best_history.append(best_fit)
+                reason = optimizer.termination_reason(best_history)
+                if reason is not None:
+                    break
+
+            if reason is None and completed < stop - start:
+                reason = optimizer.deadline_reason() or "timeBudget"
+            if reason is not None:
+                optimizer.stop_reason = reason
+                break
+
+            migrants = [
+                np.concatenate([replies[j]["emigrants"] for j in src])
+                for src in sources
+            ]
+            start = stop
+    finally:
+        for conn in conns:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+
+    optimizer.iterations_completed = len(convergence)
+    return optimizer.build_result(optimizer.best_schedule, convergence)
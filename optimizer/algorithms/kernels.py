@@ -0,0 +1,148 @@
+"""
+Kernel backends
+================
+The inner loops shared by the optimizers — batch fitness accumulation,
+EDO's per-gene branching, GA tournament / crossover / mutation and the
+Min-Min selection loop — behind one interface with two
+implementations:
+
+* ``"numpy"``: the array formulations in this module (always present);
+* ``"numba"``: the explicit loops of ``algorithms.loops`` compiled with
+  ``numba.njit(cache=True)``, used when Numba is installed.
+
+``hyperparameters.kernelBackend`` selects ``"auto"`` (default), ``"numpy"``
+or ``"numba"``.  ``"auto"`` uses Numba when it is installed and the
+problem is large enough — ``n_tasks * max(populationSize, n_vms)`` of at
+least ``NUMBA_MIN_WORK`` — to repay importing it, and NumPy otherwise.
+Kernels consume random arrays drawn by the caller, so both backends
+follow the same random stream and produce the same schedules.  Batch
+energies may differ in the last bits because NumPy sums pairwise, so
+NSGA-II ranks objectives rounded as in ``algorithms.pareto``.
+
+Numba is only detected at import (``find_spec``).  Optimizers resolve
+their backend on their first kernel call, so Numba is imported and the
+kernels compiled only when a run actually uses them.  Compiled code is
+cached on disk (next to the module or under ``NUMBA_CACHE_DIR``), so
+later processes — ``main.py`` runs, workers, pool processes — load it
+instead of recompiling.
+"""
+
+import importlib.util
+from types import SimpleNamespace
+
+import numpy as np
+
+from .constructive import min_min
+
+BACKENDS = ("auto", "numpy", "numba")
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Smallest n_tasks * max(populationSize, n_vms) for which "auto" picks Numba
+NUMBA_MIN_WORK = 100_000
+
+
+def loads_energy(population, etc, energy_matrix, n_vms):
+    """
+    Per-VM loads (pop_size, n_vms) and total energy (pop_size,) of
+    every row of an integer ``population``, accumulated with a single
+    offset ``np.bincount`` (row ``i`` scatters into bins
+    ``i * n_vms .. (i + 1) * n_vms - 1``).
+    """
+    pop_size, n_tasks = population.shape
+    rows = np.arange(n_tasks)
+    offsets = population + (np.arange(pop_size)[:, None] * n_vms)
+    loads = np.bincount(
+        offsets.ravel(),
+        weights=etc[rows, population].ravel(),
+        minlength=pop_size * n_vms,
+    ).reshape(pop_size, n_vms)
+    energy = energy_matrix[rows, population].sum(axis=1)
+    return loads, energy
+
+
+def edo_propose(population, candidates, global_best, r, rand_vm, peers,
+                refine, step, exploration_rate, exploitation_rate, n_vms):
+    """
+    EDO department / management update of every gene into
+    ``candidates`` from the uniforms ``r`` and the other per-gene draws.
+    """
+    explore = r < exploration_rate * 0.5
+    cross = ~explore & (r < exploration_rate)
+    manage = (
+        ~(explore | cross)
+        & (r < exploration_rate + exploitation_rate * 0.5)
+    )
+    local = ~(explore | cross | manage) & refine
+
+    candidates[:] = population
+    # Department exploration: random VM assignment
+    candidates[explore] = rand_vm[explore]
+    # Cross-department learning: adopt from a random peer
+    _, task_cols = np.nonzero(cross)
+    candidates[cross] = population[peers[cross], task_cols]
+    # Management feedback: move toward global best
+    _, task_cols = np.nonzero(manage)
+    candidates[manage] = global_best[task_cols]
+    # Local refinement: small perturbation
+    candidates[local] = (population[local] + step[local]) % n_vms
+
+
+def ga_breed(population, keys, contenders, crossover, points, mutate,
+             mutation_vms, children):
+    """
+    GA offspring into ``children`` (2 * n_pairs rows).
+
+    Tournament ``j`` is won by the lowest-keyed of ``contenders[j]``
+    (first on ties); pair ``k`` has parents from tournaments ``2k`` and
+    ``2k + 1``, exchanges tails from ``points[k]`` if ``crossover[k]``,
+    and genes flagged in ``mutate`` take ``mutation_vms``.
+    """
+    winners = np.take_along_axis(
+        contenders, np.argmin(keys[contenders], axis=1)[:, None], axis=1
+    )[:, 0]
+    p1, p2 = population[winners[0::2]], population[winners[1::2]]
+    tail = (np.arange(population.shape[1])[None, :] >= points[:, None])
+    swap = crossover[:, None] & tail
+    children[0::2] = np.where(swap, p2, p1)
+    children[1::2] = np.where(swap, p1, p2)
+    np.copyto(children, mutation_vms, where=mutate)
+
+
+NUMPY = SimpleNamespace(
+    name="numpy",
+    loads_energy=loads_energy,
+    edo_propose=edo_propose,
+    ga_breed=ga_breed,
+    min_min=min_min,
+)
+
+_numba = None
+
+
+def check(name):
+    """Validate the ``kernelBackend`` ``name`` (without importing Numba)."""
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown kernelBackend: {name} (expected one of {BACKENDS})"
+        )
+    if name == "numba" and not NUMBA_AVAILABLE:
+        raise ValueError("kernelBackend 'numba' requires the numba package")
+    return name
+
+
+def get(name="auto", work=None):
+    """
+    Kernel namespace for the ``kernelBackend`` ``name``; ``work`` is the
+    problem size ``"auto"`` compares with ``NUMBA_MIN_WORK`` (unknown =
+    large).
+    """
+    global _numba
+    check(name)
+    if name == "numpy" or (name == "auto" and (
+            not NUMBA_AVAILABLE
+            or (work is not None and work < NUMBA_MIN_WORK))):
+        return NUMPY
+    if _numba is None:
+        from . import loops
+        _numba = loops.backend(jit=True)
+    return _numba
@@ -0,0 +1,204 @@
+"""
+Memetic local search
+=====================
+Deterministic hill climbing on a single schedule, usable after (and
+optionally during) any algorithm in ``ALGORITHM_MAP``:
+
+* **move** — reassign one task of the makespan-critical (most loaded) VM
+  to any other VM;
+* **swap** — exchange a task of the most loaded VM with a task of the
+  least loaded one.
+
+Every candidate is scored from the current per-VM loads in O(1): only
+the two touched VMs change, and the maximum / minimum load of the
+untouched VMs come from the three largest / smallest loads.  All
+candidates of a step are scored in one vectorised pass, the best
+improving one is applied through an ``IncrementalEvaluator``, and the
+climb stops at a local optimum or after ``localSearchMoves`` moves.
+
+Selected with ``hyperparameters.localSearch``:
+
+    "none"        no local search (default)
+    "final"       polish the reported schedule once
+    "iteration"   also polish the incumbent after every iteration of an
+                  iterative optimizer
+
+The result ``logs`` report the moves made, the fitness improvement and
+the improvement per second spent in local search.
+"""
+
+import time
+
+import numpy as np
+
+LOCAL_SEARCH_MODES = ("none", "final", "iteration")
+DEFAULT_MAX_MOVES = 100
+
+# Swaps consider at most this many tasks from each of the two VMs
+SWAP_CANDIDATES = 256
+
+# Minimum fitness decrease for a move to count as an improvement
+_TOLERANCE = 1e-9
+
+
+def _extremes(loads, k=3):
+    """
+    Indices and values of the ``k`` largest and ``k`` smallest loads,
+    padded with -inf / +inf when there are fewer than ``k`` VMs.
+    """
+    order = np.argsort(loads, kind="stable")
+    pad = max(0, k - len(loads))
+    top = np.concatenate((order[::-1][:k], np.full(pad, -1)))
+    bottom = np.concatenate((order[:k], np.full(pad, -1)))
+    top_vals = np.concatenate((loads[top[:k - pad]], np.full(pad, -np.inf)))
+    bottom_vals = np.concatenate((loads[bottom[:k - pad]], np.full(pad, np.inf)))
+    return top, top_vals, bottom, bottom_vals
+
+
+def _first_excluding(indices, values, a, b):
+    """First of ``values`` whose VM is neither ``a`` nor ``b`` (broadcast)."""
+    out = values[-1] * np.ones(np.broadcast(a, b).shape)
+    for vm, value in zip(indices[::-1], values[::-1]):
+        out = np.where((vm != a) & (vm != b), value, out)
+    return out
+
+
+class LocalSearch:
+    """
+    Hill climber bound to one optimizer's cost model and weights, with
+    running totals over every ``improve`` call.
+
+    Parameters
+    ----------
+    optimizer : BaseOptimizer
+    max_moves : int
+        Moves applied per ``improve`` call at most.
+    """
+
+    def __init__(self, optimizer, max_moves=DEFAULT_MAX_MOVES):
+        self.optimizer = optimizer
+        self.max_moves = max(1, int(max_moves))
+        self.calls = 0
+        self.moves = 0
+        self.improvement = 0.0
+        self.seconds = 0.0
+
+    def improve(self, schedule):
+        """
+        Hill-climb from ``schedule`` (not mutated).  Returns
+        ``(schedule, fitness)`` of the local optimum reached.
+        """
+        start = time.perf_counter()
+        state = self.optimizer.incremental_evaluator(schedule)
+        initial = fitness = state.fitness()
+
+        moves = 0
+        while moves < self.max_moves:
+            step = self._best_step(state)
+            if step is None or step[0] >= fitness - _TOLERANCE:
+                break
+            for task, vm in step[1]:
+                state.move(task, vm)
+            state.commit()
+            fitness = step[0]
+            moves += 1
+
+        # Rescore from scratch so the reported fitness has no drift
+        state.resync()
+        fitness = state.fitness()
+
+        self.calls += 1
+        self.moves += moves
+        self.improvement += initial - fitness
+        self.seconds += time.perf_counter() - start
+        return state.schedule, fitness
+
+    def log_line(self):
+        """Summary for the result ``logs``."""
+        rate = self.improvement / self.seconds if self.seconds > 0 else 0.0
+        return (
+            f"localSearch: calls={self.calls} moves={self.moves} "
+            f"improvement={self.improvement:.6f} seconds={self.seconds:.4f} "
+            f"improvementPerSecond={rate:.3f}"
+        )
+
+    # ── Candidate scoring ──────────────────────────────────
+
+    def _best_step(self, state):
+        """
+        ``(fitness, [(task, vm), ...])`` of the best move or swap, or
+        ``None`` when there is no candidate.
+        """
+        loads, etc = state.loads, state.etc
+        if len(loads) < 2:
+            return None
+        heavy = int(np.argmax(loads))
+        light = int(np.argmin(loads))
+        steps = []
+
+        # Move a task off the critical VM to any other VM
+        on_heavy = np.flatnonzero(state.schedule == heavy)
+        if len(on_heavy):
+            targets = np.arange(len(loads))
+            new_heavy = loads[heavy] - etc[on_heavy, heavy]
+            new_target = loads[targets] + etc[on_heavy][:, targets]
+            d_energy = (state.energy_matrix[on_heavy][:, targets]
+                        - state.energy_matrix[on_heavy, heavy][:, None])
+            fits = self._fitness_after(state, heavy, targets[None, :],
+                                       new_heavy[:, None], new_target, d_energy)
+            fits[:, heavy] = np.inf
+            t, vm = np.unravel_index(np.argmin(fits), fits.shape)
+            steps.append((fits[t, vm], [(int(on_heavy[t]), int(vm))]))
+
+        # Swap a task of the heaviest VM with one of the lightest
+        on_light = np.flatnonzero(state.schedule == light)
+        if heavy != light and len(on_heavy) and len(on_light):
+            on_heavy = self._largest(on_heavy, etc[on_heavy, heavy])
+            on_light = self._largest(on_light, -etc[on_light, light])
+            new_heavy = (loads[heavy] - etc[on_heavy, heavy][:, None]
+                         + etc[on_light, heavy][None, :])
+            new_light = (loads[light] - etc[on_light, light][None, :]
+                         + etc[on_heavy, light][:, None])
+            energy = state.energy_matrix
+            d_energy = (energy[on_heavy, light][:, None]
+                        - energy[on_heavy, heavy][:, None]
+                        + energy[on_light, heavy][None, :]
+                        - energy[on_light, light][None, :])
+            fits = self._fitness_after(state, heavy, light,
+                                       new_heavy, new_light, d_energy)
+            a, b = np.unravel_index(np.argmin(fits), fits.shape)
+            steps.append((fits[a, b], [(int(on_heavy[a]), light),
+                                       (int(on_light[b]), heavy)]))
+
+        return min(steps, key=lambda step: step[0]) if steps else None
+
+    @staticmethod
+    def _largest(tasks, keys):
+        """The ``SWAP_CANDIDATES`` tasks with the largest ``keys``."""
+        if len(tasks) <= SWAP_CANDIDATES:
+            return tasks
+        return tasks[np.argpartition(-keys, SWAP_CANDIDATES)[:SWAP_CANDIDATES]]
+
+    def _fitness_after(self, state, a, b, new_a, new_b, d_energy):
+        """
+        Weighted fitness after VMs ``a`` and ``b`` take the loads
+        ``new_a`` / ``new_b`` and energy changes by ``d_energy`` (all
+        broadcast together), mirroring ``_metrics_from_loads``.
+        """
+        loads = state.loads
+        n_vms = len(loads)
+        top, top_vals, bottom, bottom_vals = _extremes(loads)
+        rest_max = _first_excluding(top, top_vals, a, b)
+        rest_min = _first_excluding(bottom, bottom_vals, a, b)
+
+        makespan = np.maximum(rest_max, np.maximum(new_a, new_b))
+        low = np.minimum(rest_min, np.minimum(new_a, new_b))
+        total = loads.sum() + (new_a - loads[a]) + np.where(
+            a == b, 0.0, new_b - loads[b]
+        )
+        avg = np.where(total > 0, total, 1.0) / n_vms
+        imbalance = np.maximum(makespan - avg, avg - low) / avg
+        reliability = np.maximum(0.0, 1.0 - imbalance)
+        return self.optimizer._weighted_fitness(
+            makespan, state.energy + d_energy, reliability
+        )
@@ -0,0 +1,133 @@
+"""
+Loop kernels
+=============
+Explicit-loop versions of the ``algorithms.kernels`` interface, written
+in the subset of Python Numba compiles.  ``backend(jit=True)`` compiles
+them into the ``"numba"`` backend; ``backend(jit=False)`` runs them as
+plain (slow) Python, which is how the tests check them against the
+NumPy kernels without Numba installed.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from .constructive import POLL_INTERVAL, _complete_mct, _polled
+
+
+def loads_energy(population, etc, energy_matrix, n_vms):
+    pop_size, n_tasks = population.shape
+    loads = np.zeros((pop_size, n_vms))
+    energy = np.zeros(pop_size)
+    for i in range(pop_size):
+        total = 0.0
+        for t in range(n_tasks):
+            vm = population[i, t]
+            loads[i, vm] += etc[t, vm]
+            total += energy_matrix[t, vm]
+        energy[i] = total
+    return loads, energy
+
+
+def edo_propose(population, candidates, global_best, r, rand_vm, peers,
+                refine, step, exploration_rate, exploitation_rate, n_vms):
+    pop_size, n_tasks = population.shape
+    for i in range(pop_size):
+        for t in range(n_tasks):
+            x = r[i, t]
+            if x < exploration_rate * 0.5:
+                candidates[i, t] = rand_vm[i, t]
+            elif x < exploration_rate:
+                candidates[i, t] = population[peers[i, t], t]
+            elif x < exploration_rate + exploitation_rate * 0.5:
+                candidates[i, t] = global_best[t]
+            elif refine[i, t]:
+                candidates[i, t] = (population[i, t] + step[i, t]) % n_vms
+            else:
+                candidates[i, t] = population[i, t]
+
+
+def ga_breed(population, keys, contenders, crossover, points, mutate,
+             mutation_vms, children):
+    n_tasks = population.shape[1]
+    winners = np.empty(len(contenders), dtype=np.int64)
+    for j in range(len(contenders)):
+        winner = contenders[j, 0]
+        for c in range(1, contenders.shape[1]):
+            if keys[contenders[j, c]] < keys[winner]:
+                winner = contenders[j, c]
+        winners[j] = winner
+
+    for k in range(len(points)):
+        p1, p2 = winners[2 * k], winners[2 * k + 1]
+        for t in range(n_tasks):
+            swap = crossover[k] and t >= points[k]
+            children[2 * k, t] = population[p2 if swap else p1, t]
+            children[2 * k + 1, t] = population[p1 if swap else p2, t]
+    for i in range(children.shape[0]):
+        for t in range(n_tasks):
+            if mutate[i, t]:
+                children[i, t] = mutation_vms[i, t]
+
+
+def min_min_steps(etc, order, ptr, assigned, ready, schedule, steps):
+    """
+    Advance Min-Min by ``steps`` assignments, updating the state arrays
+    in place (the pointer scheme of ``constructive.min_min``).
+    """
+    n_tasks, n_vms = etc.shape
+    for _ in range(steps):
+        best_ct = np.inf
+        task = -1
+        vm = -1
+        for v in range(n_vms):
+            cand = order[ptr[v], v]
+            ct = ready[v] + etc[cand, v]
+            if ct < best_ct or (ct == best_ct and cand < task):
+                best_ct = ct
+                task = cand
+                vm = v
+
+        schedule[task] = vm
+        assigned[task] = True
+        ready[vm] = best_ct
+
+        for v in range(n_vms):
+            while ptr[v] < n_tasks and assigned[order[ptr[v], v]]:
+                ptr[v] += 1
+
+
+def backend(jit=True):
+    """Kernel namespace of these loops, compiled with Numba if ``jit``."""
+    kernels = {
+        "loads_energy": loads_energy,
+        "edo_propose": edo_propose,
+        "ga_breed": ga_breed,
+        "min_min_steps": min_min_steps,
+    }
+    if jit:
+        import numba
+        kernels = {name: numba.njit(cache=True, nogil=True)(fn)
+                   for name, fn in kernels.items()}
+    steps = kernels.pop("min_min_steps")
+
+    def min_min(etc, should_stop=None):
+        """``constructive.min_min`` with the selection loop compiled."""
+        n_tasks, n_vms = etc.shape
+        etc = np.ascontiguousarray(etc)
+        schedule = np.zeros(n_tasks, dtype=np.int32)
+        assigned = np.zeros(n_tasks, dtype=np.bool_)
+        ready = np.zeros(n_vms)
+        order = np.argsort(etc, axis=0, kind="stable")
+        ptr = np.zeros(n_vms, dtype=np.intp)
+
+        for start in range(0, n_tasks, POLL_INTERVAL):
+            if _polled(should_stop, start):
+                return _complete_mct(etc, schedule,
+                                     np.flatnonzero(~assigned), ready)
+            steps(etc, order, ptr, assigned, ready, schedule,
+                  min(POLL_INTERVAL, n_tasks - start))
+        return schedule
+
+    return SimpleNamespace(name="numba" if jit else "python",
+                           min_min=min_min, **kernels)
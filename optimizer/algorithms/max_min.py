@@ -6,62 +6,18 @@ that yields its minimum completion time.
 """
 
 from .base import BaseOptimizer
+from .constructive import max_min
 
 
 class MaxMinScheduler(BaseOptimizer):
 
     def run(self) -> dict:
-        n_tasks = self.task_count
-        n_vms = self.vm_count
-
-        schedule = [0] * n_tasks
-        assigned = [False] * n_tasks
-        vm_ready = [0.0] * n_vms
-
-        for _ in range(n_tasks):
-            best_task = -1
-            best_vm = -1
-            max_min_ct = -1.0
-
-            for t in range(n_tasks):
-                if assigned[t]:
-                    continue
-
-                # Find the VM that gives minimum completion time for this task
-                local_best_vm = 0
-                local_best_ct = float("inf")
-                for v in range(n_vms):
-                    exec_time = self.tasks[t]["length"] / self.vms[v]["mips"]
-                    ct = vm_ready[v] + exec_time
-                    if ct < local_best_ct:
-                        local_best_ct = ct
-                        local_best_vm = v
-
-                # Pick the task whose minimum CT is the maximum
-                if local_best_ct > max_min_ct:
-                    max_min_ct = local_best_ct
-                    best_task = t
-                    best_vm = local_best_vm
-
-            schedule[best_task] = best_vm
-            assigned[best_task] = True
-            vm_ready[best_vm] = max_min_ct
-
-        convergence = [{
-            "iteration": 0,
-            "bestFitness": round(self.fitness(schedule), 6),
-            "makespan": round(self.compute_makespan(schedule), 4),
-            "energy": round(self.compute_energy(schedule), 4),
-        }]
-
-        self.report_progress(
-            iteration=0,
-            max_iterations=1,
-            best_fitness=self.fitness(schedule),
-            makespan=self.compute_makespan(schedule),
-            energy=self.compute_energy(schedule),
-            reliability=self.compute_reliability(schedule),
-            utilization=self.compute_resource_utilization(schedule),
+        schedule = max_min(
+            self.etc[:self.task_count, :self.vm_count],
+            should_stop=lambda: self.deadline_reason() is not None,
         )
+        self.stop_reason = self.deadline_reason()
+        if self.stop_reason is not None:
+            self.iterations_completed = 1
 
-        return self.build_result(schedule, convergence)
+        return self._single_pass_result(schedule)
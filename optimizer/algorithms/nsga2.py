@@ -0,0 +1,98 @@
+"""
+NSGA-II
+========
+Multi-objective GA that searches the (makespan, energy, reliability)
+trade-off directly instead of the weighted-sum fitness, so one run
+yields the whole front (``paretoPoints``) rather than one point per
+``weights`` setting.
+
+Offspring are bred with the GA operators, with binary tournaments won
+by lower non-domination rank and then larger crowding distance.
+Parents and offspring are ranked together by fast non-dominated sort
+and the best ``populationSize`` survive, the last admitted front
+truncated by crowding distance.  The reported schedule is still the
+weighted-fitness best, so ``weights`` only picks the headline point.
+"""
+
+import numpy as np
+from .ga import GAOptimizer
+from .pareto import DECIMALS, crowding_distance, nondominated_sort
+
+# makespan and energy are minimised, reliability maximised
+_SIGNS = np.array([1.0, 1.0, -1.0])
+
+
+def _signed(objectives):
+    """
+    Minimisation objectives for ranking, rounded like ``ParetoArchive``
+    so last-bit summation differences (e.g. between kernel backends)
+    cannot change dominance or crowding.
+    """
+    return np.round(objectives[:, :3], DECIMALS) * _SIGNS
+
+
+class NSGA2Optimizer(GAOptimizer):
+
+    tournament_k = 2
+
+    # Migration ranks by the weighted fitness, which NSGA-II does not use
+    supports_islands = False
+
+    snapshot_state = GAOptimizer.snapshot_state + ("objectives", "selection_keys")
+
+    def _score_population(self):
+        # Rank from the objectives just scored instead of evaluating again
+        objectives = super()._score_population()
+        self._rank_population(objectives)
+        return objectives
+
+    def _adopt_incumbent(self):
+        super()._adopt_incumbent()
+        self._rank_population()
+
+    def _rank_population(self, objectives=None):
+        """
+        Objectives and selection keys of the current population, from its
+        ``evaluate_batch`` ``objectives`` if already known.
+        """
+        if objectives is None:
+            objectives = self.evaluate_batch(self.population)
+        self.objectives = _signed(objectives)
+        ranks = nondominated_sort(self.objectives)
+        self.selection_keys = self._selection_keys(
+            ranks, crowding_distance(self.objectives, ranks)
+        )
+
+    def _iterate(self, iteration):
+        pop_size = self.population_size
+        self._breed(self.selection_keys)
+        children = self.child_buf[:pop_size]
+        child_fits, child_objs = self.fitness_batch(children)
+
+        union = np.concatenate((self.population, children))
+        union_fits = np.concatenate((self.fitness_vals, child_fits))
+        union_objs = np.concatenate(
+            (self.objectives, _signed(child_objs))
+        )
+
+        # Environmental selection: by front, then most isolated first
+        ranks = nondominated_sort(union_objs)
+        crowding = crowding_distance(union_objs, ranks)
+        survivors = np.lexsort((-crowding, ranks))[:pop_size]
+
+        self.population[:] = union[survivors]
+        self.fitness_vals = union_fits[survivors]
+        self.objectives = union_objs[survivors]
+        self.selection_keys = self._selection_keys(
+            ranks[survivors], crowding[survivors]
+        )
+        self._update_best()
+
+    @staticmethod
+    def _selection_keys(ranks, crowding):
+        """
+        Scalar keys ordering by rank, then by crowding distance
+        (descending): ``rank + 1 / (1 + crowding)`` lies in
+        ``(rank, rank + 1]`` and boundary points score exactly ``rank``.
+        """
+        return ranks + 1.0 / (1.0 + crowding)
@@ -0,0 +1,84 @@
+"""
+Packed result encoding
+=======================
+With ``"outputFormat": "packed"`` in the experiment config, the bulky
+per-task and per-iteration series of a result are emitted as
+base64-encoded little-endian column blocks instead of lists of JSON
+objects:
+
+    {"format": "packed", "length": n,
+     "columns": {"vmId": {"dtype": "int32", "data": "<base64>"}, ...}}
+
+Schedule blocks only carry ``vmId``: ``taskId`` is the row index and
+start / end times are 0, exactly as in the JSON form.  Convergence
+blocks carry ``iteration`` (int32) and ``bestFitness`` / ``makespan`` /
+``energy`` (float64, so the rounded JSON values survive unchanged).
+
+``pack_array`` / ``unpack_array`` encode a single n-d array the same
+way (plus its ``shape``) for checkpoints.
+"""
+
+import base64
+
+import numpy as np
+
+OUTPUT_FORMATS = ("json", "packed")
+
+DTYPES = {"int32": "<i4", "int64": "<i8", "float32": "<f4", "float64": "<f8"}
+
+
+def pack_columns(columns, length):
+    """
+    Encode ``{name: (dtype, values)}`` columns of ``length`` rows into
+    a packed block.
+    """
+    packed = {}
+    for name, (dtype, values) in columns.items():
+        arr = np.ascontiguousarray(values, dtype=DTYPES[dtype])
+        packed[name] = {
+            "dtype": dtype,
+            "data": base64.b64encode(arr.tobytes()).decode("ascii"),
+        }
+    return {"format": "packed", "length": length, "columns": packed}
+
+
+def unpack_columns(block):
+    """Decode a packed block into ``{name: ndarray}``."""
+    return {
+        name: np.frombuffer(base64.b64decode(col["data"]),
+                            dtype=DTYPES[col["dtype"]])
+        for name, col in block["columns"].items()
+    }
+
+
+def pack_array(values):
+    """Encode an int32 / int64 / float32 / float64 array of any shape."""
+    arr = np.asarray(values)
+    dtype = arr.dtype.name
+    return {
+        "dtype": dtype,
+        "shape": list(arr.shape),
+        "data": base64.b64encode(
+            np.ascontiguousarray(arr, dtype=DTYPES[dtype]).tobytes()
+        ).decode("ascii"),
+    }
+
+
+def unpack_array(block):
+    """Decode a ``pack_array`` block (a read-only view of the bytes)."""
+    arr = np.frombuffer(base64.b64decode(block["data"]),
+                        dtype=DTYPES[block["dtype"]])
+    return arr.reshape(block["shape"])
+
+
+def pack_schedule(schedule):
+    return pack_columns({"vmId": ("int32", schedule)}, len(schedule))
+
+
+def pack_convergence(convergence):
+    return pack_columns({
+        "iteration": ("int32", [p["iteration"] for p in convergence]),
+        "bestFitness": ("float64", [p["bestFitness"] for p in convergence]),
+        "makespan": ("float64", [p["makespan"] for p in convergence]),
+        "energy": ("float64", [p["energy"] for p in convergence]),
+    }, len(convergence))
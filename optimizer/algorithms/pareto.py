@@ -0,0 +1,171 @@
+"""
+Pareto utilities
+=================
+Non-dominated filtering and ranking over objective arrays where every
+column is minimised, plus the bounded external archive each optimizer
+keeps of the (makespan, energy, reliability) trade-offs it has seen.
+
+Two objectives use a sort-and-sweep in O(n log n); more objectives use
+a vectorised dominance matrix and Deb's fast non-dominated sort, which
+at archive / population sizes (a few hundred rows) costs microseconds.
+"""
+
+import numpy as np
+
+DEFAULT_ARCHIVE_SIZE = 100
+
+# Archive columns and whether each is maximised
+OBJECTIVES = ("makespan", "energy", "reliability")
+_SIGNS = np.array([1.0, 1.0, -1.0])
+# Points are compared as reported, so summation noise in otherwise equal
+# objectives cannot keep dominated points alive
+DECIMALS = 4
+
+
+def _nondominated_2d(points):
+    """Sweep in lexicographic order, keeping rows that lower the running min."""
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    second = points[order, 1]
+    best_before = np.minimum.accumulate(np.concatenate(([np.inf], second[:-1])))
+    mask = np.zeros(len(points), dtype=bool)
+    mask[order[second < best_before]] = True
+    return mask
+
+
+def dominance_matrix_between(a, b):
+    """``D[i, j]`` is True when row ``a[i]`` dominates row ``b[j]``."""
+    le = (a[:, None, :] <= b[None, :, :]).all(axis=2)
+    lt = (a[:, None, :] < b[None, :, :]).any(axis=2)
+    return le & lt
+
+
+def dominance_matrix(points):
+    """``D[i, j]`` is True when row ``i`` dominates row ``j``."""
+    return dominance_matrix_between(points, points)
+
+
+def nondominated(points):
+    """
+    Boolean mask of the non-dominated rows of ``points`` (n, m).
+    Exact duplicates keep only their first occurrence.
+    """
+    points = np.asarray(points, dtype=float)
+    if len(points) <= 1:
+        return np.ones(len(points), dtype=bool)
+    if points.shape[1] == 2:
+        return _nondominated_2d(points)
+
+    _, first = np.unique(points, axis=0, return_index=True)
+    mask = np.zeros(len(points), dtype=bool)
+    mask[first] = True
+    unique = points[first]
+    mask[first] = ~dominance_matrix(unique).any(axis=0)
+    return mask
+
+
+def nondominated_sort(points):
+    """
+    Front index of every row of ``points`` (0 = non-dominated), by
+    repeatedly peeling the rows no remaining row dominates.
+    """
+    points = np.asarray(points, dtype=float)
+    dom = dominance_matrix(points)
+    counts = dom.sum(axis=0)
+    ranks = np.full(len(points), -1)
+    front = np.flatnonzero(counts == 0)
+    rank = 0
+    while len(front):
+        ranks[front] = rank
+        counts = counts - dom[front].sum(axis=0)
+        counts[ranks >= 0] = -1
+        front = np.flatnonzero(counts == 0)
+        rank += 1
+    return ranks
+
+
+def crowding_distance(points, fronts=None):
+    """
+    NSGA-II crowding distance of every row of ``points``: the summed,
+    range-normalised gap between each row's neighbours per objective,
+    taken within its front when ``fronts`` (e.g. from
+    ``nondominated_sort``) is given.  Boundary rows get ``inf``.
+    """
+    points = np.asarray(points, dtype=float)
+    n, m = points.shape
+    if fronts is None:
+        fronts = np.zeros(n, dtype=int)
+    distance = np.zeros(n)
+    if n == 0:
+        return distance
+
+    for col in range(m):
+        order = np.lexsort((points[:, col], fronts))
+        values = points[order, col]
+        grouped = fronts[order]
+        first = np.r_[True, grouped[1:] != grouped[:-1]]
+        last = np.r_[grouped[1:] != grouped[:-1], True]
+
+        # Span of each row's front along this objective
+        group = np.cumsum(first) - 1
+        span = (values[np.flatnonzero(last)] - values[np.flatnonzero(first)])[group]
+
+        inner = ~(first | last)
+        gaps = values[2:] - values[:-2]
+        scaled = gaps / np.where(span[1:-1] > 0, span[1:-1], 1.0)
+        distance[order[1:-1][inner[1:-1]]] += scaled[inner[1:-1]]
+        distance[order[first | last]] = np.inf
+    return distance
+
+
+class ParetoArchive:
+    """
+    Bounded set of mutually non-dominated (makespan, energy,
+    reliability) points, minimising the first two and maximising
+    reliability.  Above ``capacity`` the most crowded point is dropped
+    one at a time, so the front keeps its extremes and spread.
+    """
+
+    def __init__(self, capacity=DEFAULT_ARCHIVE_SIZE):
+        self.capacity = max(2, int(capacity))
+        self.points = np.empty((0, len(OBJECTIVES)))
+
+    def __len__(self):
+        return len(self.points)
+
+    def add(self, objectives):
+        """
+        Merge the leading (makespan, energy, reliability) columns of
+        ``objectives`` (one row per schedule) into the archive.
+        """
+        candidates = np.asarray(objectives, dtype=float)
+        candidates = candidates.reshape(-1, candidates.shape[-1])[:, :3]
+        candidates = np.round(candidates, DECIMALS)
+        archive = self.points * _SIGNS
+        incoming = candidates * _SIGNS
+
+        # Most candidates are matched or beaten by an archived point
+        covered = (archive[:, None, :] <= incoming[None, :, :]).all(axis=2)
+        fresh = ~covered.any(axis=0)
+        if not fresh.any():
+            return
+        candidates, incoming = candidates[fresh], incoming[fresh]
+        keep = nondominated(incoming)
+        candidates, incoming = candidates[keep], incoming[keep]
+
+        beaten = dominance_matrix_between(incoming, archive).any(axis=0)
+        merged = np.concatenate((self.points[~beaten], candidates))
+        minimised = np.concatenate((archive[~beaten], incoming))
+
+        while len(merged) > self.capacity:
+            worst = int(np.argmin(crowding_distance(minimised)))
+            merged = np.delete(merged, worst, axis=0)
+            minimised = np.delete(minimised, worst, axis=0)
+        self.points = merged
+
+    def to_list(self):
+        """Archive as result ``paretoPoints`` dicts, by makespan ascending."""
+        points = self.points[np.lexsort(self.points.T[::-1])]
+        return [
+            {name: float(value) for name, value in zip(OBJECTIVES, row)}
+            for row in points
+        ]
@@ -2,86 +2,136 @@
 Particle Swarm Optimization (PSO)
 ==================================
 Standard discrete PSO adapted for task scheduling.
+
+Random stream
+-------------
+The default kernel moves the whole swarm at once, drawing the cognitive
+and social coefficients ``r1`` then ``r2`` as (pop_size, n_tasks)
+arrays each iteration.  ``hyperparameters.legacyKernels`` restores the
+original implementation — ``r1``, ``r2`` interleaved per gene, float64
+velocities, each particle scored alone and the bests updated before the
+next one moves — and replays its runs bit for bit.
 """
 
 import numpy as np
-from .base import BaseOptimizer
+from .base import IterativeOptimizer
+from .checkpoint import SCHEDULES, TASK_VALUES
+
 
+class PSOOptimizer(IterativeOptimizer):
 
-class PSOOptimizer(BaseOptimizer):
+    checkpoint_state = {
+        "positions": SCHEDULES,
+        "velocities": TASK_VALUES,
+        "p_best": SCHEDULES,
+    }
+    snapshot_state = IterativeOptimizer.snapshot_state + (
+        "positions", "velocities", "p_best", "p_best_fit",
+    )
 
-    def run(self) -> dict:
+    def _init_search(self):
         pop_size = self.population_size
-        max_iter = self.max_iterations
-        n_tasks = self.task_count
         n_vms = self.vm_count
 
         # Initialize particles
-        positions = [
-            self.rng.integers(0, n_vms, size=n_tasks).tolist()
-            for _ in range(pop_size)
-        ]
-        velocities = [
-            self.rng.uniform(-n_vms, n_vms, size=n_tasks).tolist()
-            for _ in range(pop_size)
-        ]
-
-        fitness_vals = [self.fitness(p) for p in positions]
-        p_best = [list(p) for p in positions]
-        p_best_fit = list(fitness_vals)
+        self.positions = self._initial_population(pop_size)
+        self.velocities = self.rng.uniform(
+            -n_vms, n_vms, size=(pop_size, self.task_count)
+        )
+        if not self.legacy_kernels:
+            self.velocities = self.velocities.astype(np.float32)
+
+        fitness_vals = self._initial_fitness(self.positions)
+        self.p_best = self.positions.copy()
+        self.p_best_fit = fitness_vals.copy()
 
         g_best_idx = int(np.argmin(fitness_vals))
-        g_best = list(positions[g_best_idx])
-        g_best_fit = fitness_vals[g_best_idx]
-
-        convergence = []
-        w = 0.9  # Inertia weight
-
-        for iteration in range(max_iter):
-            w = 0.9 - 0.5 * (iteration / max_iter)  # Linear decay
-            c1, c2 = 2.0, 2.0
-
-            for i in range(pop_size):
-                for t in range(n_tasks):
-                    r1 = self.rng.random()
-                    r2 = self.rng.random()
-
-                    velocities[i][t] = (
-                        w * velocities[i][t]
-                        + c1 * r1 * (p_best[i][t] - positions[i][t])
-                        + c2 * r2 * (g_best[t] - positions[i][t])
-                    )
-
-                    # Update position (discrete)
-                    new_pos = int(round(positions[i][t] + velocities[i][t]))
-                    positions[i][t] = new_pos % n_vms
-
-                new_fit = self.fitness(positions[i])
-
-                if new_fit < p_best_fit[i]:
-                    p_best[i] = list(positions[i])
-                    p_best_fit[i] = new_fit
-
-                    if new_fit < g_best_fit:
-                        g_best = list(positions[i])
-                        g_best_fit = new_fit
-
-            convergence.append({
-                "iteration": iteration,
-                "bestFitness": round(g_best_fit, 6),
-                "makespan": round(self.compute_makespan(g_best), 4),
-                "energy": round(self.compute_energy(g_best), 4),
-            })
-
-            # Stream progress to Node.js via stderr
-            self.report_progress(
-                iteration=iteration,
-                max_iterations=max_iter,
-                best_fitness=g_best_fit,
-                makespan=self.compute_makespan(g_best),
-                energy=self.compute_energy(g_best),
-                reliability=self.compute_reliability(g_best),
-                utilization=self.compute_resource_utilization(g_best),
-            )
-
-        return self.build_result(g_best, convergence)
+        self.best_schedule = self.positions[g_best_idx].copy()
+        self.best_fitness = float(fitness_vals[g_best_idx])
+
+    def _resync_search(self):
+        self.p_best_fit, _ = self.fitness_batch(self.p_best)
+        fitness_vals, _ = self.fitness_batch(self.positions)
+        # A resumed position may beat its stored personal best
+        improved = fitness_vals < self.p_best_fit
+        self.p_best[improved] = self.positions[improved]
+        self.p_best_fit[improved] = fitness_vals[improved]
+
+        best_idx = int(np.argmin(self.p_best_fit))
+        if self.p_best_fit[best_idx] < self.best_fitness:
+            self.best_schedule[:] = self.p_best[best_idx]
+            self.best_fitness = float(self.p_best_fit[best_idx])
+
+    def _iterate(self, iteration):
+        w = 0.9 - 0.5 * (iteration / self.max_iterations)  # Linear decay
+        c1, c2 = 2.0, 2.0
+
+        if self.legacy_kernels:
+            return self._sweep_scalar(w, c1, c2)
+
+        self._move(self.positions, self.velocities, self.p_best,
+                   self.best_schedule, w, c1, c2)
+
+        # Score the whole swarm at once, then refresh personal/global bests
+        new_fits, _ = self.fitness_batch(self.positions)
+
+        improved = new_fits < self.p_best_fit
+        self.p_best[improved] = self.positions[improved]
+        self.p_best_fit[improved] = new_fits[improved]
+
+        best_idx = int(np.argmin(self.p_best_fit))
+        if self.p_best_fit[best_idx] < self.best_fitness:
+            self.best_schedule[:] = self.p_best[best_idx]
+            self.best_fitness = float(self.p_best_fit[best_idx])
+
+    def _move(self, positions, velocities, p_best, g_best, w, c1, c2):
+        """Vectorized velocity / position update of the whole swarm."""
+        shape = positions.shape
+        r1 = self.rng.random(shape)
+        r2 = self.rng.random(shape)
+
+        velocities[:] = (
+            w * velocities
+            + c1 * r1 * (p_best - positions)
+            + c2 * r2 * (g_best - positions)
+        )
+
+        # Update position (discrete)
+        new_pos = np.rint(positions + velocities).astype(np.int64)
+        positions[:] = new_pos % self.vm_count
+
+    def _sweep_scalar(self, w, c1, c2):
+        """
+        Legacy loop of the original implementation: each particle moves
+        gene by gene, is scored alone and updates its personal best and
+        the global best before the next particle moves.
+        """
+        positions, velocities = self.positions, self.velocities
+        p_best, g_best = self.p_best, self.best_schedule
+        pop_size, n_tasks = positions.shape
+        n_vms = self.vm_count
+
+        for i in range(pop_size):
+            for t in range(n_tasks):
+                r1 = self.rng.random()
+                r2 = self.rng.random()
+
+                velocities[i, t] = (
+                    w * velocities[i, t]
+                    + c1 * r1 * (p_best[i, t] - positions[i, t])
+                    + c2 * r2 * (g_best[t] - positions[i, t])
+                )
+
+                # Update position (discrete)
+                new_pos = int(round(float(positions[i, t] + velocities[i, t])))
+                positions[i, t] = new_pos % n_vms
+
+            new_fit = self.legacy_fitness(positions[i])
+
+            if new_fit < self.p_best_fit[i]:
+                p_best[i] = positions[i]
+                self.p_best_fit[i] = new_fit
+
+                if new_fit < self.best_fitness:
+                    g_best[:] = positions[i]
+                    self.best_fitness = new_fit
@@ -0,0 +1,90 @@
+"""
+Result cache
+=============
+Every algorithm is deterministic given its inputs and ``seed``, so a
+repeated experiment (e.g. a cloned one) can return the stored result
+instead of recomputing it.
+
+Results are stored as ``<root>/<key>.json``, where ``key`` hashes the
+canonical JSON of the config (minus request bookkeeping such as
+``experimentId`` and progress throttling), the workload digest in place
+of the inline task / VM tables, and a hash of the optimizer source so
+code changes invalidate old entries.
+
+Runs cut short by ``timeBudgetMs`` or SIGTERM are not cached, since
+they depend on timing.  Location and budget come from
+``RESULT_CACHE_DIR`` (default ``<tmp>/edo-results``) and
+``RESULT_CACHE_MAX_BYTES`` (default 256 MiB; 0 disables the cache), and
+entries are written and evicted as in ``algorithms.disk_store``.
+"""
+
+import functools
+import hashlib
+import json
+import os
+
+from .disk_store import DiskStore
+
+DEFAULT_MAX_BYTES = 256 << 20
+
+# Config keys that do not influence the result
+IGNORED_KEYS = ("experimentId", "storeWorkload", "useCache", "snapshotPath")
+IGNORED_HYPERPARAMETERS = ("progressIntervalMs", "progressStride",
+                           "snapshotEvery", "snapshotIntervalMs")
+# Replaced by the workload digest
+WORKLOAD_KEYS = ("tasks", "tasksFile", "workloadId", "vms", "vmsFile")
+
+UNCACHEABLE_STOPS = ("timeBudget", "interrupted")
+
+
+@functools.lru_cache(maxsize=1)
+def code_version():
+    """Hash of the optimizer sources (``algorithms/*.py``)."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.blake2b(digest_size=16)
+    for name in sorted(os.listdir(here)):
+        if name.endswith(".py"):
+            with open(os.path.join(here, name), "rb") as f:
+                h.update(name.encode() + b"\0" + f.read())
+    return h.hexdigest()
+
+
+class ResultCache(DiskStore):
+    """On-disk store of results (see ``algorithms.disk_store``)."""
+
+    ENV = "RESULT_CACHE"
+    DEFAULT_DIR = "edo-results"
+    DEFAULT_MAX_BYTES = DEFAULT_MAX_BYTES
+
+    @staticmethod
+    def key(config, workload):
+        """Canonical hash of everything that determines the result."""
+        canonical = {k: v for k, v in config.items() if k not in IGNORED_KEYS}
+        for section in ("workloadConfig", "vmConfig"):
+            canonical[section] = {
+                k: v for k, v in config.get(section, {}).items()
+                if k not in WORKLOAD_KEYS
+            }
+        canonical["hyperparameters"] = {
+            k: v for k, v in config.get("hyperparameters", {}).items()
+            if k not in IGNORED_HYPERPARAMETERS
+        }
+        canonical["workload"] = workload.digest()
+        canonical["codeVersion"] = code_version()
+
+        text = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.root, key + ".json")
+
+    def get(self, key):
+        """Stored result for ``key``, or ``None``."""
+        return self._read_json(self._path(key))
+
+    def put(self, key, result):
+        """Store ``result`` unless its run was cut short by timing."""
+        if not self.enabled or result.get("stopReason") in UNCACHEABLE_STOPS:
+            return
+        self._write_file(self._path(key), lambda f: json.dump(result, f))
+        self.evict()
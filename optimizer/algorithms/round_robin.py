@@ -14,21 +14,4 @@ class RoundRobinScheduler(BaseOptimizer):
         for i in range(self.task_count):
             schedule.append(i % self.vm_count)
 
-        convergence = [{
-            "iteration": 0,
-            "bestFitness": round(self.fitness(schedule), 6),
-            "makespan": round(self.compute_makespan(schedule), 4),
-            "energy": round(self.compute_energy(schedule), 4),
-        }]
-
-        self.report_progress(
-            iteration=0,
-            max_iterations=1,
-            best_fitness=self.fitness(schedule),
-            makespan=self.compute_makespan(schedule),
-            energy=self.compute_energy(schedule),
-            reliability=self.compute_reliability(schedule),
-            utilization=self.compute_resource_utilization(schedule),
-        )
-
-        return self.build_result(schedule, convergence)
+        return self._single_pass_result(schedule)
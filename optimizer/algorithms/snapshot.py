@@ -0,0 +1,142 @@
+"""
+Run snapshots
+==============
+Periodic on-disk snapshots of an iterative run, so a process killed
+mid-run (or a rescheduled container) resumes where it stopped instead of
+starting over.
+
+A snapshot is an uncompressed ``.npz`` holding the optimizer's
+``snapshot_state`` arrays, the convergence history as columns and a
+JSON ``__meta__`` block (config hash, iteration, RNG bit-generator
+state, counters).  The arrays are copied on the optimizer's thread and
+written by a background thread to a temporary file that is fsynced and
+renamed over the previous snapshot, so a reader only ever sees a
+complete file and iterations only pay for the copy.
+
+Snapshots are enabled by ``hyperparameters.snapshotEvery`` (iterations)
+and / or ``snapshotIntervalMs``.  They live at ``snapshotPath`` or, by
+default, at ``<SNAPSHOT_DIR>/<config hash>.npz`` (``SNAPSHOT_DIR``
+defaults to ``<tmp>/edo-snapshots``), so re-running an identical config
+picks up its snapshot automatically.  Resuming restores the RNG state
+and every array, so the resumed run finishes exactly as the
+uninterrupted one would have.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import zipfile
+
+import numpy as np
+
+SNAPSHOT_VERSION = 1
+
+CONVERGENCE_COLUMNS = (("iteration", np.int64), ("bestFitness", np.float64),
+                       ("makespan", np.float64), ("energy", np.float64))
+
+
+def default_path(key):
+    """Snapshot file for the config hash ``key``."""
+    root = os.environ.get("SNAPSHOT_DIR") or os.path.join(
+        tempfile.gettempdir(), "edo-snapshots"
+    )
+    return os.path.join(root, key + ".npz")
+
+
+def _write_atomic(path, arrays, meta):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, __meta__=np.frombuffer(json.dumps(meta).encode(),
+                                               dtype=np.uint8), **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class SnapshotWriter:
+    """
+    Writes snapshots to ``path`` on a background thread, at most one in
+    flight: a new ``write`` first waits for the previous one.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._thread = None
+        self._error = None
+
+    def write(self, arrays, meta, wait=False):
+        """
+        Snapshot ``arrays`` (copied before returning) and the
+        JSON-serialisable ``meta``.  With ``wait`` the write completes
+        before returning.
+        """
+        arrays = {name: np.array(value) for name, value in arrays.items()}
+        self.join()
+        self._thread = threading.Thread(
+            target=self._run, args=(arrays, meta), daemon=True
+        )
+        self._thread.start()
+        if wait:
+            self.join()
+
+    def _run(self, arrays, meta):
+        try:
+            _write_atomic(self.path, arrays, meta)
+        except Exception as e:  # surfaced on the next join()
+            self._error = e
+
+    def join(self):
+        """Wait for the pending write; re-raise its error, if any."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def discard(self):
+        """Drop the snapshot file (the run it belongs to has finished)."""
+        self.join()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def load(path, key):
+    """
+    ``(arrays, meta)`` from the snapshot at ``path``, or ``None`` when
+    there is none or it belongs to another config / format version.
+    """
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+        meta = json.loads(arrays.pop("__meta__").tobytes())
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+    if meta.get("version") != SNAPSHOT_VERSION or meta.get("key") != key:
+        return None
+    return arrays, meta
+
+
+def pack_convergence(convergence):
+    """Convergence dicts → ``{"convergence.<field>": column}`` arrays."""
+    return {
+        f"convergence.{name}": np.array([p[name] for p in convergence],
+                                        dtype=dtype)
+        for name, dtype in CONVERGENCE_COLUMNS
+    }
+
+
+def unpack_convergence(arrays):
+    columns = [arrays[f"convergence.{name}"].tolist()
+               for name, _ in CONVERGENCE_COLUMNS]
+    names = [name for name, _ in CONVERGENCE_COLUMNS]
+    return [dict(zip(names, row)) for row in zip(*columns)]
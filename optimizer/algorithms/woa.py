@@ -2,94 +2,142 @@
 Whale Optimization Algorithm (WOA)
 ===================================
 Nature-inspired metaheuristic based on humpback whale hunting behavior.
+
+Random stream
+-------------
+The default kernel updates the whole pod at once.  Each iteration draws
+per-whale vectors ``r``, ``C``, ``p`` and ``l`` (in that order), then
+one (n_searching, n_tasks) array of random-whale indices for the whales
+in the search-for-prey phase.  ``hyperparameters.legacyKernels``
+restores the original implementation — per-whale / per-gene draws, each
+whale scored alone and accepted (and the leader updated) before the
+next one moves — and replays its runs bit for bit.
 """
 
 import numpy as np
-from .base import BaseOptimizer
+from .base import IterativeOptimizer
+from .checkpoint import SCHEDULES
 
 
-class WOAOptimizer(BaseOptimizer):
+class WOAOptimizer(IterativeOptimizer):
 
-    def run(self) -> dict:
-        pop_size = self.population_size
-        max_iter = self.max_iterations
-        n_tasks = self.task_count
-        n_vms = self.vm_count
+    checkpoint_state = {"population": SCHEDULES}
+    snapshot_state = IterativeOptimizer.snapshot_state + ("population", "fitness_vals")
 
+    def _init_search(self):
         # Initialize
-        population = [
-            self.rng.integers(0, n_vms, size=n_tasks).tolist()
-            for _ in range(pop_size)
-        ]
-        fitness_vals = [self.fitness(ind) for ind in population]
-
-        best_idx = int(np.argmin(fitness_vals))
-        leader = list(population[best_idx])
-        leader_fit = fitness_vals[best_idx]
-
-        convergence = []
-
-        for iteration in range(max_iter):
-            a = 2.0 - 2.0 * (iteration / max_iter)  # Linearly decreases from 2 to 0
-
-            for i in range(pop_size):
-                r = self.rng.random()
-                A = 2 * a * r - a
-                C = 2 * self.rng.random()
-                p = self.rng.random()
-                b = 1.0
-                l = self.rng.uniform(-1, 1)
-
-                new_ind = list(population[i])
-
-                for t in range(n_tasks):
-                    if p < 0.5:
-                        if abs(A) < 1:
-                            # Encircling prey
-                            D = abs(C * leader[t] - population[i][t])
-                            new_val = leader[t] - A * D
-                        else:
-                            # Search for prey (exploration)
-                            rand_idx = int(self.rng.integers(0, pop_size))
-                            rand_whale = population[rand_idx]
-                            D = abs(C * rand_whale[t] - population[i][t])
-                            new_val = rand_whale[t] - A * D
+        self.population = self._initial_population(self.population_size)
+        self.fitness_vals = self._initial_fitness(self.population)
+        self._update_best()
+
+        self.candidates = np.empty_like(self.population)
+
+    def _iterate(self, iteration):
+        # Linearly decreases from 2 to 0
+        a = 2.0 - 2.0 * (iteration / self.max_iterations)
+
+        if self.legacy_kernels:
+            return self._sweep_scalar(a)
+
+        self._hunt(self.population, self.candidates, self.best_schedule, a)
+
+        # The pod moves together: score all whales, then greedy-accept
+        new_fits, _ = self.fitness_batch(self.candidates)
+
+        improved = new_fits < self.fitness_vals
+        self.population[improved] = self.candidates[improved]
+        self.fitness_vals[improved] = new_fits[improved]
+        self._update_best()
+
+    def _hunt(self, population, candidates, leader, a):
+        """Vectorized encircle / search / spiral update of every whale."""
+        pop_size, n_tasks = population.shape
+        b = 1.0
+
+        r = self.rng.random(pop_size)
+        C = 2 * self.rng.random(pop_size)
+        p = self.rng.random(pop_size)
+        l = self.rng.uniform(-1, 1, size=pop_size)
+        A = 2 * a * r - a
+
+        encircle = (p < 0.5) & (np.abs(A) < 1)
+        search = (p < 0.5) & ~encircle
+        spiral = ~(encircle | search)
+
+        new_vals = np.empty(population.shape)
+
+        # Encircling prey
+        A_e, C_e = A[encircle, None], C[encircle, None]
+        D = np.abs(C_e * leader - population[encircle])
+        new_vals[encircle] = leader - A_e * D
+
+        # Search for prey (exploration)
+        rand_idx = self.rng.integers(
+            0, pop_size, size=(int(search.sum()), n_tasks)
+        )
+        rand_whales = population[rand_idx, np.arange(n_tasks)]
+        A_s, C_s = A[search, None], C[search, None]
+        D = np.abs(C_s * rand_whales - population[search])
+        new_vals[search] = rand_whales - A_s * D
+
+        # Spiral update
+        l_sp = l[spiral, None]
+        D = np.abs(leader - population[spiral])
+        new_vals[spiral] = (
+            D * np.exp(b * l_sp) * np.cos(2 * np.pi * l_sp) + leader
+        )
+
+        candidates[:] = np.rint(new_vals).astype(np.int64) % self.vm_count
+
+    def _sweep_scalar(self, a):
+        """
+        Legacy loop of the original implementation: each whale in turn
+        moves gene by gene, is scored alone and, if better, replaces its
+        position (and the leader) before the next whale moves.
+        """
+        population, leader = self.population, self.best_schedule
+        pop_size, n_tasks = population.shape
+        n_vms = self.vm_count
+
+        for i in range(pop_size):
+            r = self.rng.random()
+            A = 2 * a * r - a
+            C = 2 * self.rng.random()
+            p = self.rng.random()
+            b = 1.0
+            l = self.rng.uniform(-1, 1)
+
+            whale = population[i]
+            new_ind = whale.copy()
+
+            for t in range(n_tasks):
+                if p < 0.5:
+                    if abs(A) < 1:
+                        # Encircling prey
+                        D = abs(C * leader[t] - whale[t])
+                        new_val = leader[t] - A * D
                     else:
-                        # Spiral update
-                        D = abs(leader[t] - population[i][t])
-                        new_val = (
-                            D * np.exp(b * l) * np.cos(2 * np.pi * l)
-                            + leader[t]
-                        )
-
-                    new_ind[t] = int(round(new_val)) % n_vms
-
-                new_fit = self.fitness(new_ind)
-
-                if new_fit < fitness_vals[i]:
-                    population[i] = new_ind
-                    fitness_vals[i] = new_fit
-
-                    if new_fit < leader_fit:
-                        leader = list(new_ind)
-                        leader_fit = new_fit
-
-            convergence.append({
-                "iteration": iteration,
-                "bestFitness": round(leader_fit, 6),
-                "makespan": round(self.compute_makespan(leader), 4),
-                "energy": round(self.compute_energy(leader), 4),
-            })
-
-            # Stream progress to Node.js via stderr
-            self.report_progress(
-                iteration=iteration,
-                max_iterations=max_iter,
-                best_fitness=leader_fit,
-                makespan=self.compute_makespan(leader),
-                energy=self.compute_energy(leader),
-                reliability=self.compute_reliability(leader),
-                utilization=self.compute_resource_utilization(leader),
-            )
-
-        return self.build_result(leader, convergence)
+                        # Search for prey (exploration)
+                        rand_idx = int(self.rng.integers(0, pop_size))
+                        rand_whale = population[rand_idx]
+                        D = abs(C * rand_whale[t] - whale[t])
+                        new_val = rand_whale[t] - A * D
+                else:
+                    # Spiral update
+                    D = abs(leader[t] - whale[t])
+                    new_val = (
+                        D * np.exp(b * l) * np.cos(2 * np.pi * l)
+                        + leader[t]
+                    )
+
+                new_ind[t] = int(round(float(new_val))) % n_vms
+
+            new_fit = self.legacy_fitness(new_ind)
+
+            if new_fit < self.fitness_vals[i]:
+                population[i] = new_ind
+                self.fitness_vals[i] = new_fit
+
+                if new_fit < self.best_fitness:
+                    leader[:] = new_ind
+                    self.best_fitness = new_fit
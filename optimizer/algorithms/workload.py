@@ -0,0 +1,236 @@
+"""
+Columnar workload arrays
+=========================
+The cost model only needs two read-only columns — task lengths and VM
+MIPS — so they are kept as flat NumPy arrays that can be built from the
+JSON task / VM lists, loaded from CSV / ``.npy`` tables, or attached
+zero-copy from shared memory when many optimizer processes run against
+the same workload.  The remaining descriptive columns (ids, file sizes,
+RAM, bandwidth) ride along but are not part of the cost model.
+
+Table files
+-----------
+``workloadConfig.tasksFile`` / ``vmConfig.vmsFile`` may point to a
+table instead of inline ``tasks`` / ``vms`` lists:
+
+* ``.csv`` — header row naming the columns (``id``, ``length``,
+  ``fileSize`` / ``id``, ``mips``, ``ram``, ``bandwidth``);
+* ``.npy`` — a structured array with those field names, or a plain 1-D
+  array of lengths (tasks) / MIPS (VMs).
+
+Only ``length`` / ``mips`` are required; ids default to the row index
+and the other columns to 0.
+
+Ids are opaque: they are only compared (to remap checkpoints), so
+integer ids are kept as they are and any other JSON value — e.g. a
+string — is stored as a stable 64-bit hash of its JSON text (``id_key``).
+"""
+
+import hashlib
+import json
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Config key → attribute, first entry is the required cost-model column
+TASK_COLUMNS = (("length", "task_length"), ("id", "task_id"),
+                ("fileSize", "task_file_size"))
+VM_COLUMNS = (("mips", "vm_mips"), ("id", "vm_id"), ("ram", "vm_ram"),
+              ("bandwidth", "vm_bandwidth"))
+
+
+def load_table(path, columns):
+    """
+    Read a CSV or ``.npy`` table into ``{config key: ndarray}`` for the
+    ``(key, attribute)`` pairs in ``columns``.
+    """
+    required = columns[0][0]
+    if str(path).endswith(".npy"):
+        data = np.load(path, mmap_mode="r")
+        if data.dtype.names is None:
+            return {required: np.asarray(data, dtype=np.float64).reshape(-1)}
+        names = data.dtype.names
+    else:
+        data = np.genfromtxt(path, delimiter=",", names=True, dtype=np.float64,
+                             ndmin=1, deletechars="")
+        names = data.dtype.names or ()
+
+    if required not in names:
+        raise ValueError(f"{path}: missing required column '{required}'")
+    return {key: np.asarray(data[key]) for key, _ in columns if key in names}
+
+
+class Workload:
+    """
+    Task lengths and VM MIPS as ``float64`` arrays.
+
+    Parameters
+    ----------
+    task_length : array-like[float], shape (n_tasks,)
+    vm_mips : array-like[float], shape (n_vms,)
+    task_id, task_file_size : array-like, shape (n_tasks,), optional
+    vm_id, vm_ram, vm_bandwidth : array-like, shape (n_vms,), optional
+        Descriptive columns; ids default to the row index, the rest to 0.
+    """
+
+    def __init__(self, task_length, vm_mips, task_id=None,
+                 task_file_size=None, vm_id=None, vm_ram=None,
+                 vm_bandwidth=None):
+        self.task_length = np.asarray(task_length, dtype=np.float64)
+        self.vm_mips = np.asarray(vm_mips, dtype=np.float64)
+
+        n_tasks, n_vms = len(self.task_length), len(self.vm_mips)
+        self.task_id = _ids(task_id, n_tasks)
+        self.task_file_size = _column(task_file_size, n_tasks, np.float64)
+        self.vm_id = _ids(vm_id, n_vms)
+        self.vm_ram = _column(vm_ram, n_vms, np.float64)
+        self.vm_bandwidth = _column(vm_bandwidth, n_vms, np.float64)
+
+    @classmethod
+    def from_columns(cls, task_columns, vm_columns):
+        """Build from ``{config key: values}`` task and VM columns."""
+        kwargs = {}
+        for columns, spec in ((task_columns, TASK_COLUMNS),
+                              (vm_columns, VM_COLUMNS)):
+            for key, attr in spec:
+                if key in columns:
+                    kwargs[attr] = columns[key]
+        return cls(**kwargs)
+
+    @classmethod
+    def from_lists(cls, tasks, vms):
+        """Build from the ``tasks[]`` / ``vms[]`` dicts of a config."""
+        return cls.from_columns(
+            _columns_from_dicts(tasks, TASK_COLUMNS),
+            _columns_from_dicts(vms, VM_COLUMNS),
+        )
+
+    @classmethod
+    def from_sources(cls, tasks=None, vms=None, tasks_file=None,
+                     vms_file=None):
+        """
+        Build from inline lists or table files; a file takes precedence
+        over the list of the same kind.
+        """
+        task_columns = (load_table(tasks_file, TASK_COLUMNS) if tasks_file
+                        else _columns_from_dicts(tasks or [], TASK_COLUMNS))
+        vm_columns = (load_table(vms_file, VM_COLUMNS) if vms_file
+                      else _columns_from_dicts(vms or [], VM_COLUMNS))
+        return cls.from_columns(task_columns, vm_columns)
+
+    @property
+    def n_tasks(self):
+        return len(self.task_length)
+
+    @property
+    def n_vms(self):
+        return len(self.vm_mips)
+
+    COLUMNS = ("task_length", "task_id", "task_file_size",
+               "vm_mips", "vm_id", "vm_ram", "vm_bandwidth")
+
+    def digest(self):
+        """Content hash identifying identical workloads (all columns)."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(np.int64([self.n_tasks, self.n_vms]).tobytes())
+        for name in self.COLUMNS:
+            h.update(np.ascontiguousarray(getattr(self, name)).tobytes())
+        return h.hexdigest()
+
+    # ── Shared memory ──────────────────────────────────────
+
+    def to_shared(self):
+        """
+        Copy every column into a new shared-memory block.
+
+        Returns ``(shm, descriptor)``; the caller owns ``shm`` and must
+        ``close()`` / ``unlink()`` it.  ``descriptor`` is a small
+        picklable dict accepted by ``Workload.attach``.
+        """
+        layout = _shared_layout(self.n_tasks, self.n_vms)
+        size = sum(8 * n for _, _, n in layout)
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for name, view in _shared_views(shm, layout):
+            view[:] = getattr(self, name)
+        return shm, {"name": shm.name, "nTasks": self.n_tasks,
+                     "nVms": self.n_vms}
+
+    @classmethod
+    def attach(cls, descriptor):
+        """
+        Zero-copy view of a block created by ``to_shared`` in a parent
+        process (pool workers share its resource tracker, which unlinks
+        the block only when the creator does).  All columns are shared,
+        so the attached workload has the same ``digest``.
+
+        Returns ``(workload, shm)``; keep ``shm`` open while the arrays
+        are in use and ``close()`` it afterwards.
+        """
+        shm = shared_memory.SharedMemory(name=descriptor["name"])
+        layout = _shared_layout(descriptor["nTasks"], descriptor["nVms"])
+        columns = {}
+        for name, view in _shared_views(shm, layout):
+            view.flags.writeable = False
+            columns[name] = view
+        return cls(**columns), shm
+
+
+def _shared_layout(n_tasks, n_vms):
+    """``(column, dtype, rows)`` of every column, in block order."""
+    return [
+        (name, np.int64 if name.endswith("_id") else np.float64,
+         n_tasks if name.startswith("task_") else n_vms)
+        for name in Workload.COLUMNS
+    ]
+
+
+def _shared_views(shm, layout):
+    """``(column, ndarray view)`` pairs over a ``to_shared`` block."""
+    offset = 0
+    for name, dtype, n in layout:
+        yield name, np.ndarray((n,), dtype=dtype, buffer=shm.buf, offset=offset)
+        offset += 8 * n
+
+
+def id_key(value):
+    """Int64 key of an opaque id: the id itself if integral, else a hash."""
+    if isinstance(value, (int, np.integer)) and -(1 << 63) <= value < (1 << 63):
+        return int(value)
+    if isinstance(value, float) and value.is_integer() and abs(value) < 2 ** 63:
+        return int(value)
+    text = json.dumps(value, sort_keys=True, default=str).encode()
+    return int.from_bytes(hashlib.blake2b(text, digest_size=8).digest(),
+                          "little", signed=True)
+
+
+def _ids(values, n):
+    if values is None:
+        return np.arange(n, dtype=np.int64)
+    values = np.asarray(values)
+    if values.dtype.kind not in "iub" and not (
+            values.dtype.kind == "f" and np.all(np.mod(values, 1) == 0)):
+        values = np.fromiter((id_key(v) for v in values.tolist()),
+                             dtype=np.int64, count=len(values))
+    return _column(values, n, np.int64)
+
+
+def _column(values, n, dtype, default=np.zeros):
+    if values is None:
+        return default(n).astype(dtype, copy=False)
+    values = np.asarray(values, dtype=dtype)
+    if len(values) != n:
+        raise ValueError(f"Column length {len(values)} does not match {n} rows")
+    return values
+
+
+def _columns_from_dicts(rows, spec):
+    """
+    ``{config key: list}`` for the required key plus the optional keys
+    present in the first row.
+    """
+    required = spec[0][0]
+    columns = {required: [row[required] for row in rows]}
+    for key, _ in spec[1:]:
+        if rows and key in rows[0]:
+            columns[key] = [row.get(key, 0) for row in rows]
+    return columns
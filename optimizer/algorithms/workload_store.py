@@ -0,0 +1,79 @@
+"""
+On-disk workload store
+=======================
+Content-addressed cache of ``Workload`` columns so repeated experiments
+on the same dataset do not re-ship and re-parse the task list.
+
+Each workload lives in ``<root>/<workloadId>/`` as one ``.npy`` file per
+column, where ``workloadId`` is ``Workload.digest()``.  ``open`` memory-
+maps the files read-only, so every optimizer process using a workload
+shares the same physical pages through the OS page cache; processes
+that already mapped an evicted entry keep their pages until they exit.
+
+Location and budget come from ``WORKLOAD_STORE_DIR`` (default
+``<tmp>/edo-workloads``) and ``WORKLOAD_STORE_MAX_BYTES`` (default
+2 GiB; 0 disables the store), and entries are written and evicted as in
+``algorithms.disk_store``.
+"""
+
+import os
+import re
+
+import numpy as np
+
+from .disk_store import DiskStore
+from .workload import Workload
+
+DEFAULT_MAX_BYTES = 2 << 30
+
+_WORKLOAD_ID = re.compile(r"[0-9a-f]{32}")
+
+
+class WorkloadStore(DiskStore):
+    """On-disk store of workload columns (see ``algorithms.disk_store``)."""
+
+    ENV = "WORKLOAD_STORE"
+    DEFAULT_DIR = "edo-workloads"
+    DEFAULT_MAX_BYTES = DEFAULT_MAX_BYTES
+
+    def _path(self, workload_id):
+        if not _WORKLOAD_ID.fullmatch(str(workload_id)):
+            raise ValueError(f"Invalid workloadId: {workload_id}")
+        return os.path.join(self.root, workload_id)
+
+    def put(self, workload):
+        """
+        Store ``workload`` (if new) and return its ``workloadId``, or
+        ``None`` when the store is disabled.
+        """
+        if not self.enabled:
+            return None
+        workload_id = workload.digest()
+        path = self._path(workload_id)
+        if os.path.isdir(path):
+            os.utime(path)
+            return workload_id
+
+        def write(tmp):
+            for name in Workload.COLUMNS:
+                np.save(os.path.join(tmp, name + ".npy"), getattr(workload, name))
+
+        self._write_dir(path, write)
+        self.evict(keep=workload_id)
+        return workload_id
+
+    def open(self, workload_id):
+        """Memory-map a stored workload read-only."""
+        path = self._path(workload_id)
+        try:
+            columns = {
+                name: np.load(os.path.join(path, name + ".npy"), mmap_mode="r")
+                for name in Workload.COLUMNS
+            }
+            os.utime(path)
+        except FileNotFoundError:
+            raise ValueError(f"Unknown workloadId: {workload_id}") from None
+        return Workload(**columns)
+
+    def __contains__(self, workload_id):
+        return os.path.isdir(self._path(workload_id))
@@ -4,25 +4,96 @@ EDO-Cloud Scheduler — Optimizer Engine
 Entry point for all optimization algorithms.
 
 Reads experiment config from stdin (JSON), runs the selected algorithm,
-and writes results to stdout (JSON).
+and writes results to stdout (JSON).  The config is parsed incrementally
+(see ``algorithms.ingest``): task and VM lists land directly in columnar
+arrays, and ``workloadConfig.tasksFile`` / ``vmConfig.vmsFile`` may name
+a CSV or ``.npy`` table instead of inline lists.
+
+Results are memoized on disk (see ``algorithms.result_cache``): a
+config identical in algorithm, workload, hyperparameters and seed to
+an earlier run returns the stored result with ``"cached": true``.
+``"useCache": false`` bypasses the cache for one request.
+
+With ``"storeWorkload": true`` the task / VM tables are saved in the
+on-disk ``WorkloadStore`` and the result carries their ``workloadId``;
+later configs can send ``workloadConfig.workloadId`` instead of the
+lists, and the optimizer memory-maps the stored columns.
+
+With ``--worker`` the process stays alive and serves newline-delimited
+JSON requests on stdin, one experiment config per line.  It announces
+itself with ``{"type": "ready"}`` and answers each request with one
+stdout line tagged by ``experimentId``:
+
+    {"type": "result", "experimentId": ..., "result": {...}}
+    {"type": "error",  "experimentId": ..., "error": ..., "traceback": ...}
+
+Progress lines on stderr carry the same ``experimentId``.
+
+SIGTERM during a run does not lose the work done so far: the optimizer
+stops at its next check point and the incumbent is written out as a
+normal result with ``"stopReason": "interrupted"`` (a worker then
+exits).  ``hyperparameters.timeBudgetMs`` bounds a run the same way.
+
+``"outputFormat": "packed"`` in a config replaces the schedule and
+convergence lists of its result with base64 column blocks (see
+``algorithms.packed``), which is much cheaper to write and parse for
+large workloads.
+
+``"checkpoint": true`` adds the final search state to the result, and
+passing that back as ``"resumeFrom"`` continues from it, remapping
+tasks and VMs by id if the workload changed (see
+``algorithms.checkpoint``).  ``"checkpoint": "store"`` keeps that
+state on disk and returns only the best schedule and a
+``checkpointId`` referring to it (see ``algorithms.checkpoint_store``).
+
+``hyperparameters.snapshotEvery`` / ``snapshotIntervalMs`` snapshot a
+long run to disk in the background (at ``"snapshotPath"`` or under
+``SNAPSHOT_DIR``); rerunning the same config after a crash or SIGTERM
+resumes from the latest snapshot and produces the result the
+uninterrupted run would have (see ``algorithms.snapshot``).
+
+``hyperparameters.localSearch`` (``"final"`` / ``"iteration"``) adds
+hill climbing on the reported schedule to any algorithm (see
+``algorithms.local_search``).
+
+Inner loops of large runs use compiled Numba kernels when numba is
+installed, and NumPy otherwise; ``hyperparameters.kernelBackend``
+forces either (see ``algorithms.kernels``).
+
+With ``--batch`` stdin holds a list of configs (see ``expand_batch``)
+that run concurrently on a process pool; stdout receives
+``{"results": [...]}`` in submission order.
 
 Usage:
     echo '{"algorithm":"EDO",...}' | python main.py
+    python main.py --worker
+    echo '{"algorithms":["EDO","GA"],"seeds":[1,2],...}' | python main.py --batch
 """
 
+import os
 import sys
 import json
 import time
+import signal
+import threading
 import traceback
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 
 from algorithms.edo import EDOOptimizer
 from algorithms.pso import PSOOptimizer
 from algorithms.aco import ACOOptimizer
 from algorithms.ga import GAOptimizer
 from algorithms.woa import WOAOptimizer
+from algorithms.nsga2 import NSGA2Optimizer
 from algorithms.round_robin import RoundRobinScheduler
 from algorithms.min_min import MinMinScheduler
 from algorithms.max_min import MaxMinScheduler
+from algorithms.workload import Workload
+from algorithms.workload_store import WorkloadStore
+from algorithms.checkpoint_store import CheckpointStore
+from algorithms.result_cache import ResultCache
+from algorithms.ingest import ConfigStream, read_config
 
 
 ALGORITHM_MAP = {
@@ -31,29 +102,229 @@ ALGORITHM_MAP = {
     "ACO": ACOOptimizer,
     "GA": GAOptimizer,
     "WOA": WOAOptimizer,
+    "NSGA2": NSGA2Optimizer,
     "ROUND_ROBIN": RoundRobinScheduler,
     "MIN_MIN": MinMinScheduler,
     "MAX_MIN": MaxMinScheduler,
 }
 
 
-def main():
-    try:
-        raw = sys.stdin.read()
-        config = json.loads(raw)
+def run_experiment(config, workload=None):
+    """Run one experiment config and return its result dict."""
+    algorithm_name = config.get("algorithm", "EDO")
+    if algorithm_name not in ALGORITHM_MAP:
+        raise ValueError(f"Unknown algorithm: {algorithm_name}")
 
-        algorithm_name = config.get("algorithm", "EDO")
-        if algorithm_name not in ALGORITHM_MAP:
-            raise ValueError(f"Unknown algorithm: {algorithm_name}")
+    optimizer_cls = ALGORITHM_MAP[algorithm_name]
+    optimizer = optimizer_cls(config, workload)
 
-        optimizer_cls = ALGORITHM_MAP[algorithm_name]
-        optimizer = optimizer_cls(config)
+    cache = ResultCache()
+    key = None
+    if config.get("useCache", True) and cache.enabled:
+        key = cache.key(config, optimizer.workload)
+    result = cache.get(key) if key else None
+    # A hit must not hand out the id of an evicted stored checkpoint
+    checkpoint_id = ((result or {}).get("checkpoint") or {}).get("checkpointId")
+    if checkpoint_id is not None and checkpoint_id not in CheckpointStore():
+        result = None
 
+    if result is not None:
+        result["cached"] = True
+    else:
         start = time.time()
-        result = optimizer.run()
+        with _stop_on_sigterm(optimizer):
+            result = optimizer.run()
         elapsed = time.time() - start
 
         result["executionTime"] = int(elapsed * 1000)  # ms
+        if key:
+            cache.put(key, result)
+
+    if config.get("storeWorkload"):
+        workload_id = WorkloadStore().put(optimizer.workload)
+        if workload_id is not None:
+            result["workloadId"] = workload_id
+    return result
+
+
+@contextmanager
+def _stop_on_sigterm(optimizer):
+    """Turn SIGTERM into ``optimizer.request_stop()`` while it runs."""
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    previous = signal.signal(
+        signal.SIGTERM, lambda signum, frame: optimizer.request_stop()
+    )
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+
+def _emit(message):
+    """Write one newline-delimited JSON message to stdout."""
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def serve():
+    """
+    Worker mode: run experiment configs read line by line from stdin
+    until EOF, reusing the already-imported interpreter and NumPy.  Each
+    line is parsed straight off stdin (see ``ConfigStream``), so large
+    requests stream into columns here too.
+    """
+    _emit({"type": "ready"})
+    requests = ConfigStream(sys.stdin)
+
+    while True:
+        experiment_id = None
+        try:
+            parsed = requests.next()
+            if parsed is None:
+                break
+            config, workload = parsed
+            experiment_id = config.get("experimentId")
+            result = run_experiment(config, workload)
+            _emit({
+                "type": "result",
+                "experimentId": experiment_id,
+                "result": result,
+            })
+            if result.get("stopReason") == "interrupted":
+                break
+        except Exception as e:
+            _emit({
+                "type": "error",
+                "experimentId": experiment_id,
+                "error": str(e),
+                "traceback": traceback.format_exc(),
+            })
+
+
+# ── Batch mode ─────────────────────────────────────────
+
+BATCH_KEYS = ("jobs", "algorithms", "seeds", "hyperparameterVariants",
+              "maxWorkers")
+
+
+def expand_batch(spec):
+    """
+    Flatten a batch request into a list of experiment configs.
+
+    Either ``{"jobs": [config, ...]}``, or a base experiment config plus
+    any of ``algorithms``, ``seeds`` and ``hyperparameterVariants``
+    (dicts merged over ``hyperparameters``), expanded as their
+    cartesian product in that nesting order.
+    """
+    if "jobs" in spec:
+        return list(spec["jobs"])
+
+    base = {k: v for k, v in spec.items() if k not in BATCH_KEYS}
+    algorithms = spec.get("algorithms") or [base.get("algorithm", "EDO")]
+    seeds = spec.get("seeds") or [base.get("seed", 42)]
+    variants = spec.get("hyperparameterVariants") or [{}]
+
+    jobs = []
+    for algorithm in algorithms:
+        for seed in seeds:
+            for variant in variants:
+                jobs.append({
+                    **base,
+                    "algorithm": algorithm,
+                    "seed": seed,
+                    "hyperparameters": {
+                        **base.get("hyperparameters", {}), **variant
+                    },
+                })
+    return jobs
+
+
+def _available_cpus():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _run_batch_job(config, descriptor):
+    """Pool worker: attach the shared workload (if any) and run one job."""
+    shm = None
+    try:
+        workload = None
+        if descriptor is not None:
+            workload, shm = Workload.attach(descriptor)
+        return run_experiment(config, workload)
+    except Exception as e:
+        return {"error": str(e), "traceback": traceback.format_exc()}
+    finally:
+        workload = None
+        if shm is not None:
+            shm.close()
+
+
+def run_batch(jobs, max_workers=None):
+    """
+    Run experiment configs concurrently on a ``ProcessPoolExecutor``.
+
+    Explicit task / VM lists are converted once per distinct workload
+    into a shared-memory block that workers attach zero-copy, so large
+    workloads are not pickled per job.  Returns one result (or
+    ``{"error", "traceback"}``) per job, in submission order.
+    """
+    if not jobs:
+        return []
+
+    shared = {}
+    submissions = []
+    try:
+        for config in jobs:
+            wl = config.get("workloadConfig", {})
+            vm = config.get("vmConfig", {})
+            descriptor = None
+            if wl.get("tasks") and vm.get("vms"):
+                workload = Workload.from_lists(wl["tasks"], vm["vms"])
+                key = workload.digest()
+                if key not in shared:
+                    shared[key] = workload.to_shared()
+                descriptor = shared[key][1]
+                config = {
+                    **config,
+                    "workloadConfig": {**wl, "tasks": []},
+                    "vmConfig": {**vm, "vms": []},
+                }
+            submissions.append((config, descriptor))
+
+        workers = max_workers or min(len(jobs), _available_cpus())
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_run_batch_job, config, descriptor)
+                for config, descriptor in submissions
+            ]
+            return [f.result() for f in futures]
+    finally:
+        for shm, _ in shared.values():
+            shm.close()
+            shm.unlink()
+
+
+def main():
+    if "--worker" in sys.argv[1:]:
+        serve()
+        return
+
+    try:
+        if "--batch" in sys.argv[1:]:
+            spec = json.loads(sys.stdin.read())
+            if isinstance(spec, list):
+                spec = {"jobs": spec}
+            if not isinstance(spec, dict):
+                raise ValueError("Batch spec must be a list of configs or an object")
+            result = {"results": run_batch(expand_batch(spec), spec.get("maxWorkers"))}
+        else:
+            config, workload = read_config(sys.stdin)
+            result = run_experiment(config, workload)
 
         # Write result JSON to stdout
         json.dump(result, sys.stdout)
@@ -4,18 +4,50 @@ Run with: python -m pytest tests/ -v
 """
 import sys
 import os
+import io
+import json
+import signal
+import subprocess
 
 # Add parent to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+import numpy as np
+import pytest
+
 from algorithms.edo import EDOOptimizer
 from algorithms.pso import PSOOptimizer
 from algorithms.aco import ACOOptimizer
 from algorithms.ga import GAOptimizer
 from algorithms.woa import WOAOptimizer
+from algorithms.nsga2 import NSGA2Optimizer
 from algorithms.round_robin import RoundRobinScheduler
 from algorithms.min_min import MinMinScheduler
 from algorithms.max_min import MaxMinScheduler
+from algorithms.constructive import min_min, max_min, lpt, proportional_round_robin
+from algorithms.island import migration_sources
+from algorithms.packed import unpack_columns
+from algorithms.checkpoint import Remap
+from algorithms.checkpoint_store import CheckpointStore
+from algorithms.local_search import LocalSearch
+from algorithms import kernels, loops
+from algorithms.pareto import (
+    DECIMALS, ParetoArchive, crowding_distance, nondominated, nondominated_sort,
+)
+from algorithms.ingest import ConfigStream, read_config
+from algorithms.workload import Workload
+from algorithms.workload_store import WorkloadStore
+from algorithms.result_cache import ResultCache
+import main
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Keep the on-disk result cache and workload store per test."""
+    monkeypatch.setenv('RESULT_CACHE_DIR', str(tmp_path / 'results'))
+    monkeypatch.setenv('WORKLOAD_STORE_DIR', str(tmp_path / 'workloads'))
+    monkeypatch.setenv('SNAPSHOT_DIR', str(tmp_path / 'snapshots'))
+    monkeypatch.setenv('CHECKPOINT_STORE_DIR', str(tmp_path / 'checkpoints'))
 
 
 def make_config(task_count=10, vm_count=3, algorithm='EDO', pop=10, iters=20):
@@ -63,6 +95,17 @@ def validate_result(result, task_count, vm_count):
         assert 0 <= entry['vmId'] < vm_count, f"VM id {entry['vmId']} out of range"
 
 
+def legacy_run(optimizer_cls, algorithm):
+    """(makespan, final bestFitness, VM ids) of a seeded legacyKernels run."""
+    config = make_config(task_count=20, vm_count=4, algorithm=algorithm)
+    config['seed'] = 7
+    config['hyperparameters']['legacyKernels'] = True
+    result = optimizer_cls(config).run()
+    validate_result(result, 20, 4)
+    return (result['makespan'], result['convergenceData'][-1]['bestFitness'],
+            [entry['vmId'] for entry in result['schedule']])
+
+
 # ── Metaheuristic tests ────────────────────────────────
 class TestEDO:
     def test_basic_run(self):
@@ -84,6 +127,13 @@ class TestEDO:
         r2 = EDOOptimizer(config).run()
         assert r1['makespan'] == r2['makespan']
 
+    def test_legacy_kernels_replay(self):
+        # Output of the original per-gene implementation for this config
+        assert legacy_run(EDOOptimizer, 'EDO') == (
+            6.0667, -13.713121,
+            [1, 0, 0, 3, 0, 1, 2, 3, 2, 3, 1, 1, 0, 2, 2, 1, 2, 3, 3, 3],
+        )
+
 
 class TestPSO:
     def test_basic_run(self):
@@ -91,6 +141,12 @@ class TestPSO:
         result = PSOOptimizer(config).run()
         validate_result(result, 10, 3)
 
+    def test_legacy_kernels_replay(self):
+        assert legacy_run(PSOOptimizer, 'PSO') == (
+            6.2, -12.792477,
+            [3, 2, 2, 2, 1, 3, 0, 0, 2, 1, 2, 3, 3, 3, 1, 1, 3, 3, 2, 0],
+        )
+
 
 class TestACO:
     def test_basic_run(self):
@@ -98,6 +154,26 @@ class TestACO:
         result = ACOOptimizer(config).run()
         validate_result(result, 10, 3)
 
+    def test_extra_vms_beyond_vm_count(self):
+        config = make_config(task_count=12, vm_count=5, algorithm='ACO')
+        config['vmConfig']['vmCount'] = 3
+        validate_result(ACOOptimizer(config).run(), 12, 3)
+
+    def test_construct_matches_probabilities(self):
+        opt = ACOOptimizer(make_config(task_count=3, vm_count=4))
+        weights = np.array([
+            [1.0, 1.0, 1.0, 1.0],
+            [0.0, 0.0, 5.0, 0.0],
+            [1.0, 3.0, 0.0, 4.0],
+        ])
+        schedules = opt._construct(weights, n_ants=20000)
+        assert schedules.shape == (20000, 3)
+        assert np.all(schedules[:, 1] == 2)
+        freq = np.bincount(schedules[:, 2], minlength=4) / 20000
+        assert np.allclose(freq, [0.125, 0.375, 0.0, 0.5], atol=0.02)
+        freq = np.bincount(schedules[:, 0], minlength=4) / 20000
+        assert np.allclose(freq, 0.25, atol=0.02)
+
 
 class TestGA:
     def test_basic_run(self):
@@ -105,6 +181,20 @@ class TestGA:
         result = GAOptimizer(config).run()
         validate_result(result, 10, 3)
 
+    def test_odd_population(self):
+        config = make_config(algorithm='GA', pop=7, iters=5)
+        result = GAOptimizer(config).run()
+        validate_result(result, 10, 3)
+
+    def test_crossover_writes_children_in_place(self):
+        opt = GAOptimizer(make_config(task_count=8))
+        p1 = np.zeros(8, dtype=np.int32)
+        p2 = np.ones(8, dtype=np.int32)
+        c1, c2 = np.empty_like(p1), np.empty_like(p2)
+        opt._crossover(p1, p2, c1, c2)
+        assert np.array_equal(c1 + c2, np.ones(8))
+        assert c1[0] == 0 and c1[-1] == 1
+
 
 class TestWOA:
     def test_basic_run(self):
@@ -112,6 +202,365 @@ class TestWOA:
         result = WOAOptimizer(config).run()
         validate_result(result, 10, 3)
 
+    def test_legacy_kernels_replay(self):
+        assert legacy_run(WOAOptimizer, 'WOA') == (
+            6.65, -9.913989,
+            [0, 1, 1, 2, 2, 2, 0, 1, 3, 1, 2, 2, 2, 3, 3, 0, 3, 3, 2, 1],
+        )
+
+
+class TestNSGA2:
+    def test_basic_run(self):
+        config = make_config(task_count=20, vm_count=4, algorithm='NSGA2', pop=12, iters=15)
+        result = NSGA2Optimizer(config).run()
+        validate_result(result, 20, 4)
+        assert result == NSGA2Optimizer(config).run()
+        assert len(result['convergenceData']) == 15
+        assert len(result['paretoPoints']) >= 1
+        assert main.ALGORITHM_MAP['NSGA2'] is NSGA2Optimizer
+
+    def test_initial_population_scored_once(self, monkeypatch):
+        opt = NSGA2Optimizer(make_config(task_count=15, vm_count=3, algorithm='NSGA2', pop=11))
+        calls = []
+        evaluate_batch = opt.evaluate_batch
+        monkeypatch.setattr(opt, 'evaluate_batch', lambda pop: calls.append(len(pop)) or evaluate_batch(pop))
+        opt._init_search()
+        assert calls == [11]
+        assert np.array_equal(
+            np.round(evaluate_batch(opt.population)[:, :3], DECIMALS) * [1, 1, -1], opt.objectives)
+
+    def test_survivor_state(self):
+        config = make_config(task_count=15, vm_count=3, algorithm='NSGA2', pop=11, iters=10)
+        opt = NSGA2Optimizer(config)
+        opt._init_search()
+        for iteration in range(10):
+            opt._iterate(iteration)
+            ranks = nondominated_sort(opt.objectives)
+            # Objectives stay in step with the population, and the first
+            # front wins every tournament against the rest
+            assert np.array_equal(
+                np.round(opt.evaluate_batch(opt.population)[:, :3], DECIMALS) * [1, 1, -1],
+                opt.objectives)
+            assert (opt.selection_keys[ranks == 0] <= 1).all()
+        assert opt.population.shape == (11, 15)
+
+
+class TestVectorizedKernels:
+    """The array kernels sample the same update rules as the legacy loops."""
+
+    @staticmethod
+    def mean_makespan(optimizer_cls, legacy):
+        makespans = []
+        for seed in range(8):
+            config = make_config(task_count=30, vm_count=4, pop=10, iters=15)
+            config['seed'] = seed
+            config['hyperparameters']['legacyKernels'] = legacy
+            makespans.append(optimizer_cls(config).run()['makespan'])
+        return np.mean(makespans)
+
+    def test_statistically_equivalent_to_legacy(self):
+        for optimizer_cls in (EDOOptimizer, PSOOptimizer, WOAOptimizer, GAOptimizer):
+            vec = self.mean_makespan(optimizer_cls, legacy=False)
+            legacy = self.mean_makespan(optimizer_cls, legacy=True)
+            assert abs(vec - legacy) <= 0.1 * legacy, optimizer_cls.__name__
+
+
+class TestKernelBackends:
+    """Every backend matches the NumPy kernels on the same random draws."""
+
+    @staticmethod
+    def backends():
+        found = [loops.backend(jit=False)]
+        if kernels.NUMBA_AVAILABLE:
+            found.append(kernels.get('numba'))
+        return found
+
+    def test_loads_energy(self):
+        rng = np.random.default_rng(0)
+        etc = rng.uniform(1, 10, (40, 5))
+        energy = etc * rng.uniform(0.5, 2, 5)
+        pop = rng.integers(0, 5, (12, 40), dtype=np.int32)
+        loads, total = kernels.NUMPY.loads_energy(pop, etc, energy, 5)
+        for backend in self.backends():
+            other_loads, other_total = backend.loads_energy(pop, etc, energy, 5)
+            np.testing.assert_array_equal(other_loads, loads)
+            np.testing.assert_allclose(other_total, total, rtol=1e-12)
+
+    def test_edo_propose(self):
+        rng = np.random.default_rng(1)
+        shape, n_vms = (9, 30), 4
+        pop = rng.integers(0, n_vms, shape, dtype=np.int32)
+        draws = (rng.random(shape), rng.integers(0, n_vms, shape, dtype=np.int32),
+                 rng.integers(0, shape[0], shape), rng.random(shape) < 0.3,
+                 rng.integers(-1, 2, shape, dtype=np.int32))
+        expected = np.empty_like(pop)
+        kernels.NUMPY.edo_propose(pop, expected, pop[0], *draws, 0.6, 0.4, n_vms)
+        for backend in self.backends():
+            out = np.empty_like(pop)
+            backend.edo_propose(pop, out, pop[0], *draws, 0.6, 0.4, n_vms)
+            np.testing.assert_array_equal(out, expected)
+
+    def test_ga_breed(self):
+        rng = np.random.default_rng(2)
+        pop = rng.integers(0, 4, (7, 25), dtype=np.int32)
+        keys = rng.integers(0, 3, 7).astype(float)  # plenty of ties
+        contenders = np.argsort(rng.random((8, 7)), axis=1)[:, :3]
+        draws = (contenders, rng.random(4) < 0.8, rng.integers(1, 25, 4),
+                 rng.random((8, 25)) < 0.1, rng.integers(0, 4, (8, 25), dtype=np.int32))
+        expected = np.empty((8, 25), dtype=np.int32)
+        kernels.NUMPY.ga_breed(pop, keys, *draws, expected)
+        for backend in self.backends():
+            out = np.empty_like(expected)
+            backend.ga_breed(pop, keys, *draws, out)
+            np.testing.assert_array_equal(out, expected)
+
+    def test_min_min(self):
+        for seed, ties in ((0, False), (1, True)):
+            etc = random_etc(seed, 150, 6, ties, consistent=False)
+            for backend in self.backends():
+                np.testing.assert_array_equal(backend.min_min(etc), min_min(etc))
+                stop = iter([False, False, True]).__next__
+                np.testing.assert_array_equal(
+                    backend.min_min(etc, stop),
+                    min_min(etc, iter([False, False, True]).__next__),
+                )
+
+    def test_backend_selection(self):
+        assert kernels.get('numpy') is kernels.NUMPY
+        expected = 'numba' if kernels.NUMBA_AVAILABLE else 'numpy'
+        assert kernels.get().name == expected
+        with pytest.raises(ValueError, match='kernelBackend'):
+            kernels.get('cuda')
+        if not kernels.NUMBA_AVAILABLE:
+            with pytest.raises(ValueError, match='numba'):
+                kernels.get('numba')
+
+    def test_auto_skips_numba_for_small_problems(self, monkeypatch):
+        compiled = object()
+        monkeypatch.setattr(kernels, 'NUMBA_AVAILABLE', True)
+        monkeypatch.setattr(kernels, '_numba', compiled)
+        assert kernels.get('auto', kernels.NUMBA_MIN_WORK - 1) is kernels.NUMPY
+        assert kernels.get('auto', kernels.NUMBA_MIN_WORK) is compiled
+        assert kernels.get('numba', 1) is compiled
+
+    def test_backend_resolved_on_first_kernel_call(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(kernels, 'get', lambda name, work: calls.append((name, work)) or kernels.NUMPY)
+        for optimizer_cls in (MinMinScheduler, EDOOptimizer):
+            opt = optimizer_cls(make_config(task_count=20, vm_count=4, pop=6, iters=2))
+            assert calls == []
+            opt.run()
+            assert calls == [('auto', 20 * 6)]
+            calls.clear()
+        # Heuristics without kernel calls never resolve a backend
+        RoundRobinScheduler(make_config()).run()
+        assert calls == []
+        with pytest.raises(ValueError, match='kernelBackend'):
+            EDOOptimizer({**make_config(), 'hyperparameters': {'kernelBackend': 'cuda'}})
+
+    def test_nsga2_ranking_ignores_summation_order(self):
+        # Fractional lengths / MIPS make energies differ in the last bits
+        # between pairwise (NumPy) and sequential (loop) sums
+        rng = np.random.default_rng(3)
+        config = make_config(task_count=200, vm_count=7, algorithm='NSGA2', pop=12, iters=15)
+        for task in config['workloadConfig']['tasks']:
+            task['length'] = float(rng.uniform(500, 5000))
+        for vm in config['vmConfig']['vms']:
+            vm['mips'] = float(rng.uniform(500, 3000))
+        schedules = []
+        for backend in (kernels.NUMPY, loops.backend(jit=False)):
+            opt = NSGA2Optimizer({**config, 'useCache': False})
+            opt._kernels = backend
+            schedules.append(opt.run()['schedule'])
+        assert schedules[0] == schedules[1]
+
+    @pytest.mark.skipif(not kernels.NUMBA_AVAILABLE, reason='numba not installed')
+    def test_numba_run_matches_numpy(self):
+        for name in ('GA', 'EDO', 'MIN_MIN', 'NSGA2'):
+            results = []
+            for backend in ('numpy', 'numba'):
+                config = make_config(task_count=40, vm_count=4, algorithm=name)
+                config['hyperparameters']['kernelBackend'] = backend
+                results.append(main.ALGORITHM_MAP[name](config).run())
+            assert results[0]['schedule'] == results[1]['schedule']
+
+
+class TestIslandModel:
+    @staticmethod
+    def island_config(algorithm, topology='ring'):
+        config = make_config(task_count=30, vm_count=4, algorithm=algorithm, pop=8, iters=12)
+        config['hyperparameters'].update(
+            islands=3, migrationInterval=4, migrationTopology=topology)
+        return config
+
+    def test_edo_islands(self):
+        config = self.island_config('EDO')
+        r1 = EDOOptimizer(config).run()
+        r2 = EDOOptimizer(config).run()
+        validate_result(r1, 30, 4)
+        assert len(r1['convergenceData']) == 12
+        assert r1['schedule'] == r2['schedule']
+        fits = [p['bestFitness'] for p in r1['convergenceData']]
+        assert fits == sorted(fits, reverse=True)
+
+    def test_ga_islands_fully_connected(self):
+        result = GAOptimizer(self.island_config('GA', 'fully_connected')).run()
+        validate_result(result, 30, 4)
+
+    def test_stop_mid_epoch_reports_that_incumbent(self):
+        config = make_config(task_count=30, vm_count=4, algorithm='GA', pop=8, iters=60)
+        config['hyperparameters'].update(islands=2, migrationInterval=25,
+                                         stagnationWindow=3, stagnationTolerance=1.0)
+        opt = GAOptimizer(config)
+        result = opt.run()
+        assert result['stopReason'] == 'stagnation'
+        assert result['iterations'] % 25 != 0
+        last = result['convergenceData'][-1]
+        assert result['makespan'] == last['makespan']
+        schedule = [entry['vmId'] for entry in result['schedule']]
+        assert opt.fitness(schedule) == pytest.approx(last['bestFitness'], abs=1e-6)
+
+    def test_zero_iterations(self):
+        config = self.island_config('EDO')
+        config['hyperparameters']['maxIterations'] = 0
+        result = EDOOptimizer(config).run()
+        validate_result(result, 30, 4)
+        assert result['iterations'] == 0
+
+    def test_migration_sources(self):
+        assert migration_sources('ring', 3) == [[2], [0], [1]]
+        assert migration_sources('fully_connected', 3) == [[1, 2], [0, 2], [0, 1]]
+
+    def test_unknown_topology(self):
+        with pytest.raises(ValueError):
+            EDOOptimizer(self.island_config('EDO', 'star')).run()
+
+
+class TestTermination:
+    @staticmethod
+    def config(**hp):
+        config = make_config(task_count=20, vm_count=4, pop=8, iters=200)
+        config['hyperparameters'].update(hp)
+        return config
+
+    def test_runs_to_max_iterations_by_default(self):
+        result = PSOOptimizer(make_config(iters=15)).run()
+        assert result['stopReason'] == 'maxIterations'
+        assert result['iterations'] == 15
+
+    def test_stagnation(self):
+        for optimizer_cls in (EDOOptimizer, PSOOptimizer, ACOOptimizer, GAOptimizer, WOAOptimizer):
+            result = optimizer_cls(self.config(stagnationWindow=5)).run()
+            assert result['stopReason'] == 'stagnation', optimizer_cls.__name__
+            assert 5 < result['iterations'] < 200
+            fits = [p['bestFitness'] for p in result['convergenceData']]
+            assert len(fits) == result['iterations']
+            assert fits[-6] - fits[-1] <= 1e-6 * abs(fits[-6]) + 1e-6
+
+    def test_max_evaluations(self):
+        result = GAOptimizer(self.config(maxEvaluations=50)).run()
+        assert result['stopReason'] == 'maxEvaluations'
+        assert result['iterations'] < 10
+
+    def test_target_fitness(self):
+        result = EDOOptimizer(self.config(targetFitness=1e9)).run()
+        assert result['stopReason'] == 'targetFitness'
+        assert result['iterations'] == 1
+
+    def test_time_budget_returns_incumbent(self):
+        for optimizer_cls in (EDOOptimizer, PSOOptimizer, ACOOptimizer, GAOptimizer, WOAOptimizer):
+            result = optimizer_cls(self.config(timeBudgetMs=0)).run()
+            assert result['stopReason'] == 'timeBudget', optimizer_cls.__name__
+            assert result['iterations'] == 0
+            validate_result(result, 20, 4)
+
+    def test_aco_time_budget_reports_evaluated_incumbent(self):
+        result = ACOOptimizer(self.config(timeBudgetMs=0)).run()
+        opt = ACOOptimizer(self.config())
+        expected = lpt(opt.etc[:20, :4])
+        assert [e['vmId'] for e in result['schedule']] == expected.tolist()
+        assert result['makespan'] == round(opt.compute_makespan(expected), 4)
+
+    def test_request_stop(self):
+        opt = GAOptimizer(self.config())
+        opt.request_stop()
+        result = opt.run()
+        assert result['stopReason'] == 'interrupted'
+        validate_result(result, 20, 4)
+
+    def test_constructive_cutoff_completes_schedule(self):
+        etc = random_etc(3, 300, 6, ties=False, consistent=False)
+        for kernel in (min_min, max_min):
+            full = kernel(etc)
+            cut = kernel(etc, should_stop=lambda: True)
+            assert cut.shape == full.shape
+            assert cut.min() >= 0 and cut.max() < 6
+            assert np.array_equal(kernel(etc, should_stop=lambda: False), full)
+
+    def test_heuristic_time_budget(self):
+        for optimizer_cls in (MinMinScheduler, MaxMinScheduler):
+            result = optimizer_cls(self.config(timeBudgetMs=0)).run()
+            assert result['stopReason'] == 'timeBudget'
+            validate_result(result, 20, 4)
+
+    def test_islands_stop_on_combined_history(self):
+        config = self.config(islands=2, migrationInterval=4, stagnationWindow=5)
+        result = EDOOptimizer(config).run()
+        assert result['stopReason'] == 'stagnation'
+        assert len(result['convergenceData']) == result['iterations'] < 200
+
+
+class TestProgress:
+    @staticmethod
+    def progress_lines(capsys):
+        err = capsys.readouterr().err
+        return [json.loads(l[len('PROGRESS:'):]) for l in err.splitlines()
+                if l.startswith('PROGRESS:')]
+
+    def test_throttled_but_final_iteration_delivered(self, capsys):
+        config = make_config(iters=50)
+        config['hyperparameters']['progressIntervalMs'] = 60000
+        result = PSOOptimizer(config).run()
+        events = self.progress_lines(capsys)
+        assert [e['iteration'] for e in events] == [0, 49]
+        assert events[-1]['fitness'] == result['convergenceData'][-1]['bestFitness']
+
+    def test_stride(self, capsys):
+        config = make_config(iters=25)
+        config['hyperparameters'].update(progressIntervalMs=0, progressStride=10)
+        GAOptimizer(config).run()
+        assert [e['iteration'] for e in self.progress_lines(capsys)] == [0, 10, 20, 24]
+
+    def test_convergence_reuses_incumbent_metrics(self):
+        opt = EDOOptimizer(make_config(task_count=20, vm_count=4, iters=15))
+        result = opt.run()
+        last = result['convergenceData'][-1]
+        ms, en, _, _ = opt.evaluate(opt.best_schedule)
+        assert last['makespan'] == round(ms, 4) == result['makespan']
+        assert last['energy'] == round(en, 4)
+
+
+class TestPackedOutput:
+    def test_matches_json_output(self):
+        for algorithm, cls in (('GA', GAOptimizer), ('MIN_MIN', MinMinScheduler)):
+            config = make_config(task_count=25, vm_count=4, algorithm=algorithm, iters=12)
+            plain = cls(config).run()
+            packed = cls({**config, 'outputFormat': 'packed'}).run()
+
+            schedule = unpack_columns(packed['schedule'])
+            assert packed['schedule']['length'] == 25
+            assert schedule['vmId'].tolist() == [e['vmId'] for e in plain['schedule']]
+
+            convergence = unpack_columns(packed['convergenceData'])
+            for key in ('iteration', 'bestFitness', 'makespan', 'energy'):
+                assert convergence[key].tolist() == [p[key] for p in plain['convergenceData']]
+            assert packed['makespan'] == plain['makespan']
+            json.dumps(packed)
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            EDOOptimizer({**make_config(), 'outputFormat': 'xml'})
+
 
 # ── Heuristic tests ───────────────────────────────────
 class TestRoundRobin:
@@ -130,12 +579,89 @@ class TestRoundRobin:
         assert all(c == 3 for c in vm_counts.values())
 
 
+def reference_min_min(etc):
+    """Original O(n_tasks^2 * n_vms) Min-Min loop, used as an oracle."""
+    n_tasks, n_vms = etc.shape
+    schedule, assigned, vm_ready = [0] * n_tasks, [False] * n_tasks, [0.0] * n_vms
+    for _ in range(n_tasks):
+        best_task, best_vm, best_ct = -1, -1, float('inf')
+        for t in range(n_tasks):
+            if assigned[t]:
+                continue
+            for v in range(n_vms):
+                ct = vm_ready[v] + etc[t, v]
+                if ct < best_ct:
+                    best_ct, best_task, best_vm = ct, t, v
+        schedule[best_task] = best_vm
+        assigned[best_task] = True
+        vm_ready[best_vm] = best_ct
+    return schedule
+
+
+def reference_max_min(etc):
+    """Original O(n_tasks^2 * n_vms) Max-Min loop, used as an oracle."""
+    n_tasks, n_vms = etc.shape
+    schedule, assigned, vm_ready = [0] * n_tasks, [False] * n_tasks, [0.0] * n_vms
+    for _ in range(n_tasks):
+        best_task, best_vm, max_min_ct = -1, -1, -1.0
+        for t in range(n_tasks):
+            if assigned[t]:
+                continue
+            local_best_vm, local_best_ct = 0, float('inf')
+            for v in range(n_vms):
+                ct = vm_ready[v] + etc[t, v]
+                if ct < local_best_ct:
+                    local_best_ct, local_best_vm = ct, v
+            if local_best_ct > max_min_ct:
+                max_min_ct, best_task, best_vm = local_best_ct, t, local_best_vm
+        schedule[best_task] = best_vm
+        assigned[best_task] = True
+        vm_ready[best_vm] = max_min_ct
+    return schedule
+
+
+def random_etc(seed, n_tasks, n_vms, ties, consistent=True):
+    rng = np.random.default_rng(seed)
+    if not consistent:
+        # Unrelated machines: task order differs between VMs
+        return rng.integers(1, 6 if ties else 1000, size=(n_tasks, n_vms)) / 10.0
+    if ties:
+        # Few distinct lengths / MIPS values → many equal completion times
+        lengths = rng.choice([1000, 2000, 4000], size=n_tasks)
+        mips = rng.choice([500, 1000], size=n_vms)
+    else:
+        lengths = rng.integers(1000, 50000, size=n_tasks)
+        mips = rng.integers(500, 2500, size=n_vms)
+    return lengths[:, None] / mips[None, :].astype(float)
+
+
+def assert_uses_first_vms(scheduler_cls, algorithm, reference):
+    """Only the first ``vmCount`` of the listed VMs may be scheduled on."""
+    config = make_config(task_count=12, vm_count=5, algorithm=algorithm)
+    config['vmConfig']['vmCount'] = 3
+    opt = scheduler_cls(config)
+    result = opt.run()
+    validate_result(result, 12, 3)
+    schedule = [entry['vmId'] for entry in result['schedule']]
+    assert schedule == reference(opt.etc[:12, :3])
+
+
 class TestMinMin:
     def test_basic_run(self):
         config = make_config(algorithm='MIN_MIN')
         result = MinMinScheduler(config).run()
         validate_result(result, 10, 3)
 
+    def test_matches_reference(self):
+        for seed in range(6):
+            for ties in (False, True):
+                for consistent in (True, False):
+                    etc = random_etc(seed, 40, 5, ties, consistent)
+                    assert min_min(etc).tolist() == reference_min_min(etc)
+
+    def test_extra_vms_beyond_vm_count(self):
+        assert_uses_first_vms(MinMinScheduler, 'MIN_MIN', reference_min_min)
+
 
 class TestMaxMin:
     def test_basic_run(self):
@@ -143,6 +669,747 @@ class TestMaxMin:
         result = MaxMinScheduler(config).run()
         validate_result(result, 10, 3)
 
+    def test_extra_vms_beyond_vm_count(self):
+        assert_uses_first_vms(MaxMinScheduler, 'MAX_MIN', reference_max_min)
+
+    def test_matches_reference(self):
+        for seed in range(6):
+            for ties in (False, True):
+                for consistent in (True, False):
+                    etc = random_etc(seed, 40, 5, ties, consistent)
+                    assert max_min(etc).tolist() == reference_max_min(etc)
+
+
+class TestSeededInit:
+    @staticmethod
+    def config(algorithm, fraction, **hp):
+        config = make_config(task_count=40, vm_count=4, algorithm=algorithm, pop=10, iters=5)
+        config['hyperparameters'].update(seedFraction=fraction, **hp)
+        return config
+
+    def test_lpt_and_proportional_round_robin(self):
+        etc = random_etc(0, 30, 4, ties=False)
+        schedule = lpt(etc)
+        assert schedule.dtype == np.int32 and len(schedule) == 30
+        assert proportional_round_robin([1000, 2000, 1000], 8).tolist() == [1, 0, 1, 2, 1, 0, 1, 2]
+        counts = np.bincount(proportional_round_robin([500, 1500, 3000], 1000))
+        assert counts.tolist() == [100, 300, 600]
+
+    def test_population_starts_from_heuristics(self):
+        opt = GAOptimizer(self.config('GA', 0.5, seedPerturbation=0.2))
+        population = opt._initial_population(10)
+        seeds = opt._heuristic_schedules()
+        assert len(seeds) == 4
+        for row, seed in zip(population, seeds):
+            assert row.tolist() == seed.tolist()
+        # Perturbed copies stay close to their heuristic
+        assert (population[4] != seeds[0]).mean() < 0.5
+
+    def test_warm_start_beats_heuristic(self):
+        heuristic = MinMinScheduler(self.config('MIN_MIN', 0)).run()
+        for optimizer_cls, name in ((GAOptimizer, 'GA'), (EDOOptimizer, 'EDO'),
+                                    (PSOOptimizer, 'PSO'), (WOAOptimizer, 'WOA'),
+                                    (NSGA2Optimizer, 'NSGA2')):
+            result = optimizer_cls(self.config(name, 0.2, seedHeuristics=['min_min'])).run()
+            assert result['convergenceData'][0]['bestFitness'] <= \
+                heuristic['convergenceData'][0]['bestFitness']
+
+    def test_default_is_random_init(self):
+        config = self.config('EDO', 0)
+        del config['hyperparameters']['seedFraction']
+        assert EDOOptimizer(config).run() == EDOOptimizer(self.config('EDO', 0)).run()
+
+    def test_unknown_heuristic(self):
+        with pytest.raises(ValueError):
+            GAOptimizer(self.config('GA', 0.2, seedHeuristics=['sjf']))
+
+
+# ── Fitness engine ────────────────────────────────────
+def reference_metrics(opt, schedule):
+    """Scalar re-implementation of the objective model, used as an oracle."""
+    vm_times = [0.0] * opt.vm_count
+    energy = 0.0
+    for task_idx, vm_idx in enumerate(schedule):
+        exec_time = opt.tasks[task_idx]['length'] / opt.vms[vm_idx]['mips']
+        vm_times[vm_idx] += exec_time
+        energy += opt.vms[vm_idx]['mips'] * 0.001 * exec_time
+    makespan = max(vm_times)
+    avg = sum(vm_times) / opt.vm_count
+    reliability = max(0.0, 1.0 - max(abs(t - avg) for t in vm_times) / avg)
+    utilization = sum(t / makespan for t in vm_times) / opt.vm_count
+    return makespan, energy, reliability, utilization
+
+
+class TestFitnessEngine:
+    def test_evaluate_matches_reference(self):
+        opt = EDOOptimizer(make_config(task_count=40, vm_count=5))
+        schedule = opt.rng.integers(0, 5, size=40).tolist()
+        expected = reference_metrics(opt, schedule)
+        assert np.allclose(opt.evaluate(schedule), expected)
+        assert np.isclose(opt.compute_makespan(schedule), expected[0])
+        assert np.isclose(opt.compute_energy(schedule), expected[1])
+        assert np.isclose(opt.compute_reliability(schedule), expected[2])
+        assert np.isclose(opt.compute_resource_utilization(schedule), expected[3])
+
+    def test_fitness_batch_matches_scalar(self):
+        opt = GAOptimizer(make_config(task_count=30, vm_count=4))
+        population = opt.rng.integers(0, 4, size=(8, 30))
+        fits, objectives = opt.fitness_batch(population)
+        assert fits.shape == (8,)
+        assert objectives.shape == (8, 4)
+        for row, ind in enumerate(population):
+            assert np.isclose(fits[row], opt.fitness(ind))
+            assert np.allclose(objectives[row], opt.evaluate(ind))
+
+    def test_random_population_is_contiguous_int32(self):
+        opt = EDOOptimizer(make_config(task_count=25, vm_count=4))
+        population = opt._random_population(6)
+        assert population.shape == (6, 25)
+        assert population.dtype == np.int32
+        assert population.flags['C_CONTIGUOUS']
+        assert population.min() >= 0 and population.max() < 4
+
+    def test_etc_matrix_shape(self):
+        opt = EDOOptimizer(make_config(task_count=12, vm_count=4))
+        assert opt.etc.shape == (12, 4)
+        assert np.isclose(opt.etc[3, 2], opt.tasks[3]['length'] / opt.vms[2]['mips'])
+
+
+def brute_force_front(points):
+    """Distinct rows no other row dominates (all columns minimised)."""
+    front = set()
+    for p in map(tuple, points):
+        if not any(all(q <= p) and any(q < p) for q in points):
+            front.add(p)
+    return front
+
+
+class TestPareto:
+    def test_nondominated_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        for m in (2, 3):
+            for _ in range(50):
+                points = rng.integers(0, 5, (int(rng.integers(1, 30)), m)).astype(float)
+                mask = nondominated(points)
+                assert set(map(tuple, points[mask])) == brute_force_front(points)
+                assert mask.sum() == len(brute_force_front(points))
+
+    def test_nondominated_sort_and_crowding(self):
+        points = np.array([[1, 4], [2, 2], [4, 1], [3, 3], [5, 5]], dtype=float)
+        assert nondominated_sort(points).tolist() == [0, 0, 0, 1, 2]
+        distance = crowding_distance(points[:3])
+        assert np.isinf(distance[[0, 2]]).all() and np.isfinite(distance[1])
+        # Per front: the lone second and third fronts are boundary points
+        per_front = crowding_distance(points, nondominated_sort(points))
+        assert np.isinf(per_front[[0, 2, 3, 4]]).all()
+        assert np.isclose(per_front[1], distance[1])
+
+    def test_archive_is_bounded_front(self):
+        rng = np.random.default_rng(1)
+        unbounded, seen = ParetoArchive(capacity=1000), []
+        for _ in range(20):
+            batch = rng.integers(0, 50, (15, 4)).astype(float)
+            unbounded.add(batch)
+            seen.append(batch[:, :3] * [1, 1, -1])
+        assert set(map(tuple, unbounded.points * [1, 1, -1])) == \
+            brute_force_front(np.concatenate(seen))
+
+        archive = ParetoArchive(capacity=10)
+        archive.add(unbounded.points)
+        assert len(archive) == 10 < len(unbounded)
+        assert nondominated(archive.points * [1, 1, -1]).all()
+        # Crowding pruning keeps the extremes of every objective
+        for col in range(3):
+            assert archive.points[:, col].min() == unbounded.points[:, col].min()
+            assert archive.points[:, col].max() == unbounded.points[:, col].max()
+
+    def test_result_front_spans_objectives(self):
+        for result in (
+            GAOptimizer(make_config(task_count=20, vm_count=4, pop=20, iters=30)).run(),
+            GAOptimizer(TestIslandModel.island_config('GA')).run(),
+        ):
+            points = result['paretoPoints']
+            assert points == sorted(points, key=lambda p: p['makespan'])
+            rows = np.array([[p['makespan'], p['energy'], -p['reliability']] for p in points])
+            assert nondominated(rows).all()
+            assert all(0 <= p['reliability'] <= 1 for p in points)
+            best = np.array([result['makespan'], result['energy'], -result['reliability']])
+            assert not any((r <= best).all() and (r < best).any() for r in rows)
+
+
+class TestFitnessCache:
+    @staticmethod
+    def config(size):
+        config = make_config(task_count=12, vm_count=3, pop=30, iters=60)
+        config['hyperparameters']['fitnessCacheSize'] = size
+        return config
+
+    def test_same_results_with_hits_in_logs(self):
+        for optimizer_cls in (GAOptimizer, EDOOptimizer):
+            plain = optimizer_cls(self.config(0)).run()
+            opt = optimizer_cls(self.config(256))
+            cached = opt.run()
+            assert cached['schedule'] == plain['schedule']
+            assert cached['convergenceData'] == plain['convergenceData']
+            assert plain['logs'] == ''
+            assert f'hits={opt.cache_hits} misses={opt.cache_misses}' in cached['logs']
+            assert opt.cache_hits > 0
+            assert opt.evaluations == opt.cache_misses
+            assert len(opt._fitness_cache) <= 256
+
+    def test_batch_duplicates_and_scalar_fitness(self):
+        opt = EDOOptimizer(self.config(8))
+        pop = opt._random_population(5)
+        pop = np.concatenate([pop, pop[:2]])
+        fits, objs = opt.fitness_batch(pop)
+        assert (opt.cache_hits, opt.cache_misses) == (2, 5)
+        expected, _ = EDOOptimizer(self.config(0)).fitness_batch(pop)
+        assert np.allclose(fits, expected)
+        assert np.isclose(opt.fitness(pop[3]), expected[3])
+        assert opt.cache_hits == 3
+
+
+class TestLocalSearch:
+    def test_candidate_scores_match_full_evaluation(self):
+        rng = np.random.default_rng(3)
+        for vm_count in (2, 3, 7):
+            opt = GAOptimizer(make_config(task_count=60, vm_count=vm_count, algorithm='GA'))
+            search = LocalSearch(opt)
+            for _ in range(10):
+                schedule = rng.integers(0, vm_count, 60)
+                fitness, moves = search._best_step(opt.incremental_evaluator(schedule))
+                moved = schedule.copy()
+                for task, vm in moves:
+                    moved[task] = vm
+                expected = opt._weighted_fitness(*opt.evaluate(moved)[:3])
+                assert fitness == pytest.approx(expected, abs=1e-9)
+
+    def test_improve_reaches_local_optimum(self):
+        opt = RoundRobinScheduler(make_config(task_count=80, vm_count=5, algorithm='ROUND_ROBIN'))
+        start = np.arange(80) % 5
+        schedule, fitness = LocalSearch(opt, max_moves=1000).improve(start)
+        assert (start == np.arange(80) % 5).all()
+        assert fitness == pytest.approx(opt.fitness(schedule))
+        assert fitness < opt.fitness(start)
+        # No single move off the critical VM or heavy/light swap helps
+        step = LocalSearch(opt)._best_step(opt.incremental_evaluator(schedule))
+        assert step[0] >= fitness - 1e-9
+
+    def test_selectable_for_every_algorithm(self):
+        for name, optimizer_cls in main.ALGORITHM_MAP.items():
+            results = {}
+            for mode in ('none', 'final', 'iteration'):
+                config = make_config(task_count=40, vm_count=4, algorithm=name, iters=10)
+                config['hyperparameters']['localSearch'] = mode
+                results[mode] = optimizer_cls(config).run()
+                validate_result(results[mode], 40, 4)
+            weighted = {mode: 0.4 * r['makespan'] + 0.3 * r['energy'] - 30 * r['reliability']
+                        for mode, r in results.items()}
+            assert weighted['final'] <= weighted['none'] + 1e-3
+            assert 'improvementPerSecond=' in results['iteration']['logs']
+            assert 'localSearch' not in results['none']['logs']
+
+    def test_unknown_mode(self):
+        config = make_config()
+        config['hyperparameters']['localSearch'] = 'always'
+        with pytest.raises(ValueError, match='localSearch'):
+            EDOOptimizer(config)
+
+
+class TestIncrementalEvaluator:
+    def test_moves_match_full_evaluation(self):
+        opt = EDOOptimizer(make_config(task_count=60, vm_count=5))
+        schedule = opt.rng.integers(0, 5, size=60)
+        inc = opt.incremental_evaluator(schedule)
+        for _ in range(200):
+            inc.move(int(opt.rng.integers(0, 60)), int(opt.rng.integers(0, 5)))
+        assert np.allclose(inc.objectives(), opt.evaluate(inc.schedule))
+        assert np.isclose(inc.fitness(), opt.fitness(inc.schedule))
+
+    def test_undo_restores_state(self):
+        opt = EDOOptimizer(make_config(task_count=20, vm_count=4))
+        schedule = opt.rng.integers(0, 4, size=20)
+        inc = opt.incremental_evaluator(schedule)
+        before = inc.fitness()
+        inc.swap(0, 1)
+        inc.move(5, 3)
+        inc.undo(3)
+        assert np.array_equal(inc.schedule, schedule)
+        assert np.isclose(inc.fitness(), before)
+
+    def test_move_fitness_is_side_effect_free(self):
+        opt = EDOOptimizer(make_config(task_count=20, vm_count=4))
+        schedule = np.zeros(20, dtype=np.int32)
+        inc = opt.incremental_evaluator(schedule)
+        moved = schedule.copy()
+        moved[7] = 2
+        assert np.isclose(inc.move_fitness(7, 2), opt.fitness(moved))
+        assert np.array_equal(inc.schedule, schedule)
+
+
+class TestIngest:
+    def test_streams_lists_into_columns(self):
+        config = make_config(task_count=40, vm_count=5)
+        config['notes'] = {'nested': [1, 2.5e3, "x\"y"]}
+        text = json.dumps(config, indent=2)
+        for chunk_size in (3, 17, 1 << 16):
+            parsed, workload = read_config(io.StringIO(text), chunk_size)
+            assert parsed['notes'] == config['notes']
+            assert parsed['workloadConfig']['tasks'] == []
+            expected = Workload.from_lists(config['workloadConfig']['tasks'], config['vmConfig']['vms'])
+            for column in ('task_length', 'task_id', 'task_file_size', 'vm_mips', 'vm_ram'):
+                assert np.array_equal(getattr(workload, column), getattr(expected, column))
+
+        plain = EDOOptimizer(config).run()
+        assert EDOOptimizer(parsed, workload).run()['schedule'] == plain['schedule']
+
+    def test_missing_side_falls_back_to_defaults(self):
+        config = make_config(task_count=12)
+        config['vmConfig'] = {'vmCount': 3}
+        parsed, workload = read_config(io.StringIO(json.dumps(config)), 16)
+        assert workload is None
+        assert GAOptimizer(parsed).run() == GAOptimizer(config).run()
+
+    def test_invalid_json(self):
+        with pytest.raises(ValueError):
+            read_config(io.StringIO('{"algorithm": "EDO",'), 4)
+        with pytest.raises(ValueError):
+            read_config(io.StringIO('{"workloadConfig": {"tasks": [{"id": 1}]}}'))
+
+    def test_opaque_ids(self):
+        config = make_config(task_count=12, vm_count=3)
+        tasks = config['workloadConfig']['tasks']
+        for task in tasks:
+            task['id'] = f"task-{task['id']}"
+        config['vmConfig']['vms'][0]['id'] = 'vm-a'
+        expected = EDOOptimizer(make_config(task_count=12, vm_count=3)).run()['schedule']
+        assert EDOOptimizer(config).run()['schedule'] == expected
+        parsed, workload = read_config(io.StringIO(json.dumps(config)), 7)
+        assert EDOOptimizer(parsed, workload).run()['schedule'] == expected
+
+        # Distinct, stable keys, so checkpoints still remap by id
+        assert len(set(workload.task_id.tolist())) == 12
+        reordered = Workload.from_lists(tasks[::-1], config['vmConfig']['vms'])
+        assert reordered.task_id.tolist() == workload.task_id.tolist()[::-1]
+        assert workload.vm_id.tolist()[1:] == [1, 2]
+
+    def test_config_stream_reads_one_line_at_a_time(self):
+        configs = [make_config(task_count=20, algorithm=a) for a in ('EDO', 'GA')]
+        lines = [json.dumps(configs[0]), '', '{"algorithm": "EDO",', json.dumps(configs[1])]
+        for chunk_size in (5, 1 << 16):
+            fp = io.StringIO('\n'.join(lines) + '\n')
+            stream = ConfigStream(fp, chunk_size)
+            parsed, workload = stream.next()
+            # Nothing past the first request has been read
+            assert fp.tell() == len(lines[0]) + 1
+            assert len(workload.task_length) == 20
+            with pytest.raises(ValueError):
+                stream.next()
+            parsed, workload = stream.next()
+            assert parsed['algorithm'] == 'GA'
+            assert GAOptimizer(parsed, workload).run()['schedule'] == GAOptimizer(configs[1]).run()['schedule']
+            assert stream.next() is None
+
+    def test_task_and_vm_tables(self, tmp_path):
+        config = make_config(task_count=15, vm_count=4)
+        tasks = config['workloadConfig'].pop('tasks')
+        vms = config['vmConfig'].pop('vms')
+        csv_path = tmp_path / 'tasks.csv'
+        csv_path.write_text('id,length,fileSize\n' + ''.join(
+            f"{t['id']},{t['length']},{t['fileSize']}\n" for t in tasks))
+        npy_path = tmp_path / 'vms.npy'
+        np.save(npy_path, np.array([v['mips'] for v in vms], dtype=float))
+
+        del config['workloadConfig']['taskCount']
+        config['workloadConfig']['tasksFile'] = str(csv_path)
+        config['vmConfig']['vmsFile'] = str(npy_path)
+
+        expected = MinMinScheduler(make_config(task_count=15, vm_count=4)).run()
+        assert MinMinScheduler(config).run()['schedule'] == expected['schedule']
+        parsed, workload = read_config(io.StringIO(json.dumps(config)))
+        assert np.array_equal(workload.task_file_size, [t['fileSize'] for t in tasks])
+        assert MinMinScheduler(parsed, workload).run()['schedule'] == expected['schedule']
+
+
+class TestCheckpoint:
+    @staticmethod
+    def config(algorithm, **extra):
+        config = make_config(task_count=30, vm_count=4, algorithm=algorithm, pop=8, iters=10)
+        config.update(extra)
+        return config
+
+    @staticmethod
+    def changed(config):
+        """Drop two tasks and one VM, add three tasks, shuffle the rest."""
+        wl, vm = config['workloadConfig'], config['vmConfig']
+        tasks = wl['tasks'][2:] + [{'id': 100 + i, 'length': 4000} for i in range(3)]
+        vms = [v for v in vm['vms'] if v['id'] != 1]
+        config['workloadConfig'] = {'taskCount': len(tasks), 'tasks': tasks[::-1]}
+        config['vmConfig'] = {'vmCount': len(vms), 'vms': vms[::-1]}
+        return config
+
+    def test_resume_same_workload(self):
+        for optimizer_cls, name in ((GAOptimizer, 'GA'), (PSOOptimizer, 'PSO'),
+                                    (ACOOptimizer, 'ACO'), (NSGA2Optimizer, 'NSGA2')):
+            first = optimizer_cls(self.config(name, checkpoint=True)).run()
+            checkpoint = json.loads(json.dumps(first['checkpoint']))
+            assert checkpoint['algorithm'] == name
+            resumed = optimizer_cls(self.config(name, resumeFrom=checkpoint)).run()
+            assert 'checkpoint' not in resumed
+            first_fit = first['convergenceData'][-1]['bestFitness']
+            assert resumed['convergenceData'][0]['bestFitness'] <= first_fit
+
+    def test_resume_remaps_by_id(self):
+        first = GAOptimizer(self.config('GA', checkpoint=True)).run()
+        config = self.changed(self.config('GA', resumeFrom=first['checkpoint']))
+        opt = GAOptimizer(config)
+        opt._start_search()
+        assert opt.population.shape == (8, 31)
+        assert ((opt.population >= 0) & (opt.population < 3)).all()
+
+        # Surviving tasks stay on the same VM (by id) as in the old best
+        old_vm_ids = [v['id'] for v in make_config(vm_count=4)['vmConfig']['vms']]
+        new_vm_ids = [v['id'] for v in config['vmConfig']['vms']]
+        old_best = {t: old_vm_ids[e['vmId']] for t, e in enumerate(first['schedule'])}
+        for pos, task in enumerate(config['workloadConfig']['tasks']):
+            vm_id = new_vm_ids[opt.population[0][pos]]
+            if task['id'] < 100 and old_best[task['id']] != 1:
+                assert vm_id == old_best[task['id']]
+
+    def test_resume_other_algorithm_and_state(self):
+        heuristic = MinMinScheduler(self.config('MIN_MIN', checkpoint=True)).run()
+        assert heuristic['checkpoint']['state'] == {}
+        warm = EDOOptimizer(self.config('EDO', resumeFrom=heuristic['checkpoint'])).run()
+        assert warm['convergenceData'][0]['bestFitness'] <= \
+            heuristic['convergenceData'][0]['bestFitness']
+
+        aco = ACOOptimizer(self.config('ACO', checkpoint=True)).run()
+        opt = ACOOptimizer(self.changed(self.config('ACO', resumeFrom=aco['checkpoint'])))
+        opt._start_search()
+        assert opt.pheromone.shape == (31, 3)
+        # Rows of new tasks keep the initial pheromone
+        assert (opt.pheromone[:3] == 1.0).all()
+
+    def test_stored_checkpoint_stays_out_of_result(self, tmp_path):
+        inline = GAOptimizer(self.config('GA', checkpoint=True)).run()['checkpoint']
+        reference = GAOptimizer(self.config('GA', checkpoint='store')).run()['checkpoint']
+        assert 'state' not in reference
+        assert reference['bestSchedule'] == inline['bestSchedule']
+        assert CheckpointStore().get(reference['checkpointId']) == inline
+
+        plain = GAOptimizer(self.config('GA', resumeFrom=inline)).run()
+        stored = GAOptimizer(self.config('GA', resumeFrom=reference)).run()
+        assert stored['schedule'] == plain['schedule']
+
+        # Evicted: warm-start from the best schedule the reference carries
+        os.unlink(tmp_path / 'checkpoints' / (reference['checkpointId'] + '.json'))
+        best_only = {k: v for k, v in inline.items() if k != 'state'}
+        evicted = GAOptimizer(self.config('GA', resumeFrom=reference)).run()
+        assert evicted['schedule'] == GAOptimizer(self.config('GA', resumeFrom=best_only)).run()['schedule']
+
+        with pytest.raises(ValueError):
+            GAOptimizer(self.config('GA', checkpoint='full'))
+
+    def test_remap_rejects_other_versions(self):
+        checkpoint = GAOptimizer(self.config('GA', checkpoint=True)).run()['checkpoint']
+        with pytest.raises(ValueError):
+            Remap({**checkpoint, 'version': 99}, np.arange(30), np.arange(4))
+
+    def test_shared_workload_keeps_all_columns(self):
+        workload = Workload([1.0, 2.0], [10.0], task_id=[7, 9], vm_id=[3],
+                            task_file_size=[300, 500], vm_ram=[2048], vm_bandwidth=[100])
+        shm, descriptor = workload.to_shared()
+        try:
+            attached, view = Workload.attach(descriptor)
+            assert attached.task_id.tolist() == [7, 9]
+            assert attached.vm_id.tolist() == [3]
+            assert attached.task_file_size.tolist() == [300, 500]
+            # Batch jobs hit the same cache / store entries as single runs
+            assert attached.digest() == workload.digest()
+            del attached
+            view.close()
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+class TestSnapshot:
+    @staticmethod
+    def config(algorithm, **hp):
+        config = make_config(task_count=30, vm_count=4, algorithm=algorithm, pop=8, iters=12)
+        config['hyperparameters'].update(hp)
+        return config
+
+    @staticmethod
+    def interrupt_after(opt, stop_at):
+        iterate = opt._iterate
+
+        def _iterate(iteration):
+            iterate(iteration)
+            if iteration == stop_at:
+                opt.request_stop()
+        opt._iterate = _iterate
+        return opt
+
+    @staticmethod
+    def outcome(result):
+        return (result['schedule'], result['convergenceData'],
+                result['paretoPoints'], result['iterations'])
+
+    def test_resume_matches_uninterrupted_run(self, tmp_path):
+        for optimizer_cls, name in ((GAOptimizer, 'GA'), (PSOOptimizer, 'PSO'),
+                                    (ACOOptimizer, 'ACO'), (NSGA2Optimizer, 'NSGA2')):
+            reference = optimizer_cls(self.config(name)).run()
+            config = self.config(name, snapshotEvery=3)
+            stopped = self.interrupt_after(optimizer_cls(config), 4).run()
+            assert stopped['stopReason'] == 'interrupted'
+            assert len(list((tmp_path / 'snapshots').glob('*.npz'))) == 1
+
+            resumed = optimizer_cls(config).run()
+            assert resumed['stopReason'] == 'maxIterations'
+            assert self.outcome(resumed) == self.outcome(reference)
+            # A finished run removes its snapshot
+            assert not list((tmp_path / 'snapshots').iterdir())
+
+    def test_periodic_snapshot_and_other_config(self, tmp_path):
+        path = tmp_path / 'run.npz'
+        config = self.config('EDO', snapshotEvery=2)
+        config['snapshotPath'] = str(path)
+        opt = EDOOptimizer(config)
+        writer = opt._snapshot_writer()
+        opt.start_clock()
+        opt._start_search()
+        opt._write_snapshot(writer, [], [], wait=True)
+        assert opt._restore_snapshot(str(path))[0] == 0
+
+        # Another seed is another run: its snapshot is not picked up
+        other = self.config('EDO', snapshotEvery=2, seed=7)
+        other['snapshotPath'] = str(path)
+        opt = EDOOptimizer(other)
+        opt._snapshot_writer()
+        assert opt._restore_snapshot(str(path)) is None
+
+        path.write_bytes(b'truncated')
+        assert EDOOptimizer(config).run()['stopReason'] == 'maxIterations'
+        assert not path.exists()
+        assert not list(tmp_path.glob('.tmp-*'))
+
+
+class TestWorkloadStore:
+    @staticmethod
+    def workload(task_count, seed=0):
+        config = make_config(task_count=task_count, vm_count=4)
+        config['seed'] = seed
+        return GAOptimizer(config).workload
+
+    def test_roundtrip_is_memory_mapped(self, tmp_path):
+        store = WorkloadStore(str(tmp_path))
+        workload = self.workload(30)
+        workload_id = store.put(workload)
+        assert store.put(workload) == workload_id
+
+        opened = store.open(workload_id)
+        assert isinstance(opened.task_length.base, np.memmap)
+        assert not opened.task_length.flags.writeable
+        assert opened.digest() == workload_id
+        for column in Workload.COLUMNS:
+            assert np.array_equal(getattr(opened, column), getattr(workload, column))
+
+    def test_lru_eviction_by_bytes(self, tmp_path):
+        store = WorkloadStore(str(tmp_path))
+        ids = [store.put(self.workload(1000 + i)) for i in range(3)]
+        entry_bytes = sum(f.stat().st_size for f in (tmp_path / ids[2]).iterdir())
+
+        os.utime(tmp_path / ids[0], (1, 1))
+        os.utime(tmp_path / ids[1], (2, 2))
+        store.open(ids[0])  # most recently used again
+        store.max_bytes = 3 * entry_bytes + 1000
+        store.put(self.workload(1003))
+        assert ids[0] in store and ids[2] in store and ids[1] not in store
+
+    def test_zero_budget_disables_every_store(self, tmp_path, monkeypatch):
+        assert WorkloadStore(str(tmp_path), max_bytes=0).put(self.workload(10)) is None
+        checkpoint = {'version': 1, 'bestSchedule': {}, 'state': {'population': {}}}
+        assert CheckpointStore(str(tmp_path), max_bytes=0).put(checkpoint) == \
+            {'version': 1, 'bestSchedule': {}}
+        ResultCache(str(tmp_path), max_bytes=0).put('0' * 32, {'makespan': 1.0})
+        assert list(tmp_path.iterdir()) == []
+        for name, store_cls in (('WORKLOAD_STORE', WorkloadStore), ('RESULT_CACHE', ResultCache),
+                                ('CHECKPOINT_STORE', CheckpointStore)):
+            monkeypatch.setenv(name + '_MAX_BYTES', '0')
+            assert not store_cls().enabled
+
+    def test_unknown_and_invalid_ids(self, tmp_path):
+        store = WorkloadStore(str(tmp_path))
+        with pytest.raises(ValueError):
+            store.open('0' * 32)
+        with pytest.raises(ValueError):
+            store.open('../etc')
+
+    def test_experiments_by_workload_id(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('WORKLOAD_STORE_DIR', str(tmp_path))
+        config = make_config(task_count=20, vm_count=4, algorithm='PSO')
+        first = main.run_experiment({**config, 'storeWorkload': True})
+
+        by_id = make_config(task_count=20, vm_count=4, algorithm='PSO')
+        by_id['workloadConfig'] = {'taskCount': 20, 'workloadId': first['workloadId']}
+        by_id['vmConfig'] = {'vmCount': 4}
+        assert main.run_experiment(by_id)['schedule'] == first['schedule']
+
+
+class TestResultCache:
+    def test_repeated_config_is_cached(self):
+        config = make_config(task_count=20, vm_count=4, algorithm='GA')
+        first = main.run_experiment(config)
+        again = main.run_experiment({**config, 'experimentId': 'clone',
+                                     'hyperparameters': {**config['hyperparameters'], 'progressStride': 5}})
+        assert again.pop('cached') is True
+        assert again == first
+        assert 'cached' not in main.run_experiment({**config, 'useCache': False})
+
+    def test_hit_needs_its_stored_checkpoint(self, tmp_path):
+        config = make_config(task_count=20, vm_count=4, algorithm='GA')
+        config['checkpoint'] = 'store'
+        first = main.run_experiment(config)
+        checkpoint_id = first['checkpoint']['checkpointId']
+        assert main.run_experiment(config).pop('cached') is True
+
+        # Evicted checkpoint: recompute, which stores it again
+        os.unlink(tmp_path / 'checkpoints' / (checkpoint_id + '.json'))
+        again = main.run_experiment(config)
+        assert 'cached' not in again
+        assert again['checkpoint']['checkpointId'] in CheckpointStore()
+
+    def test_key_covers_inputs(self):
+        config = make_config(task_count=20, vm_count=4)
+        workload = EDOOptimizer(config).workload
+        key = ResultCache.key(config, workload)
+        assert ResultCache.key({**config, 'seed': 7}, workload) != key
+        assert ResultCache.key({**config, 'algorithm': 'PSO'}, workload) != key
+        other = EDOOptimizer({**config, 'seed': 1, 'workloadConfig': {'taskCount': 20}}).workload
+        assert ResultCache.key(config, other) != key
+        by_id = {**config, 'workloadConfig': {'taskCount': 20, 'workloadId': 'x'}}
+        assert ResultCache.key(by_id, workload) == key
+
+    def test_deadline_runs_not_cached(self):
+        config = make_config(task_count=20, vm_count=4, algorithm='PSO')
+        config['hyperparameters']['timeBudgetMs'] = 0
+        main.run_experiment(config)
+        assert 'cached' not in main.run_experiment(config)
+
+    def test_eviction(self, tmp_path):
+        cache = ResultCache(str(tmp_path / 'c'), max_bytes=2500)
+        for i in range(5):
+            cache.put(f'{i:032x}', {'payload': 'x' * 1000})
+        assert cache.get(f'{0:032x}') is None
+        assert cache.get(f'{4:032x}') is not None
+        assert sum(f.stat().st_size for f in (tmp_path / 'c').iterdir()) <= 2500
+
+
+# ── Entry point ───────────────────────────────────────
+MAIN_PY = os.path.join(os.path.dirname(__file__), '..', 'main.py')
+
+
+class TestWorkerMode:
+    def test_serves_tagged_results(self):
+        requests = [
+            make_config(algorithm='MIN_MIN'),
+            {**make_config(algorithm='NOPE'), 'experimentId': 'bad'},
+            {**make_config(algorithm='GA', iters=3), 'experimentId': 'ga'},
+        ]
+        stdin = ''.join(json.dumps(r) + '\n' for r in requests)
+        proc = subprocess.run(
+            [sys.executable, MAIN_PY, '--worker'],
+            input=stdin, capture_output=True, text=True, timeout=60,
+        )
+        messages = [json.loads(line) for line in proc.stdout.splitlines()]
+        assert proc.returncode == 0
+        assert [m['type'] for m in messages] == ['ready', 'result', 'error', 'result']
+        assert [m.get('experimentId') for m in messages[1:]] == ['test-123', 'bad', 'ga']
+        validate_result(messages[3]['result'], 10, 3)
+        assert '"experimentId": "ga"' in proc.stderr
+
+    def test_answers_before_stdin_closes(self):
+        proc = subprocess.Popen(
+            [sys.executable, MAIN_PY, '--worker'], stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        try:
+            assert json.loads(proc.stdout.readline())['type'] == 'ready'
+            proc.stdin.write(json.dumps(make_config(algorithm='MIN_MIN')) + '\n')
+            proc.stdin.flush()
+            assert json.loads(proc.stdout.readline())['type'] == 'result'
+        finally:
+            proc.stdin.close()
+            proc.wait(timeout=60)
+        assert proc.returncode == 0
+
+
+def without_timing(result):
+    return {k: v for k, v in result.items() if k != 'executionTime'}
+
+
+class TestSigterm:
+    def test_emits_incumbent(self, tmp_path):
+        config = make_config(task_count=200, vm_count=8, algorithm='GA', pop=20, iters=100000)
+        config_path = tmp_path / 'config.json'
+        config_path.write_text(json.dumps(config))
+        with open(config_path) as stdin:
+            proc = subprocess.Popen(
+                [sys.executable, MAIN_PY], stdin=stdin,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+            )
+        assert proc.stderr.readline().startswith('PROGRESS:')
+        proc.send_signal(signal.SIGTERM)
+        stdout, _ = proc.communicate(timeout=60)
+
+        assert proc.returncode == 0
+        result = json.loads(stdout)
+        assert result['stopReason'] == 'interrupted'
+        assert 0 < result['iterations'] < 100000
+        validate_result(result, 200, 8)
+
+
+class TestBatchMode:
+    @staticmethod
+    def run_main(stdin):
+        return subprocess.run([sys.executable, MAIN_PY, '--batch'], input=stdin,
+                              capture_output=True, text=True, timeout=60)
+
+    def test_cli_reports_errors_as_json(self):
+        proc = self.run_main(json.dumps([make_config(algorithm='MIN_MIN')]))
+        assert proc.returncode == 0
+        validate_result(json.loads(proc.stdout)['results'][0], 10, 3)
+        for bad in ('{"jobs": [', '7', '{"jobs": 5}'):
+            proc = self.run_main(bad)
+            assert proc.returncode == 1
+            assert 'error' in json.loads(proc.stderr)
+
+    def test_expand_sweep(self):
+        spec = {**make_config(), 'algorithms': ['EDO', 'GA'], 'seeds': [1, 2],
+                'hyperparameterVariants': [{'populationSize': 5}, {'populationSize': 8}]}
+        jobs = main.expand_batch(spec)
+        assert len(jobs) == 8
+        assert [(j['algorithm'], j['seed'], j['hyperparameters']['populationSize'])
+                for j in jobs[:3]] == [('EDO', 1, 5), ('EDO', 1, 8), ('EDO', 2, 5)]
+        assert jobs[0]['hyperparameters']['maxIterations'] == 20
+        assert 'algorithms' not in jobs[0]
+
+    def test_matches_sequential_runs_in_order(self):
+        spec = {**make_config(task_count=30, iters=5), 'seeds': [1, 2],
+                'algorithms': ['EDO', 'MIN_MIN', 'NOPE', 'ACO']}
+        jobs = main.expand_batch(spec)
+        results = main.run_batch(jobs, max_workers=2)
+        assert len(results) == len(jobs)
+        for job, result in zip(jobs, results):
+            if job['algorithm'] == 'NOPE':
+                assert 'Unknown algorithm' in result['error']
+            else:
+                expected = main.run_experiment(job)
+                # Shared-memory jobs hash like single runs, so this is a cache hit
+                assert expected.pop('cached') is True
+                assert without_timing(result) == without_timing(expected)
+
 
 # ── Edge cases ─────────────────────────────────────────
 class TestEdgeCases:
@@ -15,4 +15,8 @@ module.exports = {
     process.env.CLOUDSIM_JAR_PATH ||
     path.resolve(__dirname, '../../../simulator/target/simulator.jar'),
   defaultSeed: parseInt(process.env.DEFAULT_SEED, 10) || 42,
+  // Warm `main.py --worker` processes kept alive; 0 spawns one process per experiment
+  optimizerWorkers: parseInt(process.env.OPTIMIZER_WORKERS ?? '2', 10) || 0,
+  // 'packed' ships schedule / convergence as base64 column blocks instead of JSON lists
+  optimizerOutputFormat: process.env.OPTIMIZER_OUTPUT_FORMAT || 'packed',
 };
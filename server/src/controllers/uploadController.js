@@ -166,6 +166,8 @@ const getVMPreset = async (req, res, next) => {
 
 /**
  * POST /api/experiments/:id/clone
+ * Body `{ resume: true }` makes the clone resume from the original's
+ * result checkpoint.
  */
 const cloneExperiment = async (req, res, next) => {
   try {
@@ -179,6 +181,8 @@ const cloneExperiment = async (req, res, next) => {
       hyperparameters: original.hyperparameters,
       tags: [...(original.tags || []), 'cloned'],
       notes: original.notes || '',
+      // Start from the original's final search state instead of scratch
+      resumeFrom: req.body?.resume ? original._id : null,
     });
 
     res.status(201).json({
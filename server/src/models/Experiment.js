@@ -44,13 +44,14 @@ const experimentSchema = new mongoose.Schema(
     },
     algorithm: {
       type: String,
-      enum: ['EDO', 'PSO', 'ACO', 'GA', 'WOA', 'ROUND_ROBIN', 'MIN_MIN', 'MAX_MIN'],
+      enum: ['EDO', 'PSO', 'ACO', 'GA', 'WOA', 'NSGA2', 'ROUND_ROBIN', 'MIN_MIN', 'MAX_MIN'],
       required: [true, 'Algorithm is required'],
     },
     hyperparameters: {
       populationSize: { type: Number, default: 50, min: 5 },
       maxIterations: { type: Number, default: 100, min: 10 },
       seed: { type: Number },
+      timeBudgetMs: { type: Number, min: 0 },
       weights: {
         makespan: { type: Number, default: 0.4, min: 0, max: 1 },
         energy: { type: Number, default: 0.3, min: 0, max: 1 },
@@ -64,6 +65,8 @@ const experimentSchema = new mongoose.Schema(
       index: true,
     },
     startedAt: { type: Date, default: null },
+    // Experiment whose result checkpoint this run resumes from
+    resumeFrom: { type: mongoose.Schema.Types.ObjectId, ref: 'Experiment', default: null },
     tags: [{ type: String, trim: true }],
     notes: { type: String, maxlength: 2000 },
   },
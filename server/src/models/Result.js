@@ -46,6 +46,10 @@ const resultSchema = new mongoose.Schema(
     schedule: [scheduleEntrySchema],
     rawLogs: { type: String },
     executionTime: { type: Number },
+    stopReason: { type: String },
+    // Best schedule and optimizer-side checkpointId for resuming; the search
+    // state itself stays in the optimizer's checkpoint store
+    checkpoint: { type: mongoose.Schema.Types.Mixed, select: false },
   },
   {
     timestamps: true,
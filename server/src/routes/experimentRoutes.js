@@ -10,7 +10,7 @@ const router = Router();
 // All experiment routes require authentication
 router.use(auth);
 
-const ALGORITHMS = ['EDO', 'PSO', 'ACO', 'GA', 'WOA', 'ROUND_ROBIN', 'MIN_MIN', 'MAX_MIN'];
+const ALGORITHMS = ['EDO', 'PSO', 'ACO', 'GA', 'WOA', 'NSGA2', 'ROUND_ROBIN', 'MIN_MIN', 'MAX_MIN'];
 
 router.post(
   '/',
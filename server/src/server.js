@@ -2,6 +2,7 @@ const app = require('./app');
 const connectDB = require('./config/db');
 const config = require('./config/env');
 const logger = require('./utils/logger');
+const optimizerPool = require('./services/optimizerPool');
 
 const start = async () => {
   try {
@@ -22,6 +23,7 @@ const start = async () => {
 // Graceful shutdown
 process.on('SIGTERM', () => {
   logger.info('SIGTERM received. Shutting down gracefully…');
+  optimizerPool.shutdown();
   process.exit(0);
 });
 
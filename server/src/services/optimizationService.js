@@ -1,4 +1,5 @@
 const { spawn } = require('child_process');
+const crypto = require('crypto');
 const path = require('path');
 const config = require('../config/env');
 const logger = require('../utils/logger');
@@ -6,16 +7,119 @@ const experimentService = require('./experimentService');
 const resultService = require('./resultService');
 const simulationService = require('./simulationService');
 const progressEmitter = require('./progressEmitter');
+const optimizerPool = require('./optimizerPool');
+const { decodeResult } = require('../utils/packedResult');
+
+// Optimizer workload-store ids keyed by the content of the task / VM lists
+const storedWorkloads = new Map();
+const STORED_WORKLOADS_MAX = 500;
+
+const toPlain = (doc) => (doc && typeof doc.toObject === 'function' ? doc.toObject() : doc);
+
+const workloadKey = (workloadConfig, vmConfig) =>
+  crypto
+    .createHash('sha1')
+    .update(JSON.stringify([workloadConfig.tasks || [], vmConfig.vms || []]))
+    .digest('hex');
+
+const rememberWorkload = (key, workloadId) => {
+  if (!workloadId) return;
+  storedWorkloads.delete(key);
+  storedWorkloads.set(key, workloadId);
+  if (storedWorkloads.size > STORED_WORKLOADS_MAX) {
+    storedWorkloads.delete(storedWorkloads.keys().next().value);
+  }
+};
+
+/**
+ * Send one payload to the warm worker pool (OPTIMIZER_WORKERS > 0) or
+ * a dedicated process, decoding packed schedule / convergence blocks
+ * back to arrays of plain objects.
+ */
+const dispatch = (experiment, payload) => {
+  if (config.optimizerWorkers > 0) {
+    logger.info('Dispatching to optimizer worker pool', {
+      experimentId: experiment._id,
+      algorithm: experiment.algorithm,
+    });
+    return optimizerPool.run(payload).then(decodeResult);
+  }
+  return spawnOptimizer(experiment, JSON.stringify(payload)).then(decodeResult);
+};
+
+/**
+ * Run the Python optimizer for one experiment.
+ *
+ * Task / VM lists are stored by the optimizer on first use; later runs
+ * on the same workload send only its `workloadId`, falling back to the
+ * full lists if the optimizer has evicted it.
+ *
+ * Every run asks for a stored checkpoint: the optimizer keeps the search
+ * state on disk and returns only the best schedule and a `checkpointId`,
+ * which is all the result document holds.  An experiment with
+ * `resumeFrom` resumes from the checkpoint of that experiment's result,
+ * if any (from its best schedule alone once the optimizer has evicted
+ * the state).
+ *
+ * @param {object} experiment — full Mongoose experiment document
+ * @returns {Promise<object>} — parsed result from Python
+ */
+const runOptimizer = async (experiment) => {
+  const workloadConfig = toPlain(experiment.workloadConfig) || {};
+  const vmConfig = toPlain(experiment.vmConfig) || {};
+  const payload = {
+    experimentId: experiment._id.toString(),
+    algorithm: experiment.algorithm,
+    workloadConfig,
+    vmConfig,
+    hyperparameters: experiment.hyperparameters,
+    seed: config.defaultSeed,
+    outputFormat: config.optimizerOutputFormat,
+    checkpoint: 'store',
+  };
+
+  if (experiment.resumeFrom) {
+    const checkpoint = await resultService.getCheckpoint(experiment.resumeFrom);
+    if (checkpoint) payload.resumeFrom = checkpoint;
+  }
+
+  if (!workloadConfig.tasks?.length || !vmConfig.vms?.length) {
+    return dispatch(experiment, payload);
+  }
+
+  const key = workloadKey(workloadConfig, vmConfig);
+  const workloadId = storedWorkloads.get(key);
+  if (workloadId) {
+    try {
+      return await dispatch(experiment, {
+        ...payload,
+        workloadConfig: { ...workloadConfig, tasks: [], workloadId },
+        vmConfig: { ...vmConfig, vms: [] },
+      });
+    } catch (err) {
+      if (!err.message.includes('Unknown workloadId')) throw err;
+      storedWorkloads.delete(key);
+      logger.info('Stored workload evicted, resending task list', {
+        experimentId: experiment._id,
+      });
+    }
+  }
+
+  const result = await dispatch(experiment, { ...payload, storeWorkload: true });
+  rememberWorkload(key, result.workloadId);
+  return result;
+};
 
 /**
- * Run the Python optimizer as a child process.
+ * Run the Python optimizer as a dedicated child process.
  * Sends experiment config via stdin JSON, reads result from stdout JSON.
  * Parses stderr for PROGRESS: lines and emits them via progressEmitter.
  *
  * @param {object} experiment — full Mongoose experiment document
+ * @param {string} payload — serialized experiment config
  * @returns {Promise<object>} — parsed result from Python
  */
-const runOptimizer = (experiment) => {
+const spawnOptimizer = (experiment, payload) => {
   return new Promise((resolve, reject) => {
     const pythonPath = config.pythonPath || 'python3';
     const scriptPath = path.resolve(
@@ -23,15 +127,6 @@ const runOptimizer = (experiment) => {
       '..', '..', '..', 'optimizer', 'main.py'
     );
 
-    const payload = JSON.stringify({
-      experimentId: experiment._id.toString(),
-      algorithm: experiment.algorithm,
-      workloadConfig: experiment.workloadConfig,
-      vmConfig: experiment.vmConfig,
-      hyperparameters: experiment.hyperparameters,
-      seed: config.defaultSeed,
-    });
-
     logger.info('Starting optimizer process', {
       experimentId: experiment._id,
       algorithm: experiment.algorithm,
@@ -197,6 +292,8 @@ const runExperiment = async (experiment) => {
       schedule: finalSchedule,
       rawLogs: rawResult.logs || '',
       executionTime,
+      stopReason: rawResult.stopReason,
+      checkpoint: rawResult.checkpoint,
     });
 
     await experimentService.updateStatus(experiment._id, 'completed');
@@ -0,0 +1,158 @@
+const { spawn } = require('child_process');
+const path = require('path');
+const config = require('../config/env');
+const logger = require('../utils/logger');
+const progressEmitter = require('./progressEmitter');
+
+const OPTIMIZER_DIR = path.resolve(__dirname, '..', '..', '..', 'optimizer');
+
+/**
+ * Pool of warm Python optimizer workers (`main.py --worker`).
+ *
+ * Each worker keeps the interpreter and NumPy loaded and serves one
+ * experiment at a time over newline-delimited JSON:
+ *   stdin  ← one experiment config per line
+ *   stdout → { type: 'ready' | 'result' | 'error', experimentId, ... }
+ *   stderr → PROGRESS: lines tagged with experimentId
+ *
+ * Workers are spawned lazily, restarted when they exit, and jobs queue
+ * while every worker is busy.
+ */
+class OptimizerPool {
+  constructor(size) {
+    this.size = size;
+    this.workers = [];
+    this.queue = [];
+    this.closed = false;
+  }
+
+  /**
+   * Run one experiment payload on the next free worker.
+   * @param {object} payload — experiment config sent to the optimizer
+   * @returns {Promise<object>} — parsed result from Python
+   */
+  run(payload) {
+    return new Promise((resolve, reject) => {
+      this.queue.push({ payload, resolve, reject });
+      this._ensureWorkers();
+      this._dispatch();
+    });
+  }
+
+  /** Stop all workers; queued jobs are rejected. */
+  shutdown() {
+    this.closed = true;
+    for (const job of this.queue.splice(0)) {
+      job.reject(new Error('Optimizer pool shut down'));
+    }
+    for (const worker of this.workers) {
+      worker.proc.stdin.end();
+    }
+  }
+
+  _ensureWorkers() {
+    while (!this.closed && this.workers.length < this.size) {
+      this.workers.push(this._spawnWorker());
+    }
+  }
+
+  _spawnWorker() {
+    const pythonPath = config.pythonPath || 'python3';
+    const proc = spawn(pythonPath, [path.join(OPTIMIZER_DIR, 'main.py'), '--worker'], {
+      stdio: ['pipe', 'pipe', 'pipe'],
+      cwd: OPTIMIZER_DIR,
+    });
+    const worker = { proc, ready: false, job: null, stdoutBuf: '', stderrBuf: '' };
+
+    proc.stdout.on('data', (data) => {
+      worker.stdoutBuf += data.toString();
+      const lines = worker.stdoutBuf.split('\n');
+      worker.stdoutBuf = lines.pop() || '';
+      for (const line of lines) {
+        if (line.trim()) this._onMessage(worker, line);
+      }
+    });
+
+    proc.stderr.on('data', (data) => {
+      worker.stderrBuf += data.toString();
+      const lines = worker.stderrBuf.split('\n');
+      worker.stderrBuf = lines.pop() || '';
+      for (const line of lines) {
+        if (!line.startsWith('PROGRESS:')) continue;
+        try {
+          const progressData = JSON.parse(line.slice('PROGRESS:'.length));
+          const experimentId = progressData.experimentId || worker.job?.payload.experimentId;
+          if (experimentId) progressEmitter.sendProgress(experimentId, progressData);
+        } catch {
+          // Ignore malformed progress lines
+        }
+      }
+    });
+
+    proc.on('close', (code) => {
+      this.workers = this.workers.filter((w) => w !== worker);
+      if (worker.job) {
+        worker.job.reject(new Error(`Optimizer worker exited with code ${code}`));
+      }
+      if (this.closed) return;
+      if (!worker.ready) {
+        // Never came up (bad PYTHON_PATH, import error): fail fast instead of respawning
+        logger.error('Optimizer worker failed to start', { code });
+        for (const job of this.queue.splice(0)) {
+          job.reject(new Error(`Optimizer worker failed to start (code ${code})`));
+        }
+        return;
+      }
+      logger.warn('Optimizer worker exited', { code });
+      if (this.queue.length > 0) {
+        this._ensureWorkers();
+      }
+    });
+
+    proc.on('error', (err) => {
+      logger.error('Optimizer worker error', err);
+    });
+
+    return worker;
+  }
+
+  _onMessage(worker, line) {
+    let message;
+    try {
+      message = JSON.parse(line);
+    } catch {
+      logger.warn('Unparseable optimizer worker output', { line: line.slice(0, 200) });
+      return;
+    }
+
+    if (message.type === 'ready') {
+      worker.ready = true;
+    } else if (worker.job) {
+      const { job } = worker;
+      worker.job = null;
+      if (message.type === 'result') {
+        job.resolve(message.result);
+      } else {
+        logger.error('Optimizer worker job failed', {
+          experimentId: message.experimentId,
+          error: message.error,
+          traceback: message.traceback,
+        });
+        job.reject(new Error(`Optimizer failed: ${message.error}`));
+      }
+    }
+    this._dispatch();
+  }
+
+  _dispatch() {
+    for (const worker of this.workers) {
+      if (this.queue.length === 0) return;
+      if (!worker.ready || worker.job) continue;
+      worker.job = this.queue.shift();
+      worker.proc.stdin.write(JSON.stringify(worker.job.payload) + '\n');
+    }
+  }
+}
+
+// Singleton sized from OPTIMIZER_WORKERS
+module.exports = new OptimizerPool(config.optimizerWorkers);
@@ -24,6 +24,15 @@ const getByExperimentId = async (experimentId) => {
   return result;
 };
 
+/**
+ * Get the optimizer checkpoint reference stored with an experiment's
+ * result, or null when there is none.
+ */
+const getCheckpoint = async (experimentId) => {
+  const result = await Result.findOne({ experimentId }).select('+checkpoint');
+  return result?.checkpoint ?? null;
+};
+
 /**
  * Get results for multiple experiments (for comparison).
  */
@@ -65,6 +74,7 @@ const exportResult = async (experimentId) => {
 module.exports = {
   save,
   getByExperimentId,
+  getCheckpoint,
   getByExperimentIds,
   removeByExperimentId,
   exportResult,
@@ -0,0 +1,86 @@
+/**
+ * Decoder for the optimizer's packed result encoding
+ * (`outputFormat: 'packed'`, see optimizer/algorithms/packed.py).
+ *
+ * A packed block looks like
+ *   { format: 'packed', length, columns: { name: { dtype, data } } }
+ * where `data` is base64 of a little-endian int32 / float32 / float64
+ * array.
+ */
+
+const TYPED_ARRAYS = {
+  int32: Int32Array,
+  float32: Float32Array,
+  float64: Float64Array,
+};
+
+const isPacked = (value) => value != null && value.format === 'packed';
+
+/**
+ * Decode one column into a typed array (assumes a little-endian host,
+ * which covers every platform Node ships for).
+ */
+const decodeColumn = ({ dtype, data }) => {
+  const TypedArray = TYPED_ARRAYS[dtype];
+  if (!TypedArray) throw new Error(`Unsupported packed dtype: ${dtype}`);
+  const buf = Buffer.from(data, 'base64');
+  // Copy into a fresh, correctly aligned ArrayBuffer
+  const bytes = new Uint8Array(buf.byteLength);
+  bytes.set(buf);
+  return new TypedArray(bytes.buffer);
+};
+
+/**
+ * Decode a packed block into `{ name: TypedArray }`.
+ */
+const decodeColumns = (block) => {
+  const columns = {};
+  for (const [name, column] of Object.entries(block.columns)) {
+    columns[name] = decodeColumn(column);
+  }
+  return columns;
+};
+
+const decodeSchedule = (block) => {
+  const { vmId } = decodeColumns(block);
+  const schedule = new Array(block.length);
+  for (let i = 0; i < block.length; i += 1) {
+    schedule[i] = { taskId: i, vmId: vmId[i], startTime: 0, endTime: 0 };
+  }
+  return schedule;
+};
+
+const decodeConvergence = (block) => {
+  const { iteration, bestFitness, makespan, energy } = decodeColumns(block);
+  const points = new Array(block.length);
+  for (let i = 0; i < block.length; i += 1) {
+    points[i] = {
+      iteration: iteration[i],
+      bestFitness: bestFitness[i],
+      makespan: makespan[i],
+      energy: energy[i],
+    };
+  }
+  return points;
+};
+
+/**
+ * Return `result` with packed schedule / convergenceData blocks expanded
+ * to the plain JSON shape; plain results pass through unchanged.
+ * @param {object} result — parsed optimizer output
+ * @returns {object}
+ */
+const decodeResult = (result) => {
+  if (!isPacked(result.schedule) && !isPacked(result.convergenceData)) {
+    return result;
+  }
+  return {
+    ...result,
+    schedule: isPacked(result.schedule) ? decodeSchedule(result.schedule) : result.schedule,
+    convergenceData: isPacked(result.convergenceData)
+      ? decodeConvergence(result.convergenceData)
+      : result.convergenceData,
+  };
+};
+
+module.exports = { decodeResult };